@@ -137,10 +137,13 @@ def ls(
     """Get the list of ApiKeys."""
     from airt.client import APIKey
 
-    response = APIKey.ls(
-        user=user, offset=offset, limit=limit, include_disabled=include_disabled
+    df: pd.DataFrame = APIKey.ls(
+        user=user,
+        offset=offset,
+        limit=limit,
+        include_disabled=include_disabled,
+        as_frame=True,
     )
-    df = APIKey.as_df(response)
 
     df["created"] = helper.humanize_date(df["created"])
     df["expiry"] = helper.humanize_date(df["expiry"])
@@ -8,11 +8,11 @@ import logging
 from typing import *
 
 # %% ../../notebooks/CLI.ipynb 4
+import importlib
+
 import typer
+from typer.core import TyperGroup
 
-from airt._cli import api_key, db, ds, model, pred, user
-from airt._cli.token import token
-from airt._cli.version import version
 from airt._logger import get_logger, set_level
 
 # %% ../../notebooks/CLI.ipynb 6
@@ -21,61 +21,84 @@ logger = get_logger(__name__)
 set_level(logging.WARNING)
 
 # %% ../../notebooks/CLI.ipynb 8
-app = typer.Typer(help="airt CLI for accessing airt services.")
+class _LazyGroup(TyperGroup):
+    """A command group importing the modules of its subcommands only when they are used.
 
-# %% ../../notebooks/CLI.ipynb 10
-# token as root command
-app.command()(token)
+    The subcommand modules import pandas, tabulate and `airt.client`, which takes most of the startup time of
+    the CLI, so only the module of the invoked subcommand is imported. The subcommands are registered in
+    `lazy_subcommands` by their names as "module:attribute" references to either a `typer.Typer` instance or a
+    command function, in the order in which they would be registered eagerly.
+    """
 
-# %% ../../notebooks/CLI.ipynb 11
-# Datasource root command
+    lazy_subcommands: Dict[str, str] = {}
+
+    def list_commands(self, ctx: Any) -> List[str]:
+        # list the subcommands in the same order as the base group lists the eagerly registered ones
+        commands = self.commands
+        self.commands = {**dict.fromkeys(self.lazy_subcommands), **commands}
+        try:
+            return super().list_commands(ctx)
+        finally:
+            self.commands = commands
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Optional[Any]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+            subcommand = getattr(importlib.import_module(module_name), attr)
+
+            # register the subcommand exactly as it would be registered eagerly
+            sub_app = typer.Typer()
+            if isinstance(subcommand, typer.Typer):
+                sub_app.add_typer(subcommand, name=cmd_name)
+            else:
+                sub_app.command(name=cmd_name)(subcommand)
+            self.commands[cmd_name] = typer.main.get_group(sub_app).commands[cmd_name]
 
-app.add_typer(
-    ds.app,
-    name="ds",
-)
+        return super().get_command(ctx, cmd_name)
+
+# %% ../../notebooks/CLI.ipynb 9
+app = typer.Typer(cls=_LazyGroup, help="airt CLI for accessing airt services.")
+
+
+@app.callback()
+def _main() -> None:
+    pass
+
+# %% ../../notebooks/CLI.ipynb 11
+# token as root command
+_LazyGroup.lazy_subcommands["token"] = "airt._cli.token:token"
 
 # %% ../../notebooks/CLI.ipynb 12
-# Datablob root command
+# version root command
 
-app.add_typer(
-    db.app,
-    name="db",
-)
+_LazyGroup.lazy_subcommands["version"] = "airt._cli.version:version"
 
 # %% ../../notebooks/CLI.ipynb 13
-# Model root command
+# Datasource root command
 
-app.add_typer(
-    model.app,
-    name="model",
-)
+_LazyGroup.lazy_subcommands["ds"] = "airt._cli.ds:app"
 
 # %% ../../notebooks/CLI.ipynb 14
-# Pred root command
+# Datablob root command
 
-app.add_typer(
-    pred.app,
-    name="pred",
-)
+_LazyGroup.lazy_subcommands["db"] = "airt._cli.db:app"
 
 # %% ../../notebooks/CLI.ipynb 15
-# User root command
+# Model root command
 
-app.add_typer(
-    user.app,
-    name="user",
-)
+_LazyGroup.lazy_subcommands["model"] = "airt._cli.model:app"
 
 # %% ../../notebooks/CLI.ipynb 16
-# API Keys root command
+# Pred root command
 
-app.add_typer(
-    api_key.app,
-    name="api-key",
-)
+_LazyGroup.lazy_subcommands["pred"] = "airt._cli.pred:app"
 
 # %% ../../notebooks/CLI.ipynb 17
-# version root command
+# User root command
+
+_LazyGroup.lazy_subcommands["user"] = "airt._cli.user:app"
+
+# %% ../../notebooks/CLI.ipynb 18
+# API Keys root command
 
-app.command()(version)
+_LazyGroup.lazy_subcommands["api-key"] = "airt._cli.api_key:app"
@@ -425,12 +425,14 @@ def ls(
 
     from airt.client import DataBlob
 
-    dbx = DataBlob.ls(
-        offset=offset, limit=limit, disabled=disabled, completed=completed
+    df: pd.DataFrame = DataBlob.ls(
+        offset=offset,
+        limit=limit,
+        disabled=disabled,
+        completed=completed,
+        as_frame=True,
     )
 
-    df = DataBlob.as_df(dbx)
-
     df["pulled_on"] = helper.humanize_date(df["pulled_on"])
     df["folder_size"] = helper.humanize_size(df["folder_size"])
 
@@ -135,10 +135,13 @@ def ls(
 
     from airt.client import DataSource
 
-    dsx = DataSource.ls(
-        offset=offset, limit=limit, disabled=disabled, completed=completed
+    df: pd.DataFrame = DataSource.ls(
+        offset=offset,
+        limit=limit,
+        disabled=disabled,
+        completed=completed,
+        as_frame=True,
     )
-    df = DataSource.as_df(dsx)
 
     df["pulled_on"] = helper.humanize_date(df["pulled_on"])
     df["no_of_rows"] = helper.humanize_number(df["no_of_rows"])
@@ -79,9 +79,13 @@ def ls(
 
     from airt.client import Model
 
-    mx = Model.ls(offset=offset, limit=limit, disabled=disabled, completed=completed)
-
-    df = Model.as_df(mx)
+    df: pd.DataFrame = Model.ls(
+        offset=offset,
+        limit=limit,
+        disabled=disabled,
+        completed=completed,
+        as_frame=True,
+    )
 
     df["created"] = helper.humanize_date(df["created"])
 
@@ -80,12 +80,14 @@ def ls(
 
     from airt.client import Prediction
 
-    predx = Prediction.ls(
-        offset=offset, limit=limit, disabled=disabled, completed=completed
+    df: pd.DataFrame = Prediction.ls(
+        offset=offset,
+        limit=limit,
+        disabled=disabled,
+        completed=completed,
+        as_frame=True,
     )
 
-    df = Prediction.as_df(predx)
-
     df["created"] = helper.humanize_date(df["created"])
 
     return {"df": df, "quite_column_name": "prediction_uuid"}
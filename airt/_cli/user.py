@@ -211,9 +211,9 @@ def ls(
 
     from airt.client import User
 
-    ux = User.ls(offset=offset, limit=limit, disabled=disabled)
-
-    df = User.as_df(ux)
+    df: pd.DataFrame = User.ls(
+        offset=offset, limit=limit, disabled=disabled, as_frame=True
+    )
 
     df["created"] = helper.humanize_date(df["created"])
 
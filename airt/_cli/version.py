@@ -9,12 +9,11 @@ from typing import *
 # %% ../../notebooks/CLI_Version.ipynb 4
 import logging
 
-import pandas as pd
 import typer
 from tabulate import tabulate
 
+from airt._components.client import Client
 from airt._logger import get_logger, set_level
-from airt.client import Client
 
 # %% ../../notebooks/CLI_Version.ipynb 6
 app = typer.Typer()
@@ -26,9 +25,9 @@ logger = get_logger(__name__)
 def version() -> None:
     """Return the server and client versions."""
     try:
-        df = pd.Series(Client.version(), name="Version").to_frame()
+        versions = list(Client.version().items())
 
-        typer.echo(tabulate(df, headers="keys", tablefmt="plain"))  # type: ignore
+        typer.echo(tabulate(versions, headers=["", "Version"], tablefmt="plain"))
 
     except Exception as e:
         typer.echo(message=f"Error: {e}", err=True)
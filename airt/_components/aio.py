@@ -0,0 +1,1049 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../notebooks/API_Aio.ipynb.
+
+# %% auto 0
+__all__ = ['AsyncClient', 'ProgressStatus', 'Prediction', 'Model', 'DataSource', 'DataBlob']
+
+# %% ../../notebooks/API_Aio.ipynb 3
+from typing import *
+
+# %% ../../notebooks/API_Aio.ipynb 4
+import asyncio
+import functools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from airt._components.client import Client
+from airt._components.datablob import DataBlob as _DataBlob
+from airt._components.datasource import DataSource as _DataSource
+from airt._components.model import Model as _Model
+from airt._components.prediction import Prediction as _Prediction
+from airt._components.progress_status import (
+    PollingStrategy,
+    _get_polling_strategy,
+    _next_poll_delay,
+    _record_polling_metrics,
+)
+from airt._logger import get_logger, set_level
+
+# %% ../../notebooks/API_Aio.ipynb 6
+logger = get_logger(__name__)
+
+# %% ../../notebooks/API_Aio.ipynb 9
+class AsyncClient:
+    """A class for accessing the airt service from asyncio code.
+
+    The `AsyncClient` class shares the server address and the token with the `Client` class, so you can
+    authenticate with either of them. The requests to the server are sent through the pooled session of the
+    `Client` class by a small pool of worker threads, while waiting for the remote operations to complete happens
+    in the event loop itself. Because of that, a single event loop can drive hundreds of datablobs, datasources,
+    models and predictions concurrently without a sleeping thread for each of them.
+
+    The size of the worker pool is the same as the **pool_maxsize** set by `Client.configure_session`. The uploads
+    and downloads of files, such as `DataBlob.from_local` and `Prediction.to_local`, run in a separate pool of the
+    same size, so a few long transfers never hold up the status checks of the other coroutines.
+
+    Here's an example of training models on multiple datasources concurrently:
+
+    Example:
+        ```python
+        # Importing necessary libraries
+        import asyncio
+        from datetime import timedelta
+
+        from  airt.aio import AsyncClient, DataBlob
+
+        async def train(uri):
+            # Create a datablob and wait for the upload to complete
+            db = await DataBlob.from_s3(uri=uri)
+            await db.wait()
+
+            # Create a datasource and wait for the processing to complete
+            ds = await db.to_datasource(
+                file_type="{fill in file_type}",
+                index_column="{fill in index_column}",
+                sort_by="{fill in sort_by}",
+            )
+            await ds.wait()
+
+            # Train a model and wait for the training to complete
+            model = await ds.train(
+                client_column="{fill in client_column}",
+                target_column="{fill in target_column}",
+                target="*purchase",
+                predict_after=timedelta(hours=3),
+            )
+            await model.wait()
+
+            return await model.evaluate()
+
+        async def main():
+            # Authenticate
+            await AsyncClient.get_token(username="{fill in username}", password="{fill in password}")
+
+            # Train the models concurrently
+            evaluations = await asyncio.gather(*[train(uri) for uri in ["{fill in uri}"]])
+            print(evaluations)
+
+            # Close the connections once you are done
+            AsyncClient.close()
+
+        asyncio.run(main())
+        ```
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _transfer_executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    @classmethod
+    async def get_token(
+        cls,
+        *,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        server: Optional[str] = None,
+        sso_provider: Optional[str] = None,
+        otp: Optional[str] = None,
+    ) -> Optional[str]:
+        """Get application token for airt service from a username/password pair.
+
+        Please check the documentation of `Client.get_token` for the details.
+
+        Args:
+            username: Username for the developer account. If None (default value), then the value from
+                **AIRT_SERVICE_USERNAME** environment variable is used.
+            password: Password for the developer account. If None (default value), then the value from
+                **AIRT_SERVICE_PASSWORD** environment variable is used.
+            server: The airt server uri. If None (default value), then the value from **AIRT_SERVER_URL** environment variable
+                is used. If the variable is not set as well, then the default public server will be used.
+            sso_provider: Name of the Single sign-on (SSO) provider.
+            otp: Dynamically generated six-digit verification code from the authenticator app or the OTP you have received via SMS.
+
+        Returns:
+            The authorization url if the token is requested using Single sign-on (SSO).
+
+        Raises:
+            ValueError: If the username/password pair does not match.
+            ConnectionError: If the server address is invalid or not reachable.
+            KeyError: If username/password is neither passed as parameters nor stored in environment variables.
+        """
+        return await cls._run(
+            Client.get_token,
+            username=username,
+            password=password,
+            server=server,
+            sso_provider=sso_provider,
+            otp=otp,
+        )
+
+    @staticmethod
+    def set_token(token: Optional[str] = None, server: Optional[str] = None):
+        """Set application token for airt service.
+
+        Please check the documentation of `Client.set_token` for the details.
+
+        Args:
+            token: The application token obtained by calling the `get_token` method, or an APIKey obtained by calling
+                the `APIKey.create` method. If None (default value), then the value from **AIRT_SERVICE_TOKEN** environment variable is used.
+            server: The airt server uri. If None (default value), then the value from **AIRT_SERVER_URL** environment variable
+                is used. If the variable is not set as well, then the default public server will be used.
+        """
+        Client.set_token(token=token, server=server)
+
+    @classmethod
+    async def version(cls) -> dict:
+        """Return the client and server versions.
+
+        Returns:
+            A dict containing the client and server versions.
+
+        Raises:
+            ConnectionError: If the server address is invalid or not reachable.
+        """
+        return await cls._run(Client.version)
+
+    @classmethod
+    def close(cls):
+        """Shut down the worker threads and close the pooled HTTP session.
+
+        Both will be created again automatically on the next request to the server.
+        """
+        with cls._executor_lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=True)
+                cls._executor = None
+            if cls._transfer_executor is not None:
+                cls._transfer_executor.shutdown(wait=True)
+                cls._transfer_executor = None
+
+        Client.close_session()
+
+    @classmethod
+    def _get_executor(cls, transfer: bool = False) -> ThreadPoolExecutor:
+        """Return the pool of worker threads sending the requests, creating it if necessary.
+
+        Args:
+            transfer: If set to **True**, the pool running the uploads and downloads of files is returned instead.
+
+        Returns:
+            The executor shared by all the requests to the server, or by all the transfers.
+        """
+        with cls._executor_lock:
+            if transfer:
+                if cls._transfer_executor is None:
+                    cls._transfer_executor = ThreadPoolExecutor(
+                        max_workers=Client._session_config["pool_maxsize"],
+                        thread_name_prefix="airt-aio-transfer",
+                    )
+
+                return cls._transfer_executor
+
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=Client._session_config["pool_maxsize"],
+                    thread_name_prefix="airt-aio",
+                )
+
+            return cls._executor
+
+    @classmethod
+    async def _run(cls, f: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking call in the worker pool without blocking the event loop.
+
+        Args:
+            f: The function to call.
+            args: The positional arguments to pass to the function.
+            kwargs: The keyword arguments to pass to the function.
+
+        Returns:
+            The return value of the function.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            cls._get_executor(), functools.partial(f, *args, **kwargs)
+        )
+
+    @classmethod
+    async def _run_transfer(
+        cls, f: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run a blocking upload or download of files in the transfer pool without blocking the event loop.
+
+        Args:
+            f: The function to call.
+            args: The positional arguments to pass to the function.
+            kwargs: The keyword arguments to pass to the function.
+
+        Returns:
+            The return value of the function.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            cls._get_executor(transfer=True), functools.partial(f, *args, **kwargs)
+        )
+
+    @classmethod
+    async def _post_data(
+        cls,
+        relative_url: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make a POST request.
+
+        Please check the documentation of `Client._post_data` for the details.
+        """
+        return await cls._run(
+            Client._post_data, relative_url=relative_url, data=data, json=json
+        )
+
+    @classmethod
+    async def _get_data(
+        cls, relative_url: str, accept: Optional[str] = None, cache: bool = False
+    ) -> Any:
+        """Make a GET request.
+
+        Please check the documentation of `Client._get_data` for the details.
+        """
+        return await cls._run(
+            Client._get_data, relative_url=relative_url, accept=accept, cache=cache
+        )
+
+    @classmethod
+    async def _delete_data(cls, relative_url: str) -> Dict[str, Any]:
+        """Make a DELETE request.
+
+        Please check the documentation of `Client._delete_data` for the details.
+        """
+        return await cls._run(Client._delete_data, relative_url=relative_url)
+
+# %% ../../notebooks/API_Aio.ipynb 12
+class ProgressStatus:
+    """A class for awaiting the status of a remote operation.
+
+    The instances of this class are returned by the `Prediction.to_s3`, `Prediction.to_azure_blob_storage`,
+    `Prediction.to_mysql` and `Prediction.to_clickhouse` methods.
+    """
+
+    def __init__(
+        self,
+        relative_url: str,
+        sleep_for: Union[int, float] = 5,
+        timeout: int = 0,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ):
+        """Constructs a new ProgressStatus instance.
+
+        Args:
+            relative_url: Relative URI to query the status of the remote operation.
+            sleep_for: The time interval in seconds between successive API calls.
+            timeout: The maximum time allowed in seconds for the asynchronous call to complete. If not the
+                wait will be terminated.
+            polling_strategy: The strategy deciding the time interval between successive API calls. If not
+                passed, the default polling strategy is used if set, else the **sleep_for** interval.
+        """
+        self.relative_url = relative_url
+        self.sleep_for = sleep_for
+        self.timeout = timeout
+        self.polling_strategy = polling_strategy
+
+    async def _get_status(self) -> Dict[str, Any]:
+        """Query the status of the remote operation and add the API call to the polling metrics."""
+        response = await AsyncClient._get_data(relative_url=self.relative_url)
+        _record_polling_metrics(polls=1)
+        return response
+
+    async def is_ready(self) -> bool:
+        """Check if the method's progress is complete.
+
+        Returns:
+            **True** if the progress is completed, else **False**.
+
+        Raises:
+            ConnectionError: If the server address is invalid or not reachable.
+        """
+        response = await self._get_status()
+        return response["completed_steps"] == response["total_steps"]
+
+    async def wait(self):
+        """Wait for the remote action to complete without blocking the event loop.
+
+        Raises:
+            ConnectionError: If the server address is invalid or not reachable.
+            TimeoutError: in case of timeout.
+        """
+        polling_strategy = _get_polling_strategy(self.polling_strategy, self.sleep_for)
+        started_at = datetime.now()
+        started_steps = None
+        attempt = 0
+        while True:
+            if (0 < self.timeout) and (datetime.now() - started_at) > timedelta(
+                seconds=self.timeout
+            ):
+                raise TimeoutError()
+
+            response = await self._get_status()
+            completed_steps, total_steps = (
+                response["completed_steps"],
+                response["total_steps"],
+            )
+            if completed_steps == total_steps:
+                return
+
+            if started_steps is None:
+                started_steps = completed_steps
+
+            await asyncio.sleep(
+                _next_poll_delay(
+                    polling_strategy,
+                    attempt=attempt,
+                    started_at=started_at,
+                    timeout=self.timeout,
+                    progressed_steps=completed_steps - started_steps,
+                    remaining_steps=total_steps - completed_steps,
+                )
+            )
+            attempt += 1
+
+# %% ../../notebooks/API_Aio.ipynb 13
+class _AsyncResource:
+    """A base class wrapping an instance of the corresponding class from `airt.client`.
+
+    The attributes of the wrapped instance, e.g. **uuid**, can be accessed directly on the wrapper.
+    """
+
+    def __init__(self, sync: Any):
+        self._sync = sync
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_sync":
+            raise AttributeError(name)
+        return getattr(self._sync, name)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(uuid={self._sync.uuid!r})"
+
+    @staticmethod
+    async def _iter_pages(
+        ls: Callable[..., Awaitable[List[Any]]],
+        page_size: int,
+        prefetch: int,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the items of all pages returned by the **ls** coroutine of a resource.
+
+        The next **prefetch** pages are requested concurrently while the items of the current page are being consumed.
+        """
+
+        def fetch_page(page_no: int) -> "asyncio.Future[List[Any]]":
+            return asyncio.ensure_future(
+                ls(offset=page_no * page_size, limit=page_size, **kwargs)
+            )
+
+        pages = deque(fetch_page(page_no) for page_no in range(prefetch + 1))
+        next_page_no = prefetch + 1
+        try:
+            while True:
+                page = await pages.popleft()
+                is_last = len(page) < page_size
+                if prefetch and not is_last:
+                    pages.append(fetch_page(next_page_no))
+                    next_page_no += 1
+
+                for item in page:
+                    yield item
+
+                if is_last:
+                    return
+
+                if not prefetch:
+                    pages.append(fetch_page(next_page_no))
+                    next_page_no += 1
+        finally:
+            # the pages requested after the last one or after the iteration is stopped are discarded
+            for page_task in pages:
+                page_task.cancel()
+
+    async def _wait(
+        self,
+        relative_url: str,
+        sleep_for: Union[int, float],
+        timeout: int,
+        polling_strategy: Optional[PollingStrategy],
+    ):
+        await ProgressStatus(
+            relative_url=relative_url,
+            sleep_for=sleep_for,
+            timeout=timeout,
+            polling_strategy=polling_strategy,
+        ).wait()
+
+# %% ../../notebooks/API_Aio.ipynb 14
+class Prediction(_AsyncResource):
+    """An asyncio counterpart of `airt.client.Prediction`.
+
+    Please check the documentation of `airt.client.Prediction` for the details of each method.
+    """
+
+    @staticmethod
+    async def ls(
+        offset: int = 0,
+        limit: int = 100,
+        disabled: bool = False,
+        completed: bool = False,
+        as_frame: bool = False,
+    ) -> Union[List["Prediction"], pd.DataFrame]:
+        """Return the list of Prediction instances, or a dataframe of their details if **as_frame** is set."""
+        predx = await AsyncClient._run(
+            _Prediction.ls,
+            offset=offset,
+            limit=limit,
+            disabled=disabled,
+            completed=completed,
+            as_frame=as_frame,
+        )
+        if as_frame:
+            return predx
+        return [Prediction(pred) for pred in predx]
+
+    @staticmethod
+    async def iter_all(
+        page_size: int = 100,
+        disabled: bool = False,
+        completed: bool = False,
+        prefetch: Union[bool, int] = False,
+    ) -> AsyncIterator["Prediction"]:
+        """Iterate over all Prediction instances available in the server, requesting them page by page."""
+        async for pred in _AsyncResource._iter_pages(
+            Prediction.ls,
+            page_size,
+            int(prefetch),
+            disabled=disabled,
+            completed=completed,
+        ):
+            yield pred
+
+    @staticmethod
+    def as_df(predx: List["Prediction"]) -> pd.DataFrame:
+        """Return the details of prediction instances as a pandas dataframe."""
+        return _Prediction.as_df([pred._sync for pred in predx])
+
+    async def is_ready(self) -> bool:
+        """Check if the prediction is complete."""
+        return await ProgressStatus(relative_url=self._sync.relative_url).is_ready()
+
+    async def wait(
+        self,
+        sleep_for: Union[int, float] = 5,
+        timeout: int = 0,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ):
+        """Wait for the prediction to complete without blocking the event loop."""
+        await self._wait(self._sync.relative_url, sleep_for, timeout, polling_strategy)
+
+    async def details(self) -> pd.DataFrame:
+        """Return the details of a prediction."""
+        return await AsyncClient._run(self._sync.details)
+
+    async def delete(self) -> pd.DataFrame:
+        """Delete a prediction from the server."""
+        return await AsyncClient._run(self._sync.delete)
+
+    async def to_pandas(self) -> pd.DataFrame:
+        """Return the prediction results as a pandas DataFrame."""
+        return await AsyncClient._run_transfer(self._sync.to_pandas)
+
+    async def iter_batches(
+        self, batch_size: int = 100_000, as_arrow: bool = False
+    ) -> AsyncIterator[Any]:
+        """Iterate over the prediction results in batches without blocking the event loop."""
+        batches = self._sync.iter_batches(batch_size=batch_size, as_arrow=as_arrow)
+        try:
+            while True:
+                batch = await AsyncClient._run_transfer(next, batches, None)
+                if batch is None:
+                    return
+                yield batch
+        finally:
+            await AsyncClient._run_transfer(batches.close)
+
+    async def top_k(self, k: int, batch_size: int = 100_000) -> pd.DataFrame:
+        """Return the predictions with the k highest scores."""
+        return await AsyncClient._run_transfer(
+            self._sync.top_k, k=k, batch_size=batch_size
+        )
+
+    async def above(self, score: float, batch_size: int = 100_000) -> pd.DataFrame:
+        """Return the predictions with a score higher than the threshold."""
+        return await AsyncClient._run_transfer(
+            self._sync.above, score=score, batch_size=batch_size
+        )
+
+    async def to_local(
+        self,
+        path: Union[str, Path],
+        show_progress: Optional[bool] = True,
+        max_workers: int = 4,
+        verify_checksum: bool = False,
+    ) -> None:
+        """Download the prediction results to a local directory."""
+        await AsyncClient._run_transfer(
+            self._sync.to_local,
+            path=path,
+            show_progress=show_progress,
+            max_workers=max_workers,
+            verify_checksum=verify_checksum,
+        )
+
+    async def to_s3(
+        self,
+        uri: str,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+    ) -> ProgressStatus:
+        """Push the prediction results to the target AWS S3 bucket."""
+        status = await AsyncClient._run(
+            self._sync.to_s3, uri=uri, access_key=access_key, secret_key=secret_key
+        )
+        return ProgressStatus(relative_url=status.relative_url)
+
+    async def to_azure_blob_storage(self, uri: str, credential: str) -> ProgressStatus:
+        """Push the prediction results to the target Azure Blob Storage."""
+        status = await AsyncClient._run(
+            self._sync.to_azure_blob_storage, uri=uri, credential=credential
+        )
+        return ProgressStatus(relative_url=status.relative_url)
+
+    async def to_mysql(
+        self,
+        *,
+        host: str,
+        database: str,
+        table: str,
+        port: int = 3306,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> ProgressStatus:
+        """Push the prediction results to a mysql database."""
+        status = await AsyncClient._run(
+            self._sync.to_mysql,
+            host=host,
+            database=database,
+            table=table,
+            port=port,
+            username=username,
+            password=password,
+        )
+        return ProgressStatus(relative_url=status.relative_url)
+
+    async def to_clickhouse(
+        self,
+        *,
+        host: str,
+        database: str,
+        table: str,
+        protocol: str,
+        port: int = 0,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> ProgressStatus:
+        """Push the prediction results to a clickhouse database."""
+        status = await AsyncClient._run(
+            self._sync.to_clickhouse,
+            host=host,
+            database=database,
+            table=table,
+            protocol=protocol,
+            port=port,
+            username=username,
+            password=password,
+        )
+        return ProgressStatus(relative_url=status.relative_url)
+
+# %% ../../notebooks/API_Aio.ipynb 15
+class Model(_AsyncResource):
+    """An asyncio counterpart of `airt.client.Model`.
+
+    Please check the documentation of `airt.client.Model` for the details of each method.
+    """
+
+    @staticmethod
+    async def ls(
+        offset: int = 0,
+        limit: int = 100,
+        disabled: bool = False,
+        completed: bool = False,
+        as_frame: bool = False,
+    ) -> Union[List["Model"], pd.DataFrame]:
+        """Return the list of Model instances, or a dataframe of their details if **as_frame** is set."""
+        mx = await AsyncClient._run(
+            _Model.ls,
+            offset=offset,
+            limit=limit,
+            disabled=disabled,
+            completed=completed,
+            as_frame=as_frame,
+        )
+        if as_frame:
+            return mx
+        return [Model(model) for model in mx]
+
+    @staticmethod
+    async def iter_all(
+        page_size: int = 100,
+        disabled: bool = False,
+        completed: bool = False,
+        prefetch: Union[bool, int] = False,
+    ) -> AsyncIterator["Model"]:
+        """Iterate over all Model instances available in the server, requesting them page by page."""
+        async for model in _AsyncResource._iter_pages(
+            Model.ls,
+            page_size,
+            int(prefetch),
+            disabled=disabled,
+            completed=completed,
+        ):
+            yield model
+
+    @staticmethod
+    def as_df(mx: List["Model"]) -> pd.DataFrame:
+        """Return the details of Model instances as a pandas dataframe."""
+        return _Model.as_df([model._sync for model in mx])
+
+    async def is_ready(self) -> bool:
+        """Check if the model training is complete."""
+        return await ProgressStatus(relative_url=self._sync.relative_url).is_ready()
+
+    async def wait(
+        self,
+        sleep_for: Union[int, float] = 5,
+        timeout: int = 0,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ):
+        """Wait for the model training to complete without blocking the event loop."""
+        await self._wait(self._sync.relative_url, sleep_for, timeout, polling_strategy)
+
+    async def details(self) -> pd.DataFrame:
+        """Return the details of a model."""
+        return await AsyncClient._run(self._sync.details)
+
+    async def delete(self) -> pd.DataFrame:
+        """Delete a model from the server."""
+        return await AsyncClient._run(self._sync.delete)
+
+    async def evaluate(self) -> pd.DataFrame:
+        """Return the evaluation metrics of the trained model."""
+        return await AsyncClient._run(self._sync.evaluate)
+
+    async def predict(self, data_uuid: Optional[int] = 0) -> Prediction:
+        """Run predictions against the trained model."""
+        return Prediction(
+            await AsyncClient._run(self._sync.predict, data_uuid=data_uuid)
+        )
+
+# %% ../../notebooks/API_Aio.ipynb 16
+class DataSource(_AsyncResource):
+    """An asyncio counterpart of `airt.client.DataSource`.
+
+    Please check the documentation of `airt.client.DataSource` for the details of each method.
+    """
+
+    @staticmethod
+    async def ls(
+        offset: int = 0,
+        limit: int = 100,
+        disabled: bool = False,
+        completed: bool = False,
+        as_frame: bool = False,
+    ) -> Union[List["DataSource"], pd.DataFrame]:
+        """Return the list of `DataSource` instances, or a dataframe of their details if **as_frame** is set."""
+        dsx = await AsyncClient._run(
+            _DataSource.ls,
+            offset=offset,
+            limit=limit,
+            disabled=disabled,
+            completed=completed,
+            as_frame=as_frame,
+        )
+        if as_frame:
+            return dsx
+        return [DataSource(ds) for ds in dsx]
+
+    @staticmethod
+    async def iter_all(
+        page_size: int = 100,
+        disabled: bool = False,
+        completed: bool = False,
+        prefetch: Union[bool, int] = False,
+    ) -> AsyncIterator["DataSource"]:
+        """Iterate over all DataSource instances available in the server, requesting them page by page."""
+        async for ds in _AsyncResource._iter_pages(
+            DataSource.ls,
+            page_size,
+            int(prefetch),
+            disabled=disabled,
+            completed=completed,
+        ):
+            yield ds
+
+    @staticmethod
+    def as_df(dsx: List["DataSource"]) -> pd.DataFrame:
+        """Return the details of `DataSource` instances as a pandas dataframe."""
+        return _DataSource.as_df([ds._sync for ds in dsx])
+
+    async def dtypes(self) -> pd.DataFrame:
+        """Return the dtypes of the datasource."""
+        return await AsyncClient._run(lambda: self._sync.dtypes)
+
+    async def is_ready(self) -> bool:
+        """Check if the datasource processing is complete."""
+        return await ProgressStatus(
+            relative_url=f"/datasource/{self._sync.uuid}"
+        ).is_ready()
+
+    async def wait(
+        self,
+        sleep_for: Union[int, float] = 1,
+        timeout: int = 0,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ):
+        """Wait for the datasource processing to complete without blocking the event loop."""
+        await self._wait(
+            f"/datasource/{self._sync.uuid}", sleep_for, timeout, polling_strategy
+        )
+
+    async def details(self) -> pd.DataFrame:
+        """Return details of a datasource."""
+        return await AsyncClient._run(self._sync.details)
+
+    async def tag(self, name: str) -> pd.DataFrame:
+        """Tag an existing datasource in server."""
+        return await AsyncClient._run(self._sync.tag, name=name)
+
+    async def delete(self) -> pd.DataFrame:
+        """Delete a datasource from the server."""
+        return await AsyncClient._run(self._sync.delete)
+
+    async def head(self) -> pd.DataFrame:
+        """Return the first few rows of the datasource."""
+        return await AsyncClient._run(self._sync.head)
+
+    async def train(
+        self,
+        *,
+        client_column: str,
+        timestamp_column: Optional[str] = None,
+        target_column: str,
+        target: str,
+        predict_after: timedelta,
+    ) -> Model:
+        """Train a model against the datasource."""
+        model = await AsyncClient._run(
+            self._sync.train,
+            client_column=client_column,
+            timestamp_column=timestamp_column,
+            target_column=target_column,
+            target=target,
+            predict_after=predict_after,
+        )
+        return Model(model)
+
+# %% ../../notebooks/API_Aio.ipynb 17
+class DataBlob(_AsyncResource):
+    """An asyncio counterpart of `airt.client.DataBlob`.
+
+    Please check the documentation of `airt.client.DataBlob` for the details of each method.
+    """
+
+    @staticmethod
+    async def from_s3(
+        *,
+        uri: str,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        cloud_provider: Optional[str] = None,
+        region: Optional[str] = None,
+        tag: Optional[str] = None,
+    ) -> "DataBlob":
+        """Create and return a datablob that encapsulates the data from an AWS S3 bucket."""
+        db = await AsyncClient._run(
+            _DataBlob.from_s3,
+            uri=uri,
+            access_key=access_key,
+            secret_key=secret_key,
+            cloud_provider=cloud_provider,
+            region=region,
+            tag=tag,
+        )
+        return DataBlob(db)
+
+    @staticmethod
+    async def from_azure_blob_storage(
+        uri: str,
+        credential: str,
+        cloud_provider: Optional[str] = None,
+        region: Optional[str] = None,
+        tag: Optional[str] = None,
+    ) -> "DataBlob":
+        """Create and return a datablob that encapsulates the data from an Azure Blob Storage."""
+        db = await AsyncClient._run(
+            _DataBlob.from_azure_blob_storage,
+            uri=uri,
+            credential=credential,
+            cloud_provider=cloud_provider,
+            region=region,
+            tag=tag,
+        )
+        return DataBlob(db)
+
+    @staticmethod
+    async def from_mysql(
+        *,
+        host: str,
+        database: str,
+        table: str,
+        port: int = 3306,
+        cloud_provider: Optional[str] = None,
+        region: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        tag: Optional[str] = None,
+    ) -> "DataBlob":
+        """Create and return a datablob that encapsulates the data from a mysql database."""
+        db = await AsyncClient._run(
+            _DataBlob.from_mysql,
+            host=host,
+            database=database,
+            table=table,
+            port=port,
+            cloud_provider=cloud_provider,
+            region=region,
+            username=username,
+            password=password,
+            tag=tag,
+        )
+        return DataBlob(db)
+
+    @staticmethod
+    async def from_clickhouse(
+        *,
+        host: str,
+        database: str,
+        table: str,
+        protocol: str,
+        index_column: str,
+        timestamp_column: str,
+        port: int = 0,
+        cloud_provider: Optional[str] = None,
+        region: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        tag: Optional[str] = None,
+    ) -> "DataBlob":
+        """Create and return a datablob that encapsulates the data from a ClickHouse database."""
+        db = await AsyncClient._run(
+            _DataBlob.from_clickhouse,
+            host=host,
+            database=database,
+            table=table,
+            protocol=protocol,
+            index_column=index_column,
+            timestamp_column=timestamp_column,
+            port=port,
+            cloud_provider=cloud_provider,
+            region=region,
+            username=username,
+            password=password,
+            filters=filters,
+            tag=tag,
+        )
+        return DataBlob(db)
+
+    @staticmethod
+    async def from_local(
+        path: Union[str, Path],
+        cloud_provider: Optional[str] = None,
+        region: Optional[str] = None,
+        tag: Optional[str] = None,
+        show_progress: Optional[bool] = True,
+        max_workers: int = 4,
+        part_size: Optional[int] = None,
+        manifest_path: Optional[Union[str, Path]] = None,
+    ) -> "DataBlob":
+        """Create and return a datablob from local file."""
+        db = await AsyncClient._run_transfer(
+            _DataBlob.from_local,
+            path=path,
+            cloud_provider=cloud_provider,
+            region=region,
+            tag=tag,
+            show_progress=show_progress,
+            max_workers=max_workers,
+            part_size=part_size,
+            manifest_path=manifest_path,
+        )
+        return DataBlob(db)
+
+    @staticmethod
+    async def ls(
+        offset: int = 0,
+        limit: int = 100,
+        disabled: bool = False,
+        completed: bool = False,
+        as_frame: bool = False,
+    ) -> Union[List["DataBlob"], pd.DataFrame]:
+        """Return the list of DataBlob instances, or a dataframe of their details if **as_frame** is set."""
+        dbx = await AsyncClient._run(
+            _DataBlob.ls,
+            offset=offset,
+            limit=limit,
+            disabled=disabled,
+            completed=completed,
+            as_frame=as_frame,
+        )
+        if as_frame:
+            return dbx
+        return [DataBlob(db) for db in dbx]
+
+    @staticmethod
+    async def iter_all(
+        page_size: int = 100,
+        disabled: bool = False,
+        completed: bool = False,
+        prefetch: Union[bool, int] = False,
+    ) -> AsyncIterator["DataBlob"]:
+        """Iterate over all DataBlob instances available in the server, requesting them page by page."""
+        async for db in _AsyncResource._iter_pages(
+            DataBlob.ls,
+            page_size,
+            int(prefetch),
+            disabled=disabled,
+            completed=completed,
+        ):
+            yield db
+
+    @staticmethod
+    def as_df(dbx: List["DataBlob"]) -> pd.DataFrame:
+        """Return the details of datablob instances as a pandas dataframe."""
+        return _DataBlob.as_df([db._sync for db in dbx])
+
+    async def is_ready(self) -> bool:
+        """Check if the datablob upload is complete."""
+        if self._sync.type in ["local"]:
+            return True
+
+        return await ProgressStatus(
+            relative_url=f"/datablob/{self._sync.uuid}"
+        ).is_ready()
+
+    async def wait(
+        self,
+        sleep_for: Union[int, float] = 1,
+        timeout: int = 0,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ):
+        """Wait for the datablob upload to complete without blocking the event loop."""
+        if self._sync.type not in ["local"]:
+            await self._wait(
+                f"/datablob/{self._sync.uuid}", sleep_for, timeout, polling_strategy
+            )
+
+    async def details(self) -> pd.DataFrame:
+        """Return details of a datablob."""
+        return await AsyncClient._run(self._sync.details)
+
+    async def tag(self, name: str) -> pd.DataFrame:
+        """Tag an existing datablob in the server."""
+        return await AsyncClient._run(self._sync.tag, name=name)
+
+    async def delete(self) -> pd.DataFrame:
+        """Delete a datablob from the server."""
+        return await AsyncClient._run(self._sync.delete)
+
+    async def to_datasource(
+        self,
+        *,
+        file_type: str,
+        index_column: str,
+        sort_by: Union[str, List[str]],
+        deduplicate_data: bool = False,
+        blocksize: str = "256MB",
+        **kwargs,
+    ) -> DataSource:
+        """Process the datablob and return a datasource object."""
+        ds = await AsyncClient._run(
+            self._sync.to_datasource,
+            file_type=file_type,
+            index_column=index_column,
+            sort_by=sort_by,
+            deduplicate_data=deduplicate_data,
+            blocksize=blocksize,
+            **kwargs,
+        )
+        return DataSource(ds)
@@ -8,6 +8,8 @@ from typing import *
 
 # %% ../../notebooks/API_Keys.ipynb 5
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta
 
 import pandas as pd
@@ -21,6 +23,7 @@ from airt._helper import (
     generate_df,
     get_attributes_from_instances,
     get_data,
+    iter_pages,
     post_data,
 )
 from airt._logger import get_logger, set_level
@@ -179,11 +182,11 @@ class APIKey:
         )
 
     @staticmethod
-    def as_df(ax: List["APIKey"]) -> pd.DataFrame:
+    def as_df(ax: Iterable["APIKey"]) -> pd.DataFrame:
         """Return the details of APIKey instances in a pandas dataframe.
 
         Args:
-            ax: List of APIKey instances.
+            ax: List of APIKey instances, or an iterator of them such as the one returned by `APIKey.iter_all`.
 
         Returns:
             Details of all the APIKeys in a dataframe.
@@ -219,7 +222,8 @@ class APIKey:
         offset: int = 0,
         limit: int = 100,
         include_disabled: bool = False,
-    ) -> List["APIKey"]:
+        as_frame: bool = False,
+    ) -> Union[List["APIKey"], pd.DataFrame]:
         """Return the list of APIKeys instances.
 
         Please do not pass the **user** parameter unless you are a super user. Only a super user can view
@@ -231,9 +235,13 @@ class APIKey:
             offset: The number of APIKeys to offset at the beginning. If None, then the default value 0 will be used.
             limit: The maximum number of APIKeys to return from the server. If None, then the default value 100 will be used.
             include_disabled: If set to **True**, then the disabled APIKeys will also be included in the result.
+            as_frame: If set to **True**, the APIKeys are returned in a pandas dataframe built directly from the
+                server response, without creating an instance per APIKey. The dataframe is the same as the
+                one returned by `APIKey.as_df`. If not passed, then the default value **False** will be used.
 
         Returns:
-            A list of APIKey instances.
+            A list of APIKey instances, or a pandas dataframe with
+            their details if **as_frame** is set to **True**.
 
         Raises:
             ConnectionError: If the server address is invalid or not reachable.
@@ -270,6 +278,9 @@ class APIKey:
             relative_url=f"/{user_uuid}/apikey?include_disabled={include_disabled}&offset={offset}&limit={limit}"
         )
 
+        if as_frame:
+            return generate_df(apikeys, APIKey.API_KEY_COLS)
+
         ax = [
             APIKey(
                 uuid=apikey["uuid"],
@@ -283,6 +294,71 @@ class APIKey:
 
         return ax
 
+    @staticmethod
+    def iter_all(
+        user: Optional[str] = None,
+        page_size: int = 100,
+        include_disabled: bool = False,
+        prefetch: Union[bool, int] = False,
+    ) -> Iterator["APIKey"]:
+        """Iterate over all APIKey instances.
+
+        Please do not pass the **user** parameter unless you are a super user. Only a super user can view
+        the APIKeys created by other users.
+
+        Unlike `APIKey.ls`, which returns a single page of APIKeys, the APIKeys are requested from the server page
+        by page while iterating, so all of them can be processed without building the whole list in memory.
+
+        Args:
+            user: user_uuid/username associated with the APIKey. Please call `User.details` method of the User class to get your user_uuid.
+                If not passed, then the currently logged-in user_uuid will be used.
+            page_size: The number of APIKeys requested from the server at once. If not passed, then the default value
+                **100** will be used.
+            include_disabled: If set to **True**, then the disabled APIKeys will also be included in the result.
+            prefetch: If set to **True**, the next page of APIKeys is requested in the background while the current
+                page is being processed. If set to a number, that many of the next pages are requested
+                concurrently, which speeds up listing all the APIKeys when the network latency dominates. If not
+                passed, then the default value **False** will be used.
+
+        Returns:
+            A generator of APIKey instances.
+
+        Raises:
+            ConnectionError: If the server address is invalid or not reachable.
+            ValueError: If the user_uuid is invalid.
+
+        An example of iterating over the APIKeys generated by the currently logged-in user
+
+        Example:
+            ```python
+            # Importing necessary libraries
+            from  airt.client import Client, APIKey
+
+            # Authenticate
+            Client.get_token(username="{fill in username}", password="{fill in password}")
+
+            # Print the names of all APIKeys created by the currently logged-in user,
+            # requesting them from the server page by page. If you are a super user,
+            # you can iterate over the APIkeys created by other users by passing their
+            # uuid/username in the user parameter.
+            for key in APIKey.iter_all(include_disabled=True):
+                print(key.name)
+            ```
+        """
+        # resolving the user once instead of for every page
+        user_uuid = User.details(user=user)["uuid"]
+
+        return iter_pages(
+            lambda offset, limit: APIKey.ls(
+                user=user_uuid,  # type: ignore
+                offset=offset,
+                limit=limit,
+                include_disabled=include_disabled,
+            ),
+            page_size=page_size,
+            prefetch=int(prefetch),
+        )
+
     @staticmethod
     def details(apikey: str) -> pd.DataFrame:
         """Return details of an APIKey.
@@ -343,29 +419,49 @@ class APIKey:
 
     @staticmethod
     def revoke(
-        keys: Union[str, List[str], List["APIKey"]],
+        keys: Union[
+            str,
+            List[str],
+            List["APIKey"],
+            Dict[str, Union[str, List[str], List["APIKey"]]],
+        ],
         user: Optional[str] = None,
         otp: Optional[str] = None,
+        max_workers: int = 4,
+        raise_on_error: bool = True,
     ) -> pd.DataFrame:
         """Revoke one or more APIKeys
 
         Please do not pass the **user** parameter unless you are a super user. Only a super user can revoke the
         APIKeys created by other users.
 
+        The APIKeys are revoked concurrently. A super user can revoke the APIKeys of multiple users at once by passing
+        a dict mapping the user_uuids/usernames to their APIKeys.
+
         Args:
             keys: APIKey uuid/name to revoke. To revoke multiple keys, either pass a list of APIKey uuid/names or a list of APIKey instances.
+                To revoke the keys of multiple users, pass a dict with the user_uuids/usernames as keys and their APIKey uuid/names or
+                APIKey instances as values.
             user: user_uuid/username associated with the APIKey. Please call `User.details` method of the User class to get your user_uuid/username.
-                If not passed, then the currently logged-in user will be used.
+                If not passed, then the currently logged-in user will be used. Please do not pass this parameter if the keys are passed as a dict.
             otp: Dynamically generated six-digit verification code from the authenticator app. Please pass this
                 parameter only if the MFA is enabled for your account.
+            max_workers: The maximum number of APIKeys to revoke in parallel. If not passed, then the default value **4** will be used.
+            raise_on_error: If set to **True**, the first error is raised and the APIKeys whose requests are not yet sent are not
+                revoked. The requests already sent, up to **max_workers**, may still complete. If set to **False**, all the APIKeys
+                are processed and the returned DataFrame has additional **status**, **error** and **elapsed** columns with the
+                outcome of each APIKey and the time in seconds it took to revoke it. If not passed, then the default value
+                **True** will be used.
 
         Returns:
-             A pandas Dataframe encapsulating the details of the deleted APIKey(s).
+             A pandas Dataframe encapsulating the details of the deleted APIKey(s). If **raise_on_error** is set to **False**, the
+             DataFrame is indexed by the passed APIKey uuid/names, together with the user_uuids/usernames if the keys are passed as a dict.
 
         Raises:
             ValueError: If the APIKey uuid is invalid.
             ValueError: If the user_uuid is invalid.
             ValueError: If the OTP is invalid.
+            ValueError: If both the user parameter and a dict of keys are passed.
             ConnectionError: If the server address is invalid or not reachable.
 
         An example to revoke a single APIKey by name
@@ -417,17 +513,115 @@ class APIKey:
             # Check that all APIkeys have been revoked
             print([key.name for key in APIKey.ls(user=user)])
             ```
-        """
-        user_uuid = User.details(user=user)["uuid"]
-        _keys = APIKey._get_key_names(keys)
 
-        response_list = []
+        Here's an example of a super user revoking the APIkeys of multiple users at once and checking the outcome for each APIKey.
 
-        for key_uuid in _keys:
-            url = f"/{user_uuid}/apikey/{key_uuid}"
-            response = Client._delete_data(
-                relative_url=check_and_append_otp_query_param(url, otp)
+        Example:
+            ```python
+            # Importing necessary libraries
+            from  airt.client import Client, APIKey
+
+            # Authenticate with super user privileges
+            Client.get_token(
+                username="{fill in super_user_username}",
+                password="{fill in super_user_password}"
             )
-            response_list.append(response)
 
-        return generate_df(response_list, APIKey.API_KEY_COLS)
+            # Revoke all APIKeys of the users
+            users = ["{fill in other_username}", "{fill in super_user_username}"]
+            df = APIKey.revoke(
+                keys={user: APIKey.ls(user=user) for user in users},
+                max_workers=8,
+                raise_on_error=False,
+            )
+
+            # Display the outcome of the revocation for each APIKey
+            print(df[["status", "error", "elapsed"]])
+            ```
+        """
+        if isinstance(keys, dict):
+            if user is not None:
+                raise ValueError(
+                    "Please pass either the user parameter or a dict of APIKeys per user, not both."
+                )
+            user_keys: Dict[Optional[str], List[str]] = {
+                u: APIKey._get_key_names(k) for u, k in keys.items()
+            }
+        else:
+            user_keys = {user: APIKey._get_key_names(keys)}
+        revocations = [(u, key) for u, _keys in user_keys.items() for key in _keys]
+
+        responses: Dict[int, Dict[str, Any]] = {}
+        errors: Dict[int, str] = {}
+        elapsed: Dict[int, float] = {}
+
+        def _revoke(i: int, user_uuid: str, key: str) -> Dict[str, Any]:
+            start = time.monotonic()
+            try:
+                return Client._delete_data(
+                    relative_url=check_and_append_otp_query_param(
+                        f"/{user_uuid}/apikey/{key}", otp
+                    )
+                )
+            finally:
+                elapsed[i] = time.monotonic() - start
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="airt-apikeys"
+        ) as executor:
+            # the users not resolved in a single sweep are looked up concurrently
+            user_uuids: Dict[Optional[str], str] = {
+                u: user_uuid
+                for u, user_uuid in User._resolve_user_uuids(
+                    [u for u in user_keys if u is not None], disabled=False
+                ).items()
+            }
+            unresolved = [u for u in user_keys if u not in user_uuids]
+            user_errors: Dict[Optional[str], str] = {}
+            for u, future in zip(
+                unresolved, [executor.submit(User.details, user=u) for u in unresolved]
+            ):
+                try:
+                    user_uuids[u] = str(future.result()["uuid"])
+                except Exception as e:
+                    if raise_on_error:
+                        raise
+                    user_errors[u] = str(e)
+
+            futures = {}
+            for i, (u, key) in enumerate(revocations):
+                if u in user_errors:
+                    errors[i] = user_errors[u]
+                else:
+                    futures[executor.submit(_revoke, i, user_uuids[u], key)] = i
+            try:
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        responses[i] = future.result()
+                    except Exception as e:
+                        if raise_on_error:
+                            raise
+                        errors[i] = str(e)
+            except BaseException:
+                # don't revoke the keys not yet processed if one of them failed, the requests already sent are
+                # completed before the executor shuts down
+                for future in futures:
+                    future.cancel()
+                raise
+
+        indices = range(len(revocations))
+        if raise_on_error:
+            return generate_df([responses[i] for i in indices], APIKey.API_KEY_COLS)
+
+        df = pd.DataFrame(
+            [responses.get(i, {}) for i in indices], columns=APIKey.API_KEY_COLS
+        )
+        df["status"] = ["revoked" if i in responses else "failed" for i in indices]
+        df["error"] = [errors.get(i) for i in indices]
+        df["elapsed"] = [elapsed.get(i) for i in indices]
+        if isinstance(keys, dict):
+            df.index = pd.MultiIndex.from_tuples(revocations, names=["user", "apikey"])
+        else:
+            df.index = pd.Index([key for _, key in revocations], name="apikey")
+        return df
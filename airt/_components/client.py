@@ -7,13 +7,21 @@ __all__ = ['Client']
 from typing import *
 
 # %% ../../notebooks/API_Client.ipynb 5
+import copy
+import hashlib
 import importlib
 import json
 import os
 import secrets
+import shutil
+import tempfile
+import threading
+import time
 import urllib.parse
+from collections import OrderedDict
+from pathlib import Path
 
-import pandas as pd
+import requests
 from fastcore.foundation import patch
 
 import airt
@@ -24,7 +32,14 @@ from airt._constant import (
     SERVICE_TOKEN,
     SERVICE_USERNAME,
 )
-from airt._helper import delete_data, get_base_url, get_data, post_data
+from airt._helper import (
+    create_session,
+    delete_data,
+    get_base_url,
+    get_data,
+    get_data_if_modified,
+    post_data,
+)
 from airt._logger import get_logger, set_level
 
 # %% ../../notebooks/API_Client.ipynb 7
@@ -73,6 +88,183 @@ def _get_credentials(
     return (username, password)
 
 # %% ../../notebooks/API_Client.ipynb 15
+class _ResponseCache:
+    """A thread-safe cache of the responses to the GET requests with TTL and LRU size limits.
+
+    The responses are cached per server, auth token, relative URL and accepted media types, so the responses fetched
+    with the token of one user are never returned to another one. A copy of the cached response is returned on every
+    hit, so the callers can modify it freely.
+
+    Args:
+        ttl: The time in seconds for which a cached response is used. If **None**, the responses never expire.
+        maxsize: The maximum number of cached responses. The least recently used response is dropped when exceeded.
+    """
+
+    def __init__(self, ttl: Optional[float] = 300, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._responses: "OrderedDict[Tuple[Optional[str], ...], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Optional[str], ...]) -> Tuple[bool, Any]:
+        """Return a tuple of a flag whether the response is cached and a copy of the cached response."""
+        with self._lock:
+            if key not in self._responses:
+                return False, None
+
+            expires_at, response = self._responses[key]
+            if expires_at < time.monotonic():
+                del self._responses[key]
+                return False, None
+
+            self._responses.move_to_end(key)
+
+        return True, copy.deepcopy(response)
+
+    def set(self, key: Tuple[Optional[str], ...], response: Any):
+        """Cache a copy of the response, dropping the least recently used responses above **maxsize**."""
+        expires_at = (
+            time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        )
+        with self._lock:
+            self._responses[key] = (expires_at, copy.deepcopy(response))
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.maxsize:
+                self._responses.popitem(last=False)
+
+    def invalidate(self, relative_url: str):
+        """Drop the cached responses of the relative URL and all the URLs below it, for all servers and tokens."""
+        with self._lock:
+            for key in list(self._responses):
+                url = key[2] or ""
+                if url == relative_url or url.startswith(
+                    (f"{relative_url}/", f"{relative_url}?")
+                ):
+                    del self._responses[key]
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+
+def _is_cacheable(response: Any) -> bool:
+    """Check if the response can be cached.
+
+    The responses describing a resource which is not yet ready will change once the resource is ready, so they are
+    never cached.
+
+    Args:
+        response: The response body.
+
+    Returns:
+        **True** if the response can be cached, else **False**.
+    """
+    if isinstance(response, dict) and {"completed_steps", "total_steps"} <= set(
+        response
+    ):
+        return response["completed_steps"] == response["total_steps"]
+
+    return True
+
+# %% ../../notebooks/API_Client.ipynb 17
+class _DiskCache:
+    """A cache of immutable artifacts stored as files in a local directory, with a size limit and LRU eviction.
+
+    Each artifact is stored in a file named by the SHA256 hashes of the resource it belongs to and of its key, so the
+    artifacts of a resource can be deleted together. The files are written to a temporary file first and renamed, so the directory can be shared by multiple processes. The modification time of a file is
+    updated on every hit and the least recently used files are deleted once the total size exceeds **max_size**.
+
+    Args:
+        directory: Path of the directory to store the artifacts in. It is created if it doesn't exist.
+        max_size: The maximum total size of the stored artifacts in bytes.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_size: int):
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _hash(s: str) -> str:
+        return hashlib.sha256(s.encode()).hexdigest()
+
+    def _get_path(self, resource: str, key: str) -> Path:
+        return self.directory / f"{self._hash(resource)}-{self._hash(key)}"
+
+    def read(self, resource: str, key: str) -> Optional[bytes]:
+        """Return the content of the artifact or None if it is not cached."""
+        path = self._get_path(resource, key)
+        try:
+            os.utime(path)
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def copy_to(self, resource: str, key: str, destination: Path) -> bool:
+        """Copy the artifact to the destination path and return **True**, or return **False** if it is not cached."""
+        path = self._get_path(resource, key)
+        try:
+            os.utime(path)
+            shutil.copyfile(path, destination)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def write(self, resource: str, key: str, content: bytes):
+        """Store the artifact, deleting the least recently used artifacts if the size limit is exceeded."""
+        if len(content) > self.max_size:
+            return
+
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, prefix=".", suffix=".tmp", delete=False
+        ) as f:
+            f.write(content)
+        os.replace(f.name, self._get_path(resource, key))
+        self._evict()
+
+    def write_file(self, resource: str, key: str, source: Path):
+        """Store a copy of the file as the artifact, deleting the least recently used artifacts if needed."""
+        if source.stat().st_size > self.max_size:
+            return
+
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, prefix=".", suffix=".tmp", delete=False
+        ) as f:
+            with open(source, "rb") as src:
+                shutil.copyfileobj(src, f)
+        os.replace(f.name, self._get_path(resource, key))
+        self._evict()
+
+    def invalidate(self, resource: str):
+        """Delete all the stored artifacts of the resource."""
+        for path in self.directory.glob(f"{self._hash(resource)}-*"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _evict(self):
+        files = []
+        for path in self.directory.iterdir():
+            if path.name.startswith("."):
+                continue
+            try:
+                files.append((path.stat(), path))
+            except FileNotFoundError:
+                pass
+
+        total_size = sum(stat.st_size for stat, _ in files)
+        for stat, path in sorted(files, key=lambda file: file[0].st_mtime):
+            if total_size <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= stat.st_size
+
+# %% ../../notebooks/API_Client.ipynb 19
 class Client:
     """A class for authenticating and accessing the airt service.
 
@@ -135,6 +327,16 @@ class Client:
     auth_token: Optional[str] = None
     sso_authorization_url: Optional[str] = None
 
+    _session: Optional[requests.Session] = None
+    _session_config: Dict[str, Any] = dict(
+        pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True
+    )
+    _session_lock = threading.Lock()
+    _response_cache: Optional[_ResponseCache] = None
+    _validated_responses = _ResponseCache(ttl=None, maxsize=128)
+    _validated_max_size = 256 * 1024
+    _disk_cache: Optional[_DiskCache] = None
+
     def __init__(
         self,
         server: str,
@@ -244,6 +446,7 @@ class Client:
                 url=f"{cls.server}/token",
                 data=dict(username=username, password=password),
                 token=None,
+                session=cls._get_session(),
             )
 
             cls.auth_token = response["access_token"]
@@ -256,6 +459,7 @@ class Client:
                     )
                 ),
                 token=None,
+                session=cls._get_session(),
             )
 
             cls.sso_authorization_url = response["authorization_url"]
@@ -308,6 +512,7 @@ class Client:
         response = get_data(
             url=f"{cls.server}/sso/token/?authorization_url={quoted_authorization_url}",
             token=None,
+            session=cls._get_session(),
         )
 
         cls.auth_token = response["access_token"]
@@ -393,6 +598,226 @@ class Client:
 
         return version
 
+    @classmethod
+    def configure_session(
+        cls,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ):
+        """Configure the pooled HTTP session used for all the interactions with the server.
+
+        All the requests to the airt server are sent through a single session shared by all the threads, so the
+        TCP/TLS connections are reused instead of being opened for every call. The session is created lazily on the
+        first request; calling this method closes the current session and the new settings are applied to the next request.
+
+        Args:
+            pool_connections: The number of hosts for which a connection pool is cached. If not passed, then the
+                default value **10** will be used.
+            pool_maxsize: The maximum number of connections kept open per host. Set it to at least the number of threads
+                sending requests concurrently. If not passed, then the default value **10** will be used.
+            pool_block: If set to **True**, a request will wait for a free pooled connection instead of opening an
+                additional one, making **pool_maxsize** a hard per-host limit. If not passed, then the default value **False** will be used.
+            keep_alive: If set to **False**, the connections will be closed after every request. If not passed, then
+                the default value **True** will be used.
+
+        An example to increase the connection pool size for a multi-threaded application:
+
+        Example:
+            ```python
+            # Importing necessary libraries
+            from  airt.client import Client, User
+
+            # Allow up to 32 concurrent connections to the airt server
+            Client.configure_session(pool_maxsize=32, pool_block=True)
+
+            # Authenticate
+            Client.get_token(username="{fill in username}", password="{fill in password}")
+
+            # Print the logged-in user details
+            print(User.details())
+
+            # Close the connections once you are done
+            Client.close_session()
+            ```
+        """
+        with cls._session_lock:
+            cls._session_config = dict(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+            )
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
+
+    @classmethod
+    def close_session(cls):
+        """Close the pooled HTTP session and all of its open connections.
+
+        A new session will be created automatically on the next request to the server.
+
+        An example to close the connections to the server:
+
+        Example:
+            ```python
+            # Importing necessary libraries
+            from  airt.client import Client
+
+            # Print the client and server versions
+            print(Client.version())
+
+            # Close the connections once you are done
+            Client.close_session()
+            ```
+        """
+        with cls._session_lock:
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
+
+    @classmethod
+    def enable_cache(cls, *, ttl: Optional[float] = 300, maxsize: int = 256):
+        """Enable caching the responses of the requests for the details of the completed resources.
+
+        Once enabled, the responses of `DataBlob.details`, `DataSource.details`, `DataSource.dtypes`, `DataSource.head`,
+        `Model.details` and `Model.evaluate` are cached in memory and reused for the repeated calls for the same
+        resource, instead of requesting them from the server again. The responses are cached per auth token, and the
+        details of the resources which are not yet ready are never cached. The cached responses of a resource are
+        dropped when it is deleted or tagged. Calling this method again drops all the cached responses.
+
+        Args:
+            ttl: The time in seconds for which a cached response is reused. If **None**, the cached responses never
+                expire. If not passed, then the default value **300** will be used.
+            maxsize: The maximum number of cached responses. Once exceeded, the least recently used responses are
+                dropped. If not passed, then the default value **256** will be used.
+
+        An example to cache the responses for a dashboard displaying the details of a model repeatedly:
+
+        Example:
+            ```python
+            # Importing necessary libraries
+            from  airt.client import Client, Model
+
+            # Authenticate
+            Client.get_token(username="{fill in username}", password="{fill in password}")
+
+            # Reuse the responses for 10 minutes
+            Client.enable_cache(ttl=600)
+
+            # Only the first call requests the evaluation metrics from the server
+            model = Model.ls()[0]
+            for _ in range(3):
+                print(model.evaluate())
+
+            # Request the responses from the server again
+            Client.disable_cache()
+            ```
+        """
+        cls._response_cache = _ResponseCache(ttl=ttl, maxsize=maxsize)
+
+    @classmethod
+    def disable_cache(cls):
+        """Disable caching the responses and drop all the cached responses.
+
+        Please check the documentation of `enable_cache` method for the details.
+        """
+        cls._response_cache = None
+
+    @classmethod
+    def enable_disk_cache(
+        cls,
+        *,
+        directory: Optional[Union[str, Path]] = None,
+        max_size: int = 1024**3,
+    ):
+        """Enable storing the results of the completed models and predictions in a local directory.
+
+        Once enabled, the results of `Model.evaluate` and `Prediction.to_pandas` and the files downloaded by
+        `Prediction.to_local` are stored in the directory and reused by the later calls for the same model or
+        prediction, including the calls from other processes, instead of downloading them from the server again.
+        Since the results of a completed model or prediction never change, the stored results never expire, but the
+        least recently used ones are deleted once their total size exceeds **max_size**.
+
+        The stored results are shared by all the users of the directory. The results are reused only after checking
+        with the server that the model or prediction is completed and accessible with the current token, except the
+        files downloaded by `Prediction.to_local` for which the presigned URLs of the files are requested anyway. The
+        stored results of a model or prediction are deleted when it is deleted.
+
+        Args:
+            directory: Path of the directory to store the results in. If not passed, then the default directory
+                **~/.cache/airt** will be used.
+            max_size: The maximum total size in bytes of the stored results. If not passed, then the default value of
+                **1 GiB** will be used.
+
+        An example to reuse the prediction results downloaded in the previous runs of a notebook:
+
+        Example:
+            ```python
+            # Importing necessary libraries
+            from  airt.client import Client, Prediction
+
+            # Authenticate
+            Client.get_token(username="{fill in username}", password="{fill in password}")
+
+            # Store up to 10 GiB of results in the given directory
+            Client.enable_disk_cache(directory="{fill in directory}", max_size=10 * 1024**3)
+
+            # The prediction results are downloaded from the server only once
+            # and read from the directory in the later runs
+            prediction = Prediction.ls()[0]
+            print(prediction.to_pandas())
+
+            # Download the results from the server again
+            Client.disable_disk_cache()
+            ```
+        """
+        cls._disk_cache = _DiskCache(
+            directory=Path(directory)
+            if directory is not None
+            else Path.home() / ".cache" / "airt",
+            max_size=max_size,
+        )
+
+    @classmethod
+    def disable_disk_cache(cls):
+        """Disable storing the results in a local directory.
+
+        The results already stored in the directory are kept. Please check the documentation of `enable_disk_cache`
+        method for the details.
+        """
+        cls._disk_cache = None
+
+    @classmethod
+    def _invalidate_cache(cls, relative_url: str):
+        """Drop the cached responses of a resource and its results stored in the disk cache.
+
+        Args:
+            relative_url: The relative URL of the resource. The cached responses of all the URLs below it are dropped as well.
+        """
+        if cls._response_cache is not None:
+            cls._response_cache.invalidate(relative_url)
+        cls._validated_responses.invalidate(relative_url)
+        if cls._disk_cache is not None:
+            server, _ = Client._get_server_url_and_token()
+            cls._disk_cache.invalidate(f"{server}{relative_url}")
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Return the pooled session, creating it if necessary.
+
+        Returns:
+            The session shared by all the requests to the server.
+        """
+        with cls._session_lock:
+            if cls._session is None:
+                cls._session = create_session(**cls._session_config)
+
+            return cls._session
+
     @classmethod
     def _get_server_url_and_token(cls) -> Tuple[Optional[str], Optional[str]]:
         """Fetch the server URL and the auth token.
@@ -436,19 +861,38 @@ class Client:
             data=data,
             json=json,
             token=auth_token,
+            session=Client._get_session(),
         )
 
     @classmethod
-    def _get_data(cls, relative_url: str) -> Any:
+    def _get_data(
+        cls,
+        relative_url: str,
+        accept: Optional[str] = None,
+        cache: bool = False,
+        resource_url: Optional[str] = None,
+    ) -> Any:
         """Make a GET request.
 
         This method will implicitly add the server base URL and the token for every request.
 
         Args:
             relative_url: The relative URL of the API endpoint.
+            accept: The media types accepted in the response, in the format of the Accept header. If **None**
+                (default value), the response is expected to be JSON.
+            cache: If set to **True** and the caching is enabled by `enable_cache`, the cached response is returned
+                if available, else the response is cached unless it describes a resource which is not yet ready.
+            resource_url: The relative URL of the API endpoint returning the details of the resource the response
+                belongs to, for the responses which don't describe the resource itself. If passed, the response is
+                cached only if the resource is ready before it is requested.
+
+        The JSON responses with an ETag or a Last-Modified date are remembered per server, token and URL, and the
+        following requests for the same URL are sent as conditional requests. If the server responds with
+        304 Not Modified, the remembered response is returned without being sent again.
 
         Returns:
-            A dictionary that encapsulates the response body.
+            A dictionary that encapsulates the response body or, if the server responds with a media type other
+            than JSON to a request with **accept** passed, the raw response body.
 
         Raises:
             ConnectionError: If the server is not reachable.
@@ -457,7 +901,105 @@ class Client:
 
         server, auth_token = Client._get_server_url_and_token()
 
-        return get_data(url=f"{server}{relative_url}", token=auth_token)
+        response_cache = Client._response_cache if cache else None
+        key = (server, auth_token, relative_url, accept)
+        if response_cache is not None:
+            hit, response = response_cache.get(key)
+            if hit:
+                return response
+
+            # the resource is checked before the request, so a response of a resource which becomes ready
+            # in the meantime is not cached
+            if resource_url is not None and not _is_cacheable(
+                Client._get_data(relative_url=resource_url, cache=True)
+            ):
+                response_cache = None
+
+        if accept is None:
+            _, validated = Client._validated_responses.get(key)
+            response, validated = get_data_if_modified(
+                url=f"{server}{relative_url}",
+                token=auth_token,
+                validated=validated,
+                session=Client._get_session(),
+            )
+            if validated is not None and len(validated[2]) <= cls._validated_max_size:
+                Client._validated_responses.set(key, validated)
+        else:
+            response = get_data(
+                url=f"{server}{relative_url}",
+                token=auth_token,
+                session=Client._get_session(),
+                accept=accept,
+            )
+
+        if response_cache is not None and _is_cacheable(response):
+            response_cache.set(key, response)
+
+        return response
+
+    @classmethod
+    def _get_artifact(
+        cls,
+        relative_url: str,
+        resource_url: str,
+        accept: Optional[str] = None,
+        cache: bool = False,
+    ) -> Any:
+        """Make a GET request for the immutable results of a completed resource.
+
+        If the disk cache is enabled by `enable_disk_cache` and the resource is completed, the response stored in
+        the disk cache is returned if available, else the response is stored in it.
+
+        Args:
+            relative_url: The relative URL of the API endpoint returning the results.
+            resource_url: The relative URL of the API endpoint returning the details of the resource. It is requested
+                from the server, bypassing the in-memory cache, to check the resource is completed and accessible
+                before returning the stored response.
+            accept: The media types accepted in the response, in the format of the Accept header.
+            cache: If set to **True**, the response is also cached in memory, please check the documentation of
+                `_get_data` method for the details.
+
+        Returns:
+            A dictionary that encapsulates the response body or, if the server responds with a media type other
+            than JSON to a request with **accept** passed, the raw response body.
+
+        Raises:
+            ConnectionError: If the server is not reachable.
+            ValueError: If the response code is not in range of 200 - 399.
+        """
+        disk_cache = Client._disk_cache
+        if disk_cache is None or not _is_cacheable(
+            Client._get_data(relative_url=resource_url)
+        ):
+            return Client._get_data(
+                relative_url=relative_url,
+                accept=accept,
+                cache=cache,
+                resource_url=resource_url,
+            )
+
+        server, _ = Client._get_server_url_and_token()
+        resource = f"{server}{resource_url}"
+        key = f"{server}{relative_url} {accept}"
+
+        content = disk_cache.read(resource, key)
+        if content is not None:
+            # the JSON responses are stored prefixed by a zero byte, which can't start a binary format we accept
+            return json.loads(content[1:]) if content[:1] == b"\x00" else content
+
+        response = Client._get_data(
+            relative_url=relative_url, accept=accept, cache=cache
+        )
+        disk_cache.write(
+            resource,
+            key,
+            response
+            if isinstance(response, bytes)
+            else b"\x00" + json.dumps(response).encode(),
+        )
+
+        return response
 
     @classmethod
     def _delete_data(cls, relative_url: str) -> Dict[str, Any]:
@@ -478,4 +1020,8 @@ class Client:
 
         server, auth_token = Client._get_server_url_and_token()
 
-        return delete_data(url=f"{server}{relative_url}", token=auth_token)
+        return delete_data(
+            url=f"{server}{relative_url}",
+            token=auth_token,
+            session=Client._get_session(),
+        )
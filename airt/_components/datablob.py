@@ -7,7 +7,11 @@ __all__ = ['DataBlob']
 from typing import *
 
 # %% ../../notebooks/API_DataBlob.ipynb 5
+import base64
+import json
 import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -19,16 +23,18 @@ from tqdm import tqdm
 
 from airt._components.client import Client
 from airt._components.datasource import DataSource
-from airt._components.progress_status import ProgressStatus
+from airt._components.progress_status import PollingStrategy, ProgressStatus
 from airt._constant import CLIENT_DB_PASSWORD, CLIENT_DB_USERNAME
 from airt._helper import (
     add_example_to_docs,
     add_ready_column,
+    create_session,
     delete_data,
     generate_df,
     get_attributes_from_instances,
     get_data,
     get_values_from_item,
+    iter_pages,
     post_data,
 )
 from airt._logger import get_logger, set_level
@@ -41,6 +47,226 @@ DEFAULT_AZURE_BLOB_STORAGE_REGION = "westeurope"
 DEFAULT_S3_REGION = "eu-west-1"
 
 # %% ../../notebooks/API_DataBlob.ipynb 11
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _quote_multipart_param(value: str) -> str:
+    """Escape a value for a multipart/form-data header parameter the same way as urllib3 does."""
+    return value.translate({10: "%0A", 13: "%0D", 34: "%22"})
+
+
+class _MultipartFileStream:
+    """A file-like object streaming the multipart/form-data body of a presigned POST request.
+
+    Unlike passing the file in the **files** parameter of `requests.post`, which reads the whole file into memory to
+    encode the body, the file is read in chunks while the body is being sent, so the memory used does not depend
+    on the file size.
+
+    Args:
+        presigned_fields: presigned fields provided by boto3
+        filename: the filename sent in the body
+        file_to_upload: path of file to upload
+        start: the offset of the first byte of the file to upload
+        end: the offset after the last byte of the file to upload, if not passed the file is uploaded till its end
+        prefix: the bytes to upload before the content of the file
+    """
+
+    def __init__(
+        self,
+        presigned_fields: Dict[str, Any],
+        filename: str,
+        file_to_upload: Path,
+        start: int = 0,
+        end: Optional[int] = None,
+        prefix: bytes = b"",
+    ):
+        boundary = secrets.token_hex(16)
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        preamble = "".join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{_quote_multipart_param(k)}"\r\n\r\n{v}\r\n'
+            for k, v in presigned_fields.items()
+        )
+        preamble += f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{_quote_multipart_param(filename)}"\r\n\r\n'
+        self._preamble = preamble.encode("utf-8") + prefix
+        self._epilogue = f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+        end = file_to_upload.stat().st_size if end is None else end
+        self._file_remaining = end - start
+        self._f = open(file_to_upload, "rb")
+        self._f.seek(start)
+
+        self._len = len(self._preamble) + self._file_remaining + len(self._epilogue)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def read(self, size: int = -1) -> bytes:
+        """Read the next chunk of the body, of at most `UPLOAD_CHUNK_SIZE` bytes if size is not passed."""
+        if size is None or size < 0:
+            size = UPLOAD_CHUNK_SIZE
+
+        if self._preamble:
+            chunk, self._preamble = self._preamble[:size], self._preamble[size:]
+        elif self._file_remaining:
+            chunk = self._f.read(min(size, self._file_remaining))
+            if not chunk:
+                raise ValueError(
+                    f"The file {self._f.name} was truncated while uploading it"
+                )
+            self._file_remaining -= len(chunk)
+        else:
+            chunk, self._epilogue = self._epilogue[:size], self._epilogue[size:]
+        return chunk
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self) -> "_MultipartFileStream":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _split_csv_file(file_to_upload: Path, part_size: int) -> List[Tuple[int, int]]:
+    """Split a CSV file into parts of about part_size bytes at the line boundaries.
+
+    Args:
+        file_to_upload: path of the CSV file to split
+        part_size: the approximate size of each part in bytes
+
+    Returns:
+        A list of the start and end offsets of each part. The first part starts with the header line.
+    """
+    size = file_to_upload.stat().st_size
+    offsets = [0]
+    with open(file_to_upload, "rb") as f:
+        header_end = len(f.readline())
+        while max(offsets[-1], header_end) + part_size < size:
+            f.seek(max(offsets[-1], header_end) + part_size)
+            f.readline()
+            if size <= f.tell():
+                break
+            offsets.append(f.tell())
+
+    return list(zip(offsets, offsets[1:] + [size]))
+
+# %% ../../notebooks/API_DataBlob.ipynb 12
+def _get_upload_key(
+    file_to_upload: Path, part: Optional[Tuple[int, int]], part_no: int
+) -> str:
+    """Return the key identifying an upload of a file or of a part of a file in the upload manifest."""
+    return (
+        str(file_to_upload) if part is None else f"{file_to_upload}#part-{part_no:05d}"
+    )
+
+
+def _get_upload_state(
+    file_to_upload: Path, part: Optional[Tuple[int, int]]
+) -> Dict[str, Any]:
+    """Return the state of a file recorded in the upload manifest after uploading the file or a part of it.
+
+    A file is considered unchanged since the upload if its size and modification time are the same.
+    """
+    stat = file_to_upload.stat()
+    return dict(
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        part=list(part) if part is not None else None,
+    )
+
+
+def _is_presigned_post_expired(presigned_fields: Dict[str, Any]) -> bool:
+    """Check if the policy of a presigned POST has expired.
+
+    Args:
+        presigned_fields: presigned fields provided by boto3
+
+    Returns:
+        **True** if the expiration time in the policy has passed, **False** if it has not or if the fields don't contain a policy.
+    """
+    try:
+        policy = json.loads(base64.b64decode(presigned_fields["policy"]))
+        expiration = datetime.strptime(policy["expiration"], "%Y-%m-%dT%H:%M:%SZ")
+    except (KeyError, TypeError, ValueError):
+        return False
+
+    # leave a margin for uploading the remaining files
+    return expiration - timedelta(minutes=5) < datetime.utcnow()
+
+
+def _load_upload_manifest(
+    manifest_path: Path, request: Dict[str, Any], part_size: Optional[int]
+) -> Optional[Dict[str, Any]]:
+    """Load the manifest of an interrupted upload to resume it.
+
+    Args:
+        manifest_path: path of the manifest file
+        request: the parameters of the from_local request the manifest must have been created for
+        part_size: the part size the manifest must have been created for, the files split into other parts can't be resumed
+
+    Returns:
+        The manifest if it exists, it was created for the same request and part size and its presigned POST has not expired, else **None**.
+    """
+    if not manifest_path.exists():
+        return None
+
+    manifest = json.loads(manifest_path.read_text())
+    if manifest.get("request") != request:
+        logger.info(
+            f"Ignoring the upload manifest {manifest_path} created for a different upload: {manifest.get('request')}"
+        )
+        return None
+
+    if manifest.get("part_size") != part_size:
+        logger.info(
+            f"Ignoring the upload manifest {manifest_path} created for a different part size: {manifest.get('part_size')}"
+        )
+        return None
+
+    if _is_presigned_post_expired(manifest["presigned"]["fields"]):
+        logger.info(
+            f"Ignoring the upload manifest {manifest_path} because the presigned url has expired"
+        )
+        return None
+
+    return manifest
+
+
+def _get_tmp_path(path: Path) -> Path:
+    """Return the path of the temporary file used for atomically replacing a file."""
+    return path.with_name(f".{path.name}.tmp")
+
+
+def _save_upload_manifest(manifest_path: Path, manifest: Dict[str, Any]):
+    """Atomically replace the manifest file, so it's never left partially written if the upload is interrupted.
+
+    The manifest contains the presigned POST fields, so the file is readable and writable by the owner only.
+    """
+    tmp_path = _get_tmp_path(manifest_path)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        # a temporary file left behind by an interrupted upload keeps its permissions when opened
+        os.chmod(tmp_path, 0o600)
+        f.write(json.dumps(manifest, indent=2))
+    os.replace(tmp_path, manifest_path)
+
+
+def _record_upload(
+    manifest_path: Path,
+    manifest: Dict[str, Any],
+    file_to_upload: Path,
+    part: Optional[Tuple[int, int]],
+    part_no: int,
+):
+    """Record a completed upload of a file or of a part of a file in the upload manifest."""
+    manifest["uploaded"][
+        _get_upload_key(file_to_upload, part, part_no)
+    ] = _get_upload_state(file_to_upload, part)
+    _save_upload_manifest(manifest_path, manifest)
+
+# %% ../../notebooks/API_DataBlob.ipynb 13
 class DataBlob:
     """A class for importing and processing data from sources such as CSV/parquet files, databases, AWS S3 buckets, and Azure Blob Storage.
 
@@ -614,21 +840,51 @@ class DataBlob:
         presigned_fields: Dict[str, Any],
         max_retry: int = 3,
         curr_iteration: int = 1,
+        session: Optional[requests.Session] = None,
+        part: Optional[Tuple[int, int]] = None,
+        part_no: int = 0,
     ):
         """Upload local files to s3 using presigned url
 
+        The file is streamed in chunks, so the memory used does not depend on the file size.
+
         Args:
             file_to_upload: path of file to upload
             presigned_url: presigned url to upload to
             presigned_fields: presigned fields provided by boto3
             max_retry: maximum retry count
             curr_iteration: current iteration count for internal use
+            session: session to reuse the connections from, if not passed a new connection is opened
+            part: the start and end offsets of the part of the CSV file to upload, if not passed the whole file is uploaded
+            part_no: the number of the part of the CSV file to upload, used for naming the uploaded part
         """
+        requester = session if session is not None else requests
+        filename, start, end, prefix = str(file_to_upload), 0, None, b""
+        if part is not None:
+            start, end = part
+            filename = str(
+                file_to_upload.with_name(
+                    f"{file_to_upload.stem}.part-{part_no:05d}{file_to_upload.suffix}"
+                )
+            )
+            if 0 < start:
+                # every part must start with the header line
+                with open(file_to_upload, "rb") as f:
+                    prefix = f.readline()
+
         try:
-            with open(file_to_upload, "rb") as f:
-                files = {"file": (str(file_to_upload), f)}
-                response = requests.post(
-                    presigned_url, data=presigned_fields, files=files
+            with _MultipartFileStream(
+                presigned_fields=presigned_fields,
+                filename=filename,
+                file_to_upload=file_to_upload,
+                start=start,
+                end=end,
+                prefix=prefix,
+            ) as body:
+                response = requester.post(
+                    presigned_url,
+                    data=body,
+                    headers={"Content-Type": body.content_type},
                 )
                 if not response.status_code == 204:
                     raise ValueError(response.text)
@@ -642,6 +898,9 @@ class DataBlob:
                 presigned_fields,
                 max_retry,
                 curr_iteration + 1,
+                session,
+                part,
+                part_no,
             )
 
     @staticmethod
@@ -651,6 +910,9 @@ class DataBlob:
         region: Optional[str] = None,
         tag: Optional[str] = None,
         show_progress: Optional[bool] = True,
+        max_workers: int = 4,
+        part_size: Optional[int] = None,
+        manifest_path: Optional[Union[str, Path]] = None,
     ) -> "DataBlob":
         """Create and return a datablob from local file.
 
@@ -669,6 +931,16 @@ class DataBlob:
                 switzerlandnorth, switzerlandwest, uaecentral, uaenorth, uksouth, ukwest, westcentralus, westeurope, westindia, westus, westus2.
             tag: A string to tag the datablob. If not passed, then the tag **latest** will be assigned to the datablob.
             show_progress: Flag to set the progressbar visibility. If not passed, then the default value **True** will be used.
+            max_workers: The maximum number of files to upload in parallel when the path is a directory. If not passed, then the default
+                value **4** will be used.
+            part_size: If set, the CSV files larger than **part_size** bytes are split at the line boundaries and uploaded in parts of about
+                **part_size** bytes, each starting with the header line. The parts are uploaded in parallel and a failed part is retried without
+                uploading the rest of the file again. Please don't use this option if the CSV values contain line breaks. If not passed, then the
+                files are uploaded whole.
+            manifest_path: If set, the state of the upload is recorded in a manifest file at this path, so that an interrupted upload can be
+                resumed by calling this method again with the same parameters. The files already uploaded are skipped, unless their size or
+                modification time has changed since. The manifest file is deleted after all the files are uploaded. If not passed, then
+                the upload is not resumable.
 
         Returns:
            An instance of the `DataBlob` class.
@@ -711,29 +983,117 @@ class DataBlob:
 
         # Step 1: get presigned URL
         _path = f"local:{str(path)}"
+        request = dict(
+            path=_path, region=region, cloud_provider=cloud_provider, tag=tag
+        )
 
-        response = Client._post_data(
-            relative_url=f"/datablob/from_local/start",
-            json=dict(
-                path=_path, region=region, cloud_provider=cloud_provider, tag=tag
-            ),
+        manifest_path = Path(manifest_path) if manifest_path is not None else None
+        manifest = (
+            _load_upload_manifest(manifest_path, request, part_size)
+            if manifest_path is not None
+            else None
         )
+        if manifest is None:
+            response = Client._post_data(
+                relative_url=f"/datablob/from_local/start",
+                json=request,
+            )
+            manifest = dict(
+                request=request,
+                part_size=part_size,
+                uuid=response["uuid"],
+                type=response["type"],
+                presigned=response["presigned"],
+                uploaded={},
+            )
+        else:
+            response = manifest
 
         # Step 2: download the csv to the s3 bucket
         files = list(path.glob("*")) if path.is_dir() else [path]
+        if manifest_path is not None:
+            # don't upload the manifest if it is stored in the uploaded directory
+            files = [
+                f
+                for f in files
+                if f.resolve()
+                not in [
+                    manifest_path.resolve(),
+                    _get_tmp_path(manifest_path).resolve(),
+                ]
+            ]
+
+        uploads: List[Tuple[Path, Optional[Tuple[int, int]], int]] = []
+        for file_to_upload in files:
+            if (
+                part_size is not None
+                and file_to_upload.suffix.lower() == ".csv"
+                and part_size < file_to_upload.stat().st_size
+            ):
+                parts = _split_csv_file(file_to_upload, part_size)
+                uploads += [(file_to_upload, part, i) for i, part in enumerate(parts)]
+            else:
+                uploads.append((file_to_upload, None, 0))
+
+        pending_uploads = [
+            (file_to_upload, part, part_no)
+            for file_to_upload, part, part_no in uploads
+            if manifest["uploaded"].get(_get_upload_key(file_to_upload, part, part_no))
+            != _get_upload_state(file_to_upload, part)
+        ]
+        if manifest_path is not None:
+            if len(pending_uploads) < len(uploads):
+                logger.info(
+                    f"Resuming the upload, skipping {len(uploads) - len(pending_uploads)} file(s) already uploaded"
+                )
+            _save_upload_manifest(manifest_path, manifest)
 
         # Initiate progress bar
-        t = tqdm(total=len(files), disable=not show_progress)
+        t = tqdm(
+            total=len(uploads),
+            initial=len(uploads) - len(pending_uploads),
+            disable=not show_progress,
+        )
 
-        for file_to_upload in files:
-            DataBlob._upload_to_s3_with_retry(
-                file_to_upload=file_to_upload,
-                presigned_url=response["presigned"]["url"],
-                presigned_fields=response["presigned"]["fields"],
-            )
-            t.update()
+        with create_session(
+            pool_connections=1, pool_maxsize=max_workers
+        ) as session, ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="airt-upload"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    DataBlob._upload_to_s3_with_retry,
+                    file_to_upload=file_to_upload,
+                    presigned_url=response["presigned"]["url"],
+                    presigned_fields=response["presigned"]["fields"],
+                    session=session,
+                    part=part,
+                    part_no=part_no,
+                ): (file_to_upload, part, part_no)
+                for file_to_upload, part, part_no in pending_uploads
+            }
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    t.update()
+                    if manifest_path is not None:
+                        _record_upload(manifest_path, manifest, *futures[future])
+            except BaseException:
+                # don't start uploading the remaining files if one of them failed
+                for future in futures:
+                    future.cancel()
+                if manifest_path is not None:
+                    # record the uploads completed in the meantime, so they are skipped when resuming
+                    for future, upload in futures.items():
+                        if not future.cancelled() and future.exception() is None:
+                            _record_upload(manifest_path, manifest, *upload)
+                raise
+            finally:
+                t.close()
+
+        if manifest_path is not None:
+            manifest_path.unlink()
 
-        t.close()
         return DataBlob(uuid=response["uuid"], type=response["type"])
 
     @staticmethod
@@ -742,7 +1102,8 @@ class DataBlob:
         limit: int = 100,
         disabled: bool = False,
         completed: bool = False,
-    ) -> List["DataBlob"]:
+        as_frame: bool = False,
+    ) -> Union[List["DataBlob"], pd.DataFrame]:
         """Return the list of DataBlob instances
 
         Args:
@@ -756,9 +1117,13 @@ class DataBlob:
             completed: If set to **True**, then only the datablobs that are successfully downloaded
                 to the server will be returned. Else, the default value **False** will be used to
                 return all the datablobs.
+            as_frame: If set to **True**, the datablobs are returned in a pandas dataframe built directly from the
+                server response, without creating an instance per datablob. The dataframe is the same as the
+                one returned by `DataBlob.as_df`. If not passed, then the default value **False** will be used.
 
         Returns:
-            A list of DataBlob instances available in the server.
+            A list of DataBlob instances available in the server, or a pandas dataframe with
+            their details if **as_frame** is set to **True**.
 
         Raises:
             ConnectionError: If the server address is invalid or not reachable.
@@ -767,6 +1132,9 @@ class DataBlob:
             relative_url=f"/datablob/?disabled={disabled}&completed={completed}&offset={offset}&limit={limit}"
         )
 
+        if as_frame:
+            return DataBlob._generate_df(lists)
+
         dbx = [
             DataBlob(
                 uuid=db["uuid"],
@@ -790,11 +1158,49 @@ class DataBlob:
         return dbx
 
     @staticmethod
-    def as_df(dbx: List["DataBlob"]) -> pd.DataFrame:
+    def iter_all(
+        page_size: int = 100,
+        disabled: bool = False,
+        completed: bool = False,
+        prefetch: Union[bool, int] = False,
+    ) -> Iterator["DataBlob"]:
+        """Iterate over all DataBlob instances available in the server.
+
+        Unlike `DataBlob.ls`, which returns a single page of datablobs, the datablobs are requested from the server page
+        by page while iterating, so all of them can be processed without building the whole list in memory.
+
+        Args:
+            page_size: The number of datablobs requested from the server at once. If not passed, then the default
+                value **100** will be used.
+            disabled: If set to **True**, then only the deleted datablobs will be returned. Else, the default value
+                **False** will be used to return only the active datablobs.
+            completed: If set to **True**, then only the datablobs that are successfully downloaded to the server will be
+                returned. Else, the default value **False** will be used to return all the datablobs.
+            prefetch: If set to **True**, the next page of datablobs is requested in the background while the current
+                page is being processed. If set to a number, that many of the next pages are requested
+                concurrently, which speeds up listing all the datablobs when the network latency dominates. If not
+                passed, then the default value **False** will be used.
+
+        Returns:
+            A generator of DataBlob instances available in the server.
+
+        Raises:
+            ConnectionError: If the server address is invalid or not reachable.
+        """
+        return iter_pages(
+            lambda offset, limit: DataBlob.ls(
+                offset=offset, limit=limit, disabled=disabled, completed=completed
+            ),
+            page_size=page_size,
+            prefetch=int(prefetch),
+        )
+
+    @staticmethod
+    def as_df(dbx: Iterable["DataBlob"]) -> pd.DataFrame:
         """Return the details of datablob instances as a pandas dataframe.
 
         Args:
-            dbx: List of datablob instances.
+            dbx: List of datablob instances, or an iterator of them such as the one returned by `DataBlob.iter_all`.
 
         Returns:
             Details of all the datablobs in a dataframe.
@@ -804,6 +1210,18 @@ class DataBlob:
         """
         db_lists = get_attributes_from_instances(dbx, DataBlob.ALL_DB_COLS)  # type: ignore
 
+        return DataBlob._generate_df(db_lists)
+
+    @staticmethod
+    def _generate_df(db_lists: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Generate the dataframe returned by `DataBlob.as_df` from the details of the datablobs.
+
+        Args:
+            db_lists: The details of the datablobs, either extracted from the instances or as returned by the server.
+
+        Returns:
+            Details of all the datablobs in a dataframe.
+        """
         for db in db_lists:
             db = DataBlob._get_tag_name_and_datasource_id(db)
 
@@ -832,7 +1250,12 @@ class DataBlob:
 
         return progress_status.is_ready()
 
-    def progress_bar(self, sleep_for: Union[int, float] = 5, timeout: int = 0):
+    def progress_bar(
+        self,
+        sleep_for: Union[int, float] = 5,
+        timeout: int = 0,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ):
         """Blocks the execution and displays a progress bar showing the remote action progress.
 
         !!! info
@@ -844,6 +1267,8 @@ class DataBlob:
             sleep_for: The time interval in seconds between successive API calls.
             timeout: The maximum time allowed in seconds for the asynchronous call to complete. If not the
                 progressbar will be terminated.
+            polling_strategy: The strategy deciding the time interval between successive API calls. If not
+                passed, the default polling strategy is used if set, else the **sleep_for** interval.
 
         Raises:
             ConnectionError: If the server address is invalid or not reachable.
@@ -854,11 +1279,17 @@ class DataBlob:
                 relative_url=f"/datablob/{self.uuid}",
                 sleep_for=sleep_for,
                 timeout=timeout,
+                polling_strategy=polling_strategy,
             )
 
             progress_status.progress_bar()
 
-    def wait(self, sleep_for: Union[int, float] = 1, timeout: int = 0):
+    def wait(
+        self,
+        sleep_for: Union[int, float] = 1,
+        timeout: int = 0,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ):
         """Blocks execution while waiting for the remote action to complete.
 
         !!! info
@@ -870,6 +1301,8 @@ class DataBlob:
             sleep_for: The time interval in seconds between successive API calls.
             timeout: The maximum time allowed in seconds for the asynchronous call to complete. If not the
                 progressbar will be terminated.
+            polling_strategy: The strategy deciding the time interval between successive API calls. If not
+                passed, the default polling strategy is used if set, else the **sleep_for** interval.
 
         Raises:
             ConnectionError: If the server address is invalid or not reachable.
@@ -880,6 +1313,7 @@ class DataBlob:
                 relative_url=f"/datablob/{self.uuid}",
                 sleep_for=sleep_for,
                 timeout=timeout,
+                polling_strategy=polling_strategy,
             )
 
             progress_status.wait()
@@ -905,7 +1339,7 @@ class DataBlob:
     def delete(self) -> pd.DataFrame:
         raise NotImplementedError()
 
-# %% ../../notebooks/API_DataBlob.ipynb 12
+# %% ../../notebooks/API_DataBlob.ipynb 14
 def _docstring_example():
     """
     Example:
@@ -944,6 +1378,11 @@ def _docstring_example():
         # logged-in user
         print(DataBlob.as_df(DataBlob.ls()))
 
+        # Iterate over all datablobs created by the currently logged-in
+        # user, requesting them from the server page by page
+        for datablob in DataBlob.iter_all():
+            print(datablob.uuid)
+
         # Create a datasource
         ds = db.to_datasource(
             file_type="{fill in file_type}",
@@ -966,15 +1405,16 @@ def _docstring_example():
     """
     pass
 
-# %% ../../notebooks/API_DataBlob.ipynb 14
+# %% ../../notebooks/API_DataBlob.ipynb 16
 add_example_to_docs(DataBlob, _docstring_example.__doc__)  # type: ignore
 add_example_to_docs(DataBlob.ls, _docstring_example.__doc__)  # type: ignore
+add_example_to_docs(DataBlob.iter_all, _docstring_example.__doc__)  # type: ignore
 add_example_to_docs(DataBlob.as_df, _docstring_example.__doc__)  # type: ignore
 add_example_to_docs(DataBlob.wait, _docstring_example.__doc__)  # type: ignore
 add_example_to_docs(DataBlob.is_ready, _docstring_example.__doc__)  # type: ignore
 add_example_to_docs(DataBlob.progress_bar, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_DataBlob.ipynb 15
+# %% ../../notebooks/API_DataBlob.ipynb 17
 @patch(cls_method=True)
 @contextmanager
 def set_default_cloud_provider(
@@ -1102,7 +1542,7 @@ def _get_cloud_provider_and_region(
 
     return ret_val_cloud_provider, region
 
-# %% ../../notebooks/API_DataBlob.ipynb 27
+# %% ../../notebooks/API_DataBlob.ipynb 29
 @patch
 def details(self: DataBlob) -> pd.DataFrame:
     """Return details of a datablob.
@@ -1114,7 +1554,7 @@ def details(self: DataBlob) -> pd.DataFrame:
         ConnectionError: If the server address is invalid or not reachable.
     """
 
-    details = Client._get_data(relative_url=f"/datablob/{self.uuid}")
+    details = Client._get_data(relative_url=f"/datablob/{self.uuid}", cache=True)
 
     details = DataBlob._get_tag_name_and_datasource_id(details)
 
@@ -1124,13 +1564,13 @@ def details(self: DataBlob) -> pd.DataFrame:
 
     return add_ready_column(details_df)
 
-# %% ../../notebooks/API_DataBlob.ipynb 28
+# %% ../../notebooks/API_DataBlob.ipynb 30
 add_example_to_docs(DataBlob.details, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_DataBlob.ipynb 29
+# %% ../../notebooks/API_DataBlob.ipynb 31
 DataBlob.details.__doc__ = DataBlob.details.__doc__ + f"\n    Columns in the resulting dataframe are: {', '.join(DataBlob.ALL_DB_COLS)}."  # type: ignore
 
-# %% ../../notebooks/API_DataBlob.ipynb 51
+# %% ../../notebooks/API_DataBlob.ipynb 65
 @patch
 def to_datasource(
     self: DataBlob,
@@ -1174,10 +1614,10 @@ def to_datasource(
 
     return DataSource(uuid=response["uuid"])
 
-# %% ../../notebooks/API_DataBlob.ipynb 52
+# %% ../../notebooks/API_DataBlob.ipynb 66
 add_example_to_docs(DataBlob.to_datasource, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_DataBlob.ipynb 55
+# %% ../../notebooks/API_DataBlob.ipynb 69
 @patch
 def tag(self: DataBlob, name: str) -> pd.DataFrame:
     """Tag an existing datablob in the server.
@@ -1194,6 +1634,7 @@ def tag(self: DataBlob, name: str) -> pd.DataFrame:
     response = Client._post_data(
         relative_url=f"/datablob/{self.uuid}/tag", json=dict(name=name)
     )
+    Client._invalidate_cache(relative_url=f"/datablob/{self.uuid}")
 
     response = DataBlob._get_tag_name_and_datasource_id(response)
 
@@ -1203,10 +1644,10 @@ def tag(self: DataBlob, name: str) -> pd.DataFrame:
 
     return add_ready_column(df)
 
-# %% ../../notebooks/API_DataBlob.ipynb 56
+# %% ../../notebooks/API_DataBlob.ipynb 70
 add_example_to_docs(DataBlob.tag, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_DataBlob.ipynb 58
+# %% ../../notebooks/API_DataBlob.ipynb 72
 @patch
 def delete(self: DataBlob) -> pd.DataFrame:
     """Delete a datablob from the server.
@@ -1219,6 +1660,7 @@ def delete(self: DataBlob) -> pd.DataFrame:
     """
 
     response = Client._delete_data(relative_url=f"/datablob/{self.uuid}")
+    Client._invalidate_cache(relative_url=f"/datablob/{self.uuid}")
 
     response = DataBlob._get_tag_name_and_datasource_id(response)
 
@@ -1228,5 +1670,5 @@ def delete(self: DataBlob) -> pd.DataFrame:
 
     return add_ready_column(df)
 
-# %% ../../notebooks/API_DataBlob.ipynb 59
+# %% ../../notebooks/API_DataBlob.ipynb 73
 add_example_to_docs(DataBlob.delete, _docstring_example.__doc__)  # type: ignore
@@ -17,7 +17,7 @@ from fastcore.foundation import patch
 
 from airt._components.client import Client
 from airt._components.model import Model
-from airt._components.progress_status import ProgressStatus
+from airt._components.progress_status import PollingStrategy, ProgressStatus
 from airt._helper import (
     add_example_to_docs,
     add_ready_column,
@@ -26,6 +26,7 @@ from airt._helper import (
     generate_df,
     get_data,
     get_values_from_item,
+    iter_pages,
     post_data,
 )
 from airt._logger import get_logger, set_level
@@ -139,7 +140,11 @@ class DataSource:
         Raises:
             ConnectionError: If the server address is invalid or not reachable.
         """
-        dtypes = Client._get_data(relative_url=f"/datasource/{self.uuid}/dtypes")
+        dtypes = Client._get_data(
+            relative_url=f"/datasource/{self.uuid}/dtypes",
+            resource_url=f"/datasource/{self.uuid}",
+            cache=True,
+        )
         return pd.DataFrame([dtypes])
 
     @staticmethod
@@ -148,7 +153,8 @@ class DataSource:
         limit: int = 100,
         disabled: bool = False,
         completed: bool = False,
-    ) -> List["DataSource"]:
+        as_frame: bool = False,
+    ) -> Union[List["DataSource"], pd.DataFrame]:
         """Return the list of `DataSource` instances available in server.
 
         Args:
@@ -162,9 +168,13 @@ class DataSource:
             completed: If set to **True**, then only the datasources that are successfully processed
                 in server will be returned. Else, the default value **False** will be used to
                 return all the datasources.
+            as_frame: If set to **True**, the datasources are returned in a pandas dataframe built directly from the
+                server response, without creating an instance per datasource. The dataframe is the same as the
+                one returned by `DataSource.as_df`. If not passed, then the default value **False** will be used.
 
         Returns:
-            A list of `DataSource` instances available in server.
+            A list of `DataSource` instances available in server, or a pandas dataframe with
+            their details if **as_frame** is set to **True**.
 
         Raises:
             ConnectionError: If the server address is invalid or not reachable.
@@ -173,6 +183,9 @@ class DataSource:
             relative_url=f"/datasource/?disabled={disabled}&completed={completed}&offset={offset}&limit={limit}"
         )
 
+        if as_frame:
+            return DataSource._generate_df(lists)
+
         dsx = [
             DataSource(
                 uuid=ds["uuid"],
@@ -197,11 +210,49 @@ class DataSource:
         return dsx
 
     @staticmethod
-    def as_df(dsx: List["DataSource"]) -> pd.DataFrame:
+    def iter_all(
+        page_size: int = 100,
+        disabled: bool = False,
+        completed: bool = False,
+        prefetch: Union[bool, int] = False,
+    ) -> Iterator["DataSource"]:
+        """Iterate over all DataSource instances available in the server.
+
+        Unlike `DataSource.ls`, which returns a single page of datasources, the datasources are requested from the server page
+        by page while iterating, so all of them can be processed without building the whole list in memory.
+
+        Args:
+            page_size: The number of datasources requested from the server at once. If not passed, then the default
+                value **100** will be used.
+            disabled: If set to **True**, then only the deleted datasources will be returned. Else, the default value
+                **False** will be used to return only the active datasources.
+            completed: If set to **True**, then only the datasources that are successfully processed will be
+                returned. Else, the default value **False** will be used to return all the datasources.
+            prefetch: If set to **True**, the next page of datasources is requested in the background while the current
+                page is being processed. If set to a number, that many of the next pages are requested
+                concurrently, which speeds up listing all the datasources when the network latency dominates. If not
+                passed, then the default value **False** will be used.
+
+        Returns:
+            A generator of DataSource instances available in the server.
+
+        Raises:
+            ConnectionError: If the server address is invalid or not reachable.
+        """
+        return iter_pages(
+            lambda offset, limit: DataSource.ls(
+                offset=offset, limit=limit, disabled=disabled, completed=completed
+            ),
+            page_size=page_size,
+            prefetch=int(prefetch),
+        )
+
+    @staticmethod
+    def as_df(dsx: Iterable["DataSource"]) -> pd.DataFrame:
         """Return the details of `DataSource` instances as a pandas dataframe.
 
         Args:
-            dsx: List of `DataSource` instances.
+            dsx: List of `DataSource` instances, or an iterator of them such as the one returned by `DataSource.iter_all`.
 
         Returns:
             Details of the datasources in a dataframe.
@@ -212,6 +263,18 @@ class DataSource:
 
         ds_lists = [{i: getattr(ds, i) for i in DataSource.ALL_DS_COLS} for ds in dsx]
 
+        return DataSource._generate_df(ds_lists)
+
+    @staticmethod
+    def _generate_df(ds_lists: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Generate the dataframe returned by `DataSource.as_df` from the details of the datasources.
+
+        Args:
+            ds_lists: The details of the datasources, either extracted from the instances or as returned by the server.
+
+        Returns:
+            Details of all the datasources in a dataframe.
+        """
         for ds in ds_lists:
             ds["tags"] = get_values_from_item(ds["tags"], "name")
 
@@ -225,10 +288,20 @@ class DataSource:
     def is_ready(self):
         raise NotImplementedError()
 
-    def progress_bar(self, sleep_for: Union[int, float] = 5, timeout: int = 0):
+    def progress_bar(
+        self,
+        sleep_for: Union[int, float] = 5,
+        timeout: int = 0,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ):
         raise NotImplementedError()
 
-    def wait(self, sleep_for: Union[int, float] = 1, timeout: int = 0):
+    def wait(
+        self,
+        sleep_for: Union[int, float] = 1,
+        timeout: int = 0,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ):
         raise NotImplementedError()
 
     def delete(self) -> pd.DataFrame:
@@ -307,6 +380,11 @@ def _docstring_example():
         # logged-in user
         print(DataSource.as_df(DataSource.ls()))
 
+        # Iterate over all datasources created by the currently logged-in
+        # user, requesting them from the server page by page
+        for datasource in DataSource.iter_all():
+            print(datasource.uuid)
+
         # Display the first few records of the datasource
         print(ds.head())
 
@@ -339,6 +417,7 @@ def _docstring_example():
 add_example_to_docs(DataSource, _docstring_example.__doc__)  # type: ignore
 add_example_to_docs(DataSource.dtypes, _docstring_example.__doc__)  # type: ignore
 add_example_to_docs(DataSource.ls, _docstring_example.__doc__)  # type: ignore
+add_example_to_docs(DataSource.iter_all, _docstring_example.__doc__)  # type: ignore
 add_example_to_docs(DataSource.as_df, _docstring_example.__doc__)  # type: ignore
 
 # %% ../../notebooks/API_DataSource.ipynb 15
@@ -360,20 +439,30 @@ add_example_to_docs(DataSource.is_ready, _docstring_example.__doc__)  # type: ig
 
 # %% ../../notebooks/API_DataSource.ipynb 18
 @patch
-def progress_bar(self: DataSource, sleep_for: Union[int, float] = 5, timeout: int = 0):
+def progress_bar(
+    self: DataSource,
+    sleep_for: Union[int, float] = 5,
+    timeout: int = 0,
+    polling_strategy: Optional[PollingStrategy] = None,
+):
     """Blocks the execution and displays a progress bar showing the remote action progress.
 
     Args:
         sleep_for: The time interval in seconds between successive API calls.
         timeout: The maximum time allowed in seconds for the asynchronous call to complete. If not the
             progressbar will be terminated.
+        polling_strategy: The strategy deciding the time interval between successive API calls. If not
+            passed, the default polling strategy is used if set, else the **sleep_for** interval.
 
     Raises:
         ConnectionError: If the server address is invalid or not reachable.
         TimeoutError: in case of connection timeout.
     """
     progress_status = ProgressStatus(
-        relative_url=f"/datasource/{self.uuid}", sleep_for=sleep_for, timeout=timeout
+        relative_url=f"/datasource/{self.uuid}",
+        sleep_for=sleep_for,
+        timeout=timeout,
+        polling_strategy=polling_strategy,
     )
 
     progress_status.progress_bar()
@@ -383,13 +472,20 @@ add_example_to_docs(DataSource.progress_bar, _docstring_example.__doc__)  # type
 
 # %% ../../notebooks/API_DataSource.ipynb 20
 @patch
-def wait(self: DataSource, sleep_for: Union[int, float] = 1, timeout: int = 0):
+def wait(
+    self: DataSource,
+    sleep_for: Union[int, float] = 1,
+    timeout: int = 0,
+    polling_strategy: Optional[PollingStrategy] = None,
+):
     """Blocks execution while waiting for the remote action to complete.
 
     Args:
         sleep_for: The time interval in seconds between successive API calls.
         timeout: The maximum time allowed in seconds for the asynchronous call to complete. If not the
             progressbar will be terminated.
+        polling_strategy: The strategy deciding the time interval between successive API calls. If not
+            passed, the default polling strategy is used if set, else the **sleep_for** interval.
 
     Raises:
         ConnectionError: If the server address is invalid or not reachable.
@@ -397,7 +493,10 @@ def wait(self: DataSource, sleep_for: Union[int, float] = 1, timeout: int = 0):
     """
 
     progress_status = ProgressStatus(
-        relative_url=f"/datasource/{self.uuid}", sleep_for=sleep_for, timeout=timeout
+        relative_url=f"/datasource/{self.uuid}",
+        sleep_for=sleep_for,
+        timeout=timeout,
+        polling_strategy=polling_strategy,
     )
 
     progress_status.wait()
@@ -405,7 +504,7 @@ def wait(self: DataSource, sleep_for: Union[int, float] = 1, timeout: int = 0):
 # %% ../../notebooks/API_DataSource.ipynb 21
 add_example_to_docs(DataSource.wait, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_DataSource.ipynb 27
+# %% ../../notebooks/API_DataSource.ipynb 29
 @patch
 def delete(self: DataSource) -> pd.DataFrame:
     """Delete a datasource from the server.
@@ -418,6 +517,7 @@ def delete(self: DataSource) -> pd.DataFrame:
     """
 
     response = Client._delete_data(relative_url=f"/datasource/{self.uuid}")
+    Client._invalidate_cache(relative_url=f"/datasource/{self.uuid}")
 
     response["tags"] = get_values_from_item(response["tags"], "name")
 
@@ -427,10 +527,10 @@ def delete(self: DataSource) -> pd.DataFrame:
 
     return add_ready_column(df)
 
-# %% ../../notebooks/API_DataSource.ipynb 28
+# %% ../../notebooks/API_DataSource.ipynb 30
 add_example_to_docs(DataSource.delete, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_DataSource.ipynb 31
+# %% ../../notebooks/API_DataSource.ipynb 33
 @patch
 def details(self: DataSource) -> pd.DataFrame:
     """Return details of a datasource.
@@ -442,7 +542,7 @@ def details(self: DataSource) -> pd.DataFrame:
         ConnectionError: If the server address is invalid or not reachable.
     """
 
-    response = Client._get_data(relative_url=f"/datasource/{self.uuid}")
+    response = Client._get_data(relative_url=f"/datasource/{self.uuid}", cache=True)
 
     response["tags"] = get_values_from_item(response["tags"], "name")
 
@@ -452,10 +552,10 @@ def details(self: DataSource) -> pd.DataFrame:
 
     return add_ready_column(df)
 
-# %% ../../notebooks/API_DataSource.ipynb 32
+# %% ../../notebooks/API_DataSource.ipynb 34
 add_example_to_docs(DataSource.details, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_DataSource.ipynb 34
+# %% ../../notebooks/API_DataSource.ipynb 36
 @patch
 def tag(self: DataSource, name: str) -> pd.DataFrame:
     """Tag an existing datasource in server.
@@ -472,6 +572,7 @@ def tag(self: DataSource, name: str) -> pd.DataFrame:
     response = Client._post_data(
         relative_url=f"/datasource/{self.uuid}/tag", json=dict(name=name)
     )
+    Client._invalidate_cache(relative_url=f"/datasource/{self.uuid}")
 
     response["tags"] = get_values_from_item(response["tags"], "name")
 
@@ -480,10 +581,10 @@ def tag(self: DataSource, name: str) -> pd.DataFrame:
 
     return add_ready_column(df)
 
-# %% ../../notebooks/API_DataSource.ipynb 35
+# %% ../../notebooks/API_DataSource.ipynb 37
 add_example_to_docs(DataSource.tag, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_DataSource.ipynb 37
+# %% ../../notebooks/API_DataSource.ipynb 39
 @patch
 def head(self: DataSource) -> pd.DataFrame:
     """Return the first few rows of the datasource.
@@ -494,15 +595,19 @@ def head(self: DataSource) -> pd.DataFrame:
     Raises:
         ConnectionError: If the server address is invalid or not reachable.
     """
-    response = Client._get_data(relative_url=f"/datasource/{self.uuid}/head")
+    response = Client._get_data(
+        relative_url=f"/datasource/{self.uuid}/head",
+        resource_url=f"/datasource/{self.uuid}",
+        cache=True,
+    )
     df = dict_to_df(response)
 
     return df
 
-# %% ../../notebooks/API_DataSource.ipynb 38
+# %% ../../notebooks/API_DataSource.ipynb 40
 add_example_to_docs(DataSource.head, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_DataSource.ipynb 40
+# %% ../../notebooks/API_DataSource.ipynb 42
 @patch
 def train(
     self: DataSource,
@@ -553,5 +658,5 @@ def train(
 
     return Model(uuid=response["uuid"])
 
-# %% ../../notebooks/API_DataSource.ipynb 41
+# %% ../../notebooks/API_DataSource.ipynb 43
 add_example_to_docs(DataSource.train, _docstring_example.__doc__)  # type: ignore
@@ -22,6 +22,7 @@ from airt._helper import (
     generate_df,
     get_attributes_from_instances,
     get_data,
+    iter_pages,
     post_data,
 )
 from airt._logger import get_logger, set_level
@@ -142,7 +143,8 @@ class Model(ProgressStatus):
         limit: int = 100,
         disabled: bool = False,
         completed: bool = False,
-    ) -> List["Model"]:
+        as_frame: bool = False,
+    ) -> Union[List["Model"], pd.DataFrame]:
         """Return the list of Model instances available in the server.
 
         Args:
@@ -153,9 +155,13 @@ class Model(ProgressStatus):
                 **False** will be used to return only the list of active models.
             completed: If set to **True**, then only the models that are successfully processed in server will be returned.
                 Else, the default value **False** will be used to return all the models.
+            as_frame: If set to **True**, the models are returned in a pandas dataframe built directly from the
+                server response, without creating an instance per model. The dataframe is the same as the
+                one returned by `Model.as_df`. If not passed, then the default value **False** will be used.
 
         Returns:
-            A list of Model instances available in the server.
+            A list of Model instances available in the server, or a pandas dataframe with
+            their details if **as_frame** is set to **True**.
 
         Raises:
             ConnectionError: If the server address is invalid or not reachable.
@@ -164,6 +170,9 @@ class Model(ProgressStatus):
             relative_url=f"/model/?disabled={disabled}&completed={completed}&offset={offset}&limit={limit}"
         )
 
+        if as_frame:
+            return Model._generate_df(lists)
+
         mx = [
             Model(
                 uuid=model["uuid"],
@@ -188,11 +197,49 @@ class Model(ProgressStatus):
         return mx
 
     @staticmethod
-    def as_df(mx: List["Model"]) -> pd.DataFrame:
+    def iter_all(
+        page_size: int = 100,
+        disabled: bool = False,
+        completed: bool = False,
+        prefetch: Union[bool, int] = False,
+    ) -> Iterator["Model"]:
+        """Iterate over all Model instances available in the server.
+
+        Unlike `Model.ls`, which returns a single page of models, the models are requested from the server page
+        by page while iterating, so all of them can be processed without building the whole list in memory.
+
+        Args:
+            page_size: The number of models requested from the server at once. If not passed, then the default
+                value **100** will be used.
+            disabled: If set to **True**, then only the deleted models will be returned. Else, the default value
+                **False** will be used to return only the active models.
+            completed: If set to **True**, then only the models that are successfully trained will be
+                returned. Else, the default value **False** will be used to return all the models.
+            prefetch: If set to **True**, the next page of models is requested in the background while the current
+                page is being processed. If set to a number, that many of the next pages are requested
+                concurrently, which speeds up listing all the models when the network latency dominates. If not
+                passed, then the default value **False** will be used.
+
+        Returns:
+            A generator of Model instances available in the server.
+
+        Raises:
+            ConnectionError: If the server address is invalid or not reachable.
+        """
+        return iter_pages(
+            lambda offset, limit: Model.ls(
+                offset=offset, limit=limit, disabled=disabled, completed=completed
+            ),
+            page_size=page_size,
+            prefetch=int(prefetch),
+        )
+
+    @staticmethod
+    def as_df(mx: Iterable["Model"]) -> pd.DataFrame:
         """Return the details of Model instances as a pandas dataframe.
 
         Args:
-            mx: List of Model instances.
+            mx: List of Model instances, or an iterator of them such as the one returned by `Model.iter_all`.
 
         Returns:
             Details of all the models in a dataframe.
@@ -202,6 +249,18 @@ class Model(ProgressStatus):
         """
         model_lists = get_attributes_from_instances(mx, Model.BASIC_MODEL_COLS)  # type: ignore
 
+        return Model._generate_df(model_lists)
+
+    @staticmethod
+    def _generate_df(model_lists: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Generate the dataframe returned by `Model.as_df` from the details of the models.
+
+        Args:
+            model_lists: The details of the models, either extracted from the instances or as returned by the server.
+
+        Returns:
+            Details of all the models in a dataframe.
+        """
         df = generate_df(model_lists, Model.BASIC_MODEL_COLS)
 
         df = df.rename(columns=Model.COLS_TO_RENAME)
@@ -278,6 +337,11 @@ def _docstring_example():
         # logged-in user
         print(Model.as_df(Model.ls()))
 
+        # Iterate over all models created by the currently logged-in
+        # user, requesting them from the server page by page
+        for m in Model.iter_all():
+            print(m.uuid)
+
         # Evaluate the newly created model
         print(model.evaluate())
 
@@ -299,9 +363,10 @@ def _docstring_example():
 # %% ../../notebooks/API_Model.ipynb 13
 add_example_to_docs(Model, _docstring_example.__doc__)  # type: ignore
 add_example_to_docs(Model.ls, _docstring_example.__doc__)  # type: ignore
+add_example_to_docs(Model.iter_all, _docstring_example.__doc__)  # type: ignore
 add_example_to_docs(Model.as_df, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_Model.ipynb 18
+# %% ../../notebooks/API_Model.ipynb 20
 @patch
 def details(self: Model) -> pd.DataFrame:
     """Return the details of a model.
@@ -313,7 +378,7 @@ def details(self: Model) -> pd.DataFrame:
         ConnectionError: If the server address is invalid or not reachable.
     """
 
-    response = Client._get_data(relative_url=f"/model/{self.uuid}")
+    response = Client._get_data(relative_url=f"/model/{self.uuid}", cache=True)
 
     df = pd.DataFrame(response, index=[0])[Model.ALL_MODEL_COLS]
 
@@ -321,10 +386,10 @@ def details(self: Model) -> pd.DataFrame:
 
     return add_ready_column(df)
 
-# %% ../../notebooks/API_Model.ipynb 19
+# %% ../../notebooks/API_Model.ipynb 21
 add_example_to_docs(Model.details, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_Model.ipynb 22
+# %% ../../notebooks/API_Model.ipynb 24
 @patch
 def delete(self: Model) -> pd.DataFrame:
     """Delete a model from the server.
@@ -337,6 +402,7 @@ def delete(self: Model) -> pd.DataFrame:
     """
 
     response = Client._delete_data(relative_url=f"/model/{self.uuid}")
+    Client._invalidate_cache(relative_url=f"/model/{self.uuid}")
 
     df = pd.DataFrame(response, index=[0])[Model.BASIC_MODEL_COLS]
 
@@ -344,10 +410,10 @@ def delete(self: Model) -> pd.DataFrame:
 
     return add_ready_column(df)
 
-# %% ../../notebooks/API_Model.ipynb 23
+# %% ../../notebooks/API_Model.ipynb 25
 add_example_to_docs(Model.delete, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_Model.ipynb 25
+# %% ../../notebooks/API_Model.ipynb 27
 @patch
 def evaluate(self: Model) -> pd.DataFrame:
     """Return the evaluation metrics of the trained model.
@@ -361,13 +427,17 @@ def evaluate(self: Model) -> pd.DataFrame:
     Raises:
         ConnectionError: If the server address is invalid or not reachable.
     """
-    model_evaluate = Client._get_data(relative_url=f"/model/{self.uuid}/evaluate")
+    model_evaluate = Client._get_artifact(
+        relative_url=f"/model/{self.uuid}/evaluate",
+        resource_url=f"/model/{self.uuid}",
+        cache=True,
+    )
     return pd.DataFrame(dict(model_evaluate), index=[0]).T.rename(columns={0: "eval"})
 
-# %% ../../notebooks/API_Model.ipynb 26
+# %% ../../notebooks/API_Model.ipynb 28
 add_example_to_docs(Model.evaluate, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_Model.ipynb 28
+# %% ../../notebooks/API_Model.ipynb 30
 @patch
 def predict(self: Model, data_uuid: Optional[int] = 0) -> Prediction:
     """Run predictions against the trained model.
@@ -394,5 +464,5 @@ def predict(self: Model, data_uuid: Optional[int] = 0) -> Prediction:
 
     return Prediction(uuid=response["uuid"], datasource=response["datasource"])
 
-# %% ../../notebooks/API_Model.ipynb 29
+# %% ../../notebooks/API_Model.ipynb 31
 add_example_to_docs(Model.predict, _docstring_example.__doc__)  # type: ignore
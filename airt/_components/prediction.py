@@ -7,8 +7,13 @@ __all__ = ['Prediction']
 from typing import *
 
 # %% ../../notebooks/API_Prediction.ipynb 5
+import hashlib
+import heapq
+import itertools
 import os
+import tempfile
 import textwrap
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import pandas as pd
@@ -22,10 +27,12 @@ from airt._constant import CLIENT_DB_PASSWORD, CLIENT_DB_USERNAME
 from airt._helper import (
     add_example_to_docs,
     add_ready_column,
+    create_session,
     delete_data,
     generate_df,
     get_attributes_from_instances,
     get_data,
+    iter_pages,
     post_data,
 )
 from airt._logger import get_logger, set_level
@@ -33,7 +40,131 @@ from airt._logger import get_logger, set_level
 # %% ../../notebooks/API_Prediction.ipynb 7
 logger = get_logger(__name__)
 
-# %% ../../notebooks/API_Prediction.ipynb 10
+# %% ../../notebooks/API_Prediction.ipynb 8
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _get_download_tmp_path(path: Path) -> Path:
+    """Return the path of the temporary file the file is downloaded to before being renamed to its final name."""
+    return path.with_name(f".{path.name}.download")
+
+
+def _get_download_etag_path(path: Path) -> Path:
+    """Return the path of the file storing the ETag of the partially downloaded file, used for resuming the download."""
+    return path.with_name(f".{path.name}.download.etag")
+
+
+def _get_file_md5(path: Path) -> Any:
+    """Return the MD5 hash object of the file content, reading the file in chunks of `DOWNLOAD_CHUNK_SIZE` bytes."""
+    md5 = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            md5.update(chunk)
+
+    return md5
+
+
+def _write_response_to_file(
+    response: requests.Response, path: Path, resume: bool = False
+) -> str:
+    """Write the streamed response body to the file in chunks of `DOWNLOAD_CHUNK_SIZE` bytes.
+
+    Args:
+        response: A response of a request sent with the **stream** flag set.
+        path: Path of the file to write the body to. If the download is interrupted, the part of the body received
+            so far is kept in the file, so the download can be resumed.
+        resume: If set to **True**, the body is appended to the partially downloaded file.
+
+    Returns:
+        The MD5 checksum of the whole file.
+    """
+    md5 = _get_file_md5(path) if resume else hashlib.md5()
+    with open(path, "ab" if resume else "wb") as f:
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+            md5.update(chunk)
+
+    return md5.hexdigest()
+
+
+def _get_md5_from_etag(etag: Optional[str]) -> Optional[str]:
+    """Return the MD5 checksum from the ETag header or None if the ETag is not an MD5 checksum of the content.
+
+    The ETag of a multipart uploaded S3 object is suffixed by the number of parts and is not the checksum of the
+    file content.
+    """
+    if etag is None:
+        return None
+
+    etag = etag.strip('"').lower()
+    if len(etag) != 32 or any(c not in "0123456789abcdef" for c in etag):
+        return None
+
+    return etag
+
+
+def _get_md5_from_response(response: requests.Response) -> Optional[str]:
+    """Return the MD5 checksum of the remote file from the ETag of the response or None if the ETag is not one.
+
+    The ETag of an S3 object encrypted with SSE-KMS or SSE-C is not the checksum of its content either, even though
+    it looks like one, so the encryption headers of the response are checked as well.
+    """
+    if (
+        response.headers.get("x-amz-server-side-encryption", "").startswith("aws:kms")
+        or "x-amz-server-side-encryption-customer-algorithm" in response.headers
+    ):
+        return None
+
+    return _get_md5_from_etag(response.headers.get("ETag"))
+
+
+def _get_remote_file_size(response: requests.Response) -> Optional[int]:
+    """Return the size of the remote file from the Content-Range header or, for a full response, the Content-Length."""
+    if response.status_code in (206, 416):
+        _, _, size = response.headers.get("Content-Range", "").rpartition("/")
+    else:
+        size = response.headers.get("Content-Length", "")
+
+    return int(size) if size.isdigit() else None
+
+
+def _is_remote_file_changed(response: requests.Response, etag: str) -> bool:
+    """Check if the remote file changed since it was partially downloaded with the given ETag.
+
+    The servers honoring the If-Match header refuse the range request with 412 Precondition Failed, while the ones
+    ignoring it, such as the S3 presigned URLs, return a different ETag along with the range.
+    """
+    return response.status_code == 412 or (
+        response.status_code in (206, 416)
+        and response.headers.get("ETag", etag) != etag
+    )
+
+
+def _is_file_downloaded(
+    requester: Any, url: str, path: Path, verify_checksum: bool
+) -> bool:
+    """Check if the local file matches the remote file.
+
+    Only the first byte of the remote file is requested to get its size and ETag. The local file matches if it has
+    the same size and, if **verify_checksum** is set and the ETag is an MD5 checksum, the same checksum. The first
+    byte of an empty remote file can't be requested, so it matches an empty local file.
+    """
+    with requester.get(url, stream=True, headers={"Range": "bytes=0-0"}) as response:
+        if response.status_code == 416:
+            return path.stat().st_size == 0
+        response.raise_for_status()
+        size = _get_remote_file_size(response)
+        expected_checksum = _get_md5_from_response(response)
+
+    if size != path.stat().st_size:
+        return False
+
+    if verify_checksum and expected_checksum is not None:
+        return _get_file_md5(path).hexdigest() == expected_checksum
+
+    return True
+
+# %% ../../notebooks/API_Prediction.ipynb 12
 class Prediction(ProgressStatus):
     """A class to manage and download the predictions.
 
@@ -111,28 +242,122 @@ class Prediction(ProgressStatus):
 
     @staticmethod
     def _download_prediction_file_to_local(
-        file_name: str, url: str, path: Union[str, Path]
+        file_name: str,
+        url: str,
+        path: Union[str, Path],
+        session: Optional[requests.Session] = None,
+        verify_checksum: bool = False,
+        cache_key: Optional[Tuple[str, str]] = None,
     ) -> None:
         """Download the file to local directory.
 
+        The file is streamed in chunks into a temporary file which is renamed to **file_name** once the download
+        completes, so the memory used does not depend on the file size and an interrupted download never leaves
+        a truncated file behind. The temporary file of an interrupted download is kept and the download is resumed
+        from where it stopped using an HTTP Range request, unless the remote file changed in the meantime, in which
+        case it is downloaded again from the start. If the
+        file was already downloaded, it is downloaded again only if it doesn't match the remote file. If **cache_key**
+        is passed and the disk cache is enabled by `Client.enable_disk_cache`, the file is copied from the disk cache
+        if stored in it, else the downloaded file is stored in it.
+
         Args:
             file_name: Name of the file
             url: Url of the file
             path: Local directory path
+            session: Session to reuse the connections from, if not passed a new connection is opened
+            verify_checksum: If set to **True**, the MD5 checksum of the downloaded file is compared to the ETag
+                returned along with the file. The files whose ETag is not an MD5 checksum, e.g. the ones uploaded in
+                multiple parts or encrypted with SSE-KMS, are verified by their size only.
+            cache_key: The resource the file belongs to and the key of the file in the disk cache, if not passed the
+                disk cache is not used
 
         Raises:
             HTTPError: If the **url** is invalid or not reachable.
+            ValueError: If **verify_checksum** is set and the checksum or the size of the downloaded file doesn't match.
         """
+        requester = session if session is not None else requests
+        file_path = Path(path) / file_name
+        tmp_path = _get_download_tmp_path(file_path)
+        etag_path = _get_download_etag_path(file_path)
+        disk_cache = Client._disk_cache if cache_key is not None else None
         try:
-            response = requests.get(url)
-            response.raise_for_status()
+            if file_path.exists() and _is_file_downloaded(
+                requester, url, file_path, verify_checksum
+            ):
+                return
+
+            if disk_cache is not None and disk_cache.copy_to(*cache_key, tmp_path):  # type: ignore
+                if etag_path.exists():
+                    etag_path.unlink()
+                os.replace(tmp_path, file_path)
+                return
+
+            while True:
+                headers = {}
+                if tmp_path.exists() and etag_path.exists():
+                    headers = {
+                        "Range": f"bytes={tmp_path.stat().st_size}-",
+                        "If-Match": etag_path.read_text(),
+                    }
+
+                with requester.get(url, stream=True, headers=headers) as response:
+                    if headers and _is_remote_file_changed(
+                        response, headers["If-Match"]
+                    ):
+                        # the partially downloaded file is discarded and the whole file is requested again
+                        tmp_path.unlink()
+                        etag_path.unlink()
+                        continue
+
+                    etag = response.headers.get("ETag", headers.get("If-Match"))
+                    expected_checksum = _get_md5_from_response(response)
+                    expected_size = _get_remote_file_size(response)
+                    if response.status_code == 416:
+                        # the partially downloaded file is already complete
+                        checksum = _get_file_md5(tmp_path).hexdigest()
+                    else:
+                        response.raise_for_status()
+                        if response.status_code != 206:
+                            if etag is not None:
+                                etag_path.write_text(etag)
+                            elif etag_path.exists():
+                                etag_path.unlink()
+
+                        checksum = _write_response_to_file(
+                            response, tmp_path, resume=response.status_code == 206
+                        )
+                break
 
         except requests.exceptions.HTTPError as e:
             raise requests.exceptions.HTTPError(e)
 
         else:
-            with open(Path(path) / file_name, "wb") as f:
-                f.write(response.content)
+            if etag_path.exists():
+                etag_path.unlink()
+
+            if (
+                verify_checksum
+                and expected_checksum is not None
+                and checksum != expected_checksum
+            ):
+                tmp_path.unlink()
+                raise ValueError(
+                    f"The checksum of the downloaded file {file_name} ({checksum}) doesn't match the ETag ({expected_checksum})"
+                )
+            size = tmp_path.stat().st_size
+            if (
+                verify_checksum
+                and expected_checksum is None
+                and expected_size is not None
+                and size != expected_size
+            ):
+                tmp_path.unlink()
+                raise ValueError(
+                    f"The size of the downloaded file {file_name} ({size}) doesn't match the remote file ({expected_size})"
+                )
+            os.replace(tmp_path, file_path)
+            if disk_cache is not None:
+                disk_cache.write_file(*cache_key, file_path)  # type: ignore
 
     @staticmethod
     def ls(
@@ -140,7 +365,8 @@ class Prediction(ProgressStatus):
         limit: int = 100,
         disabled: bool = False,
         completed: bool = False,
-    ) -> List["Prediction"]:
+        as_frame: bool = False,
+    ) -> Union[List["Prediction"], pd.DataFrame]:
         """Return the list of Prediction instances available in the server.
 
         Args:
@@ -151,9 +377,13 @@ class Prediction(ProgressStatus):
                 **False** will be used to return only the list of active predictions.
             completed: If set to **True**, then only the predictions that are successfully processed in server will be returned.
                 Else, the default value **False** will be used to return all the predictions.
+            as_frame: If set to **True**, the predictions are returned in a pandas dataframe built directly from the
+                server response, without creating an instance per prediction. The dataframe is the same as the
+                one returned by `Prediction.as_df`. If not passed, then the default value **False** will be used.
 
         Returns:
-            A list of Prediction instances available in the server.
+            A list of Prediction instances available in the server, or a pandas dataframe with
+            their details if **as_frame** is set to **True**.
 
         Raises:
             ConnectionError: If the server address is invalid or not reachable.
@@ -162,6 +392,9 @@ class Prediction(ProgressStatus):
             relative_url=f"/prediction/?disabled={disabled}&completed={completed}&offset={offset}&limit={limit}"
         )
 
+        if as_frame:
+            return Prediction._generate_df(lists)
+
         predx = [
             Prediction(
                 uuid=pred["uuid"],
@@ -181,11 +414,49 @@ class Prediction(ProgressStatus):
         return predx
 
     @staticmethod
-    def as_df(predx: List["Prediction"]) -> pd.DataFrame:
+    def iter_all(
+        page_size: int = 100,
+        disabled: bool = False,
+        completed: bool = False,
+        prefetch: Union[bool, int] = False,
+    ) -> Iterator["Prediction"]:
+        """Iterate over all Prediction instances available in the server.
+
+        Unlike `Prediction.ls`, which returns a single page of predictions, the predictions are requested from the server page
+        by page while iterating, so all of them can be processed without building the whole list in memory.
+
+        Args:
+            page_size: The number of predictions requested from the server at once. If not passed, then the default
+                value **100** will be used.
+            disabled: If set to **True**, then only the deleted predictions will be returned. Else, the default value
+                **False** will be used to return only the active predictions.
+            completed: If set to **True**, then only the predictions that are successfully completed will be
+                returned. Else, the default value **False** will be used to return all the predictions.
+            prefetch: If set to **True**, the next page of predictions is requested in the background while the current
+                page is being processed. If set to a number, that many of the next pages are requested
+                concurrently, which speeds up listing all the predictions when the network latency dominates. If not
+                passed, then the default value **False** will be used.
+
+        Returns:
+            A generator of Prediction instances available in the server.
+
+        Raises:
+            ConnectionError: If the server address is invalid or not reachable.
+        """
+        return iter_pages(
+            lambda offset, limit: Prediction.ls(
+                offset=offset, limit=limit, disabled=disabled, completed=completed
+            ),
+            page_size=page_size,
+            prefetch=int(prefetch),
+        )
+
+    @staticmethod
+    def as_df(predx: Iterable["Prediction"]) -> pd.DataFrame:
         """Return the details of prediction instances as a pandas dataframe.
 
         Args:
-            predx: List of prediction instances.
+            predx: List of prediction instances, or an iterator of them such as the one returned by `Prediction.iter_all`.
 
         Returns:
             Details of all the prediction in a dataframe.
@@ -195,6 +466,18 @@ class Prediction(ProgressStatus):
         """
         response = get_attributes_from_instances(predx, Prediction.BASIC_PRED_COLS)  # type: ignore
 
+        return Prediction._generate_df(response)
+
+    @staticmethod
+    def _generate_df(response: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Generate the dataframe returned by `Prediction.as_df` from the details of the predictions.
+
+        Args:
+            response: The details of the predictions, either extracted from the instances or as returned by the server.
+
+        Returns:
+            Details of all the predictions in a dataframe.
+        """
         df = generate_df(response, Prediction.BASIC_PRED_COLS)
 
         df = df.rename(columns=Prediction.COLS_TO_RENAME)
@@ -210,6 +493,19 @@ class Prediction(ProgressStatus):
     def delete(self) -> pd.DataFrame:
         raise NotImplementedError()
 
+    def iter_batches(
+        self,
+        batch_size: int = 100_000,
+        as_arrow: bool = False,
+    ) -> Iterator[Any]:
+        raise NotImplementedError()
+
+    def top_k(self, k: int, batch_size: int = 100_000) -> pd.DataFrame:
+        raise NotImplementedError()
+
+    def above(self, score: float, batch_size: int = 100_000) -> pd.DataFrame:
+        raise NotImplementedError()
+
     def to_s3(
         self,
         uri: str,
@@ -229,6 +525,8 @@ class Prediction(ProgressStatus):
         self,
         path: Union[str, Path],
         show_progress: Optional[bool] = True,
+        max_workers: int = 4,
+        verify_checksum: bool = False,
     ) -> None:
         raise NotImplementedError()
 
@@ -257,7 +555,7 @@ class Prediction(ProgressStatus):
     ) -> ProgressStatus:
         raise NotImplementedError()
 
-# %% ../../notebooks/API_Prediction.ipynb 11
+# %% ../../notebooks/API_Prediction.ipynb 13
 def _docstring_example():
     """
     Example:
@@ -327,9 +625,24 @@ def _docstring_example():
         df = Prediction.as_df(predx)
         print(df)
 
+        # Iterate over all prediction instances created by the currently logged-in
+        # user, requesting them from the server page by page
+        for pred in Prediction.iter_all():
+            print(pred.uuid)
+
         # Display the prediction results in a pandas DataFrame
         print(prediction.to_pandas())
 
+        # Process the prediction results in batches of at most 10,000 rows
+        for batch in prediction.iter_batches(batch_size=10_000):
+            print(batch.shape)
+
+        # Display the 10 predictions with the highest scores
+        print(prediction.top_k(10))
+
+        # Display the predictions with a score above 0.9
+        print(prediction.above(0.9))
+
         # Push the prediction results to an AWS S3 bucket
         s3_status = prediction.to_s3(uri="{fill in s3_target_uri}")
 
@@ -395,12 +708,13 @@ def _docstring_example():
     """
     pass
 
-# %% ../../notebooks/API_Prediction.ipynb 13
+# %% ../../notebooks/API_Prediction.ipynb 15
 add_example_to_docs(Prediction, _docstring_example.__doc__)  # type: ignore
 add_example_to_docs(Prediction.ls, _docstring_example.__doc__)  # type: ignore
+add_example_to_docs(Prediction.iter_all, _docstring_example.__doc__)  # type: ignore
 add_example_to_docs(Prediction.as_df, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_Prediction.ipynb 17
+# %% ../../notebooks/API_Prediction.ipynb 20
 @patch
 def details(self: Prediction) -> pd.DataFrame:
     """Return the details of a prediction.
@@ -419,10 +733,10 @@ def details(self: Prediction) -> pd.DataFrame:
 
     return add_ready_column(df)
 
-# %% ../../notebooks/API_Prediction.ipynb 18
+# %% ../../notebooks/API_Prediction.ipynb 21
 add_example_to_docs(Prediction.details, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_Prediction.ipynb 21
+# %% ../../notebooks/API_Prediction.ipynb 24
 @patch
 def delete(self: Prediction) -> pd.DataFrame:
     """Delete a prediction from the server.
@@ -434,6 +748,7 @@ def delete(self: Prediction) -> pd.DataFrame:
         ConnectionError: If the server address is invalid or not reachable.
     """
     response = Client._delete_data(relative_url=f"/prediction/{self.uuid}")
+    Client._invalidate_cache(relative_url=f"/prediction/{self.uuid}")
 
     df = pd.DataFrame(response, index=[0])[Prediction.BASIC_PRED_COLS]
 
@@ -441,34 +756,239 @@ def delete(self: Prediction) -> pd.DataFrame:
 
     return add_ready_column(df)
 
-# %% ../../notebooks/API_Prediction.ipynb 22
+# %% ../../notebooks/API_Prediction.ipynb 25
 add_example_to_docs(Prediction.delete, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_Prediction.ipynb 28
+# %% ../../notebooks/API_Prediction.ipynb 33
+PANDAS_MEDIA_TYPES = "application/vnd.apache.arrow.stream, application/vnd.apache.parquet;q=0.9, application/json;q=0.5"
+
+
+def _get_pyarrow() -> Optional[Any]:
+    """Return the pyarrow module if it is installed, else None."""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        return None
+
+    return pyarrow
+
+
+def _columnar_to_pandas(content: bytes) -> pd.DataFrame:
+    """Decode an Arrow IPC stream or a parquet file into a pandas DataFrame.
+
+    The Arrow buffers are wrapped without copying the content and released column by column while converting them to
+    pandas, so the peak memory stays close to the size of the resulting DataFrame.
+    """
+    pa: Any = _get_pyarrow()
+    buffer = pa.py_buffer(content)
+    if content[:4] == b"PAR1":
+        table = pa.parquet.read_table(pa.BufferReader(buffer))
+    else:
+        table = pa.ipc.open_stream(buffer).read_all()
+
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _sort_predictions(df: pd.DataFrame) -> pd.DataFrame:
+    """Index the prediction results by the client column and sort them by the score in descending order.
+
+    The results of a prediction without any result files have no client column, so they are returned without it.
+    """
+    keys = [column for column in df.columns if column != "Score"]
+    if keys:
+        df = df.set_index(keys[0])
+    return df.sort_values("Score", ascending=False)
+
+
+def _get_empty_predictions() -> pd.DataFrame:
+    """Return the results of a prediction without any result files to read the columns from."""
+    return pd.DataFrame({"Score": pd.Series(dtype="float64")})
+
+# %% ../../notebooks/API_Prediction.ipynb 34
 @patch
 def to_pandas(self: Prediction) -> pd.DataFrame:
     """Return the prediction results as a pandas DataFrame
 
+    If pyarrow is installed, the prediction results are requested in a columnar binary format, an Arrow IPC stream
+    or a parquet file, and decoded without creating Python objects for every value. The JSON format is used if
+    pyarrow is not installed or the server doesn't support the binary formats.
+
     Returns:
         A pandas DataFrame encapsulating the results of the prediction.
 
     Raises:
         ConnectionError: If the server address is invalid or not reachable.
     """
-    response = Client._get_data(relative_url=f"/prediction/{self.uuid}/pandas")
-    keys = list(response.keys())
-    keys.remove("Score")
-    index_name = keys[0]
-    return (
-        pd.DataFrame(response)
-        .set_index(index_name)
-        .sort_values("Score", ascending=False)
+    response = Client._get_artifact(
+        relative_url=f"/prediction/{self.uuid}/pandas",
+        resource_url=f"/prediction/{self.uuid}",
+        accept=PANDAS_MEDIA_TYPES if _get_pyarrow() is not None else None,
     )
+    df = (
+        _columnar_to_pandas(response)
+        if isinstance(response, bytes)
+        else pd.DataFrame(response)
+    )
+    return _sort_predictions(df)
 
-# %% ../../notebooks/API_Prediction.ipynb 29
+# %% ../../notebooks/API_Prediction.ipynb 35
 add_example_to_docs(Prediction.to_pandas, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_Prediction.ipynb 31
+# %% ../../notebooks/API_Prediction.ipynb 41
+@patch
+def iter_batches(
+    self: Prediction,
+    batch_size: int = 100_000,
+    as_arrow: bool = False,
+) -> Iterator[Any]:
+    """Iterate over the prediction results in batches.
+
+    The parquet files of the prediction results are downloaded one at a time to a temporary directory and read in
+    batches of at most **batch_size** rows, so the memory used depends on the batch size and not on the number of
+    predictions. A file is deleted once all of its rows are read and the batches don't span multiple files, so the
+    last batch of each file can be smaller than **batch_size**. If the prediction has no rows, a single empty batch
+    with the columns of the results is returned. If the disk cache is enabled by
+    `Client.enable_disk_cache`, the files stored in it are copied instead of being downloaded again.
+
+    Args:
+        batch_size: The maximum number of rows in a batch. If not passed, then the default value **100_000** will be used.
+        as_arrow: If set to **True**, the batches are returned as pyarrow RecordBatches instead of pandas DataFrames.
+            If not passed, then the default value **False** will be used.
+
+    Returns:
+        A generator of pandas DataFrames or, if **as_arrow** is set, pyarrow RecordBatches.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ConnectionError: If the server address is invalid or not reachable.
+        HTTPError: If the presigned AWS s3 uri to download the prediction results are invalid or not reachable.
+    """
+    pa = _get_pyarrow()
+    if pa is None:
+        raise ImportError(
+            "The pyarrow package is required for reading the prediction results in batches, please install it"
+            " along with the client by running: pip install 'airt-client[arrow]'"
+        )
+
+    response = Client._get_data(relative_url=f"/prediction/{self.uuid}/to_local")
+    server, _ = Client._get_server_url_and_token()
+
+    empty = True
+    schema = None
+    with create_session(pool_connections=1, pool_maxsize=1) as session:
+        with tempfile.TemporaryDirectory(prefix="airt_prediction_") as d:
+            for file_name, url in response.items():
+                Prediction._download_prediction_file_to_local(
+                    file_name,
+                    url,
+                    d,
+                    session=session,
+                    cache_key=(
+                        f"{server}/prediction/{self.uuid}",
+                        f"{server}/prediction/{self.uuid}/to_local/{file_name}",
+                    ),
+                )
+                file_path = Path(d) / file_name
+                with pa.parquet.ParquetFile(file_path) as f:
+                    schema = f.schema_arrow
+                    for batch in f.iter_batches(batch_size=batch_size):
+                        empty = False
+                        yield batch if as_arrow else batch.to_pandas()
+                file_path.unlink()
+
+            if empty and schema is not None:
+                batch = pa.RecordBatch.from_pylist([], schema=schema)
+                yield batch if as_arrow else batch.to_pandas()
+
+# %% ../../notebooks/API_Prediction.ipynb 42
+add_example_to_docs(Prediction.iter_batches, _docstring_example.__doc__)  # type: ignore
+
+# %% ../../notebooks/API_Prediction.ipynb 45
+@patch
+def top_k(self: Prediction, k: int, batch_size: int = 100_000) -> pd.DataFrame:
+    """Return the predictions with the **k** highest scores.
+
+    The prediction results are read in batches using `Prediction.iter_batches` and only the rows scoring higher than
+    the lowest of the best **k** rows found so far are kept in a heap of at most **k** rows, so the memory used
+    depends on **k** and **batch_size** and not on the number of predictions.
+
+    Args:
+        k: The number of predictions to return.
+        batch_size: The maximum number of rows read at once. If not passed, then the default value **100_000** will be used.
+
+    Returns:
+        A pandas DataFrame encapsulating the predictions with the highest scores, sorted by the score in descending order.
+
+    Raises:
+        ValueError: If **k** is not a positive number.
+        ImportError: If pyarrow is not installed.
+        ConnectionError: If the server address is invalid or not reachable.
+        HTTPError: If the presigned AWS s3 uri to download the prediction results are invalid or not reachable.
+    """
+    if k < 1:
+        raise ValueError(f"The value of k must be a positive number, but got {k}")
+
+    heap: List[Tuple[float, int, Tuple[Any, ...]]] = []
+    counter = itertools.count()
+    empty = _get_empty_predictions()
+    for df in self.iter_batches(batch_size=batch_size):
+        empty = df.iloc[:0]
+        df = df.nlargest(k, "Score")
+        if len(heap) == k:
+            df = df[df["Score"] > heap[0][0]]
+
+        # the sequence number breaks the ties between equal scores, so the rows are never compared
+        for row, score in zip(df.itertuples(index=False, name=None), df["Score"]):
+            item = (score, next(counter), row)
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            else:
+                heapq.heappushpop(heap, item)
+
+    if not heap:
+        return _sort_predictions(empty)
+
+    rows = [row for _, _, row in heap]
+    return _sort_predictions(pd.DataFrame(rows, columns=empty.columns))
+
+# %% ../../notebooks/API_Prediction.ipynb 46
+add_example_to_docs(Prediction.top_k, _docstring_example.__doc__)  # type: ignore
+
+# %% ../../notebooks/API_Prediction.ipynb 47
+@patch
+def above(self: Prediction, score: float, batch_size: int = 100_000) -> pd.DataFrame:
+    """Return the predictions with a score higher than **score**.
+
+    The prediction results are read in batches using `Prediction.iter_batches` and only the rows above the threshold
+    are kept, so the memory used depends on the number of the returned predictions and not on the number of all
+    predictions.
+
+    Args:
+        score: The score threshold, only the predictions with a score strictly higher than it are returned.
+        batch_size: The maximum number of rows read at once. If not passed, then the default value **100_000** will be used.
+
+    Returns:
+        A pandas DataFrame encapsulating the predictions above the threshold, sorted by the score in descending order.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ConnectionError: If the server address is invalid or not reachable.
+        HTTPError: If the presigned AWS s3 uri to download the prediction results are invalid or not reachable.
+    """
+    batches = [
+        df[df["Score"] > score] for df in self.iter_batches(batch_size=batch_size)
+    ]
+    if not batches:
+        return _sort_predictions(_get_empty_predictions())
+
+    return _sort_predictions(pd.concat(batches, ignore_index=True))
+
+# %% ../../notebooks/API_Prediction.ipynb 48
+add_example_to_docs(Prediction.above, _docstring_example.__doc__)  # type: ignore
+
+# %% ../../notebooks/API_Prediction.ipynb 52
 @patch
 def to_s3(
     self: Prediction,
@@ -505,10 +1025,10 @@ def to_s3(
 
     return ProgressStatus(relative_url=f"/prediction/push/{response['uuid']}")
 
-# %% ../../notebooks/API_Prediction.ipynb 32
+# %% ../../notebooks/API_Prediction.ipynb 53
 add_example_to_docs(Prediction.to_s3, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_Prediction.ipynb 35
+# %% ../../notebooks/API_Prediction.ipynb 56
 @patch
 def to_azure_blob_storage(
     self: Prediction,
@@ -534,41 +1054,80 @@ def to_azure_blob_storage(
 
     return ProgressStatus(relative_url=f"/prediction/push/{response['uuid']}")
 
-# %% ../../notebooks/API_Prediction.ipynb 36
+# %% ../../notebooks/API_Prediction.ipynb 57
 add_example_to_docs(Prediction.to_azure_blob_storage, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_Prediction.ipynb 39
+# %% ../../notebooks/API_Prediction.ipynb 60
 @patch
 def to_local(
     self: Prediction,
     path: Union[str, Path],
     show_progress: Optional[bool] = True,
+    max_workers: int = 4,
+    verify_checksum: bool = False,
 ) -> None:
     """Download the prediction results to a local directory.
 
+    The files already downloaded to the directory are skipped if they match the prediction results and the
+    interrupted downloads are resumed, so calling this method again after a failure downloads only the missing data.
+    If the disk cache is enabled by `Client.enable_disk_cache`, the files stored in it are copied instead of being
+    downloaded again.
+
     Args:
         path: Local directory path.
         show_progress: Flag to set the progressbar visibility. If not passed, then the default value **True** will be used.
+        max_workers: The maximum number of files to download in parallel. If not passed, then the default value **4** will be used.
+        verify_checksum: If set to **True**, the MD5 checksum of each downloaded file is compared to the ETag returned by
+            the AWS s3 bucket. The files whose ETag is not an MD5 checksum, e.g. the ones encrypted with SSE-KMS, are
+            verified by their size only. If not passed, then the default value **False** will be used.
 
     Raises:
         FileNotFoundError: If the **path** is invalid.
         HTTPError: If the presigned AWS s3 uri to download the prediction results are invalid or not reachable.
+        ValueError: If **verify_checksum** is set and the checksum or the size of a downloaded file doesn't match.
     """
     response = Client._get_data(relative_url=f"/prediction/{self.uuid}/to_local")
+    server, _ = Client._get_server_url_and_token()
 
     # Initiate progress bar
     t = tqdm(total=len(response), disable=not show_progress)
 
-    for file_name, url in response.items():
-        Prediction._download_prediction_file_to_local(file_name, url, Path(path))
-        t.update()
-
-    t.close()
-
-# %% ../../notebooks/API_Prediction.ipynb 40
+    with create_session(
+        pool_connections=1, pool_maxsize=max_workers
+    ) as session, ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="airt-download"
+    ) as executor:
+        futures = [
+            executor.submit(
+                Prediction._download_prediction_file_to_local,
+                file_name,
+                url,
+                Path(path),
+                session=session,
+                verify_checksum=verify_checksum,
+                cache_key=(
+                    f"{server}/prediction/{self.uuid}",
+                    f"{server}/prediction/{self.uuid}/to_local/{file_name}",
+                ),
+            )
+            for file_name, url in response.items()
+        ]
+        try:
+            for future in as_completed(futures):
+                future.result()
+                t.update()
+        except BaseException:
+            # don't start downloading the remaining files if one of them failed
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            t.close()
+
+# %% ../../notebooks/API_Prediction.ipynb 61
 add_example_to_docs(Prediction.to_local, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_Prediction.ipynb 43
+# %% ../../notebooks/API_Prediction.ipynb 71
 @patch
 def to_mysql(
     self: Prediction,
@@ -624,10 +1183,10 @@ def to_mysql(
 
     return ProgressStatus(relative_url=f"/prediction/push/{response['uuid']}")
 
-# %% ../../notebooks/API_Prediction.ipynb 44
+# %% ../../notebooks/API_Prediction.ipynb 72
 add_example_to_docs(Prediction.to_mysql, _docstring_example.__doc__)  # type: ignore
 
-# %% ../../notebooks/API_Prediction.ipynb 47
+# %% ../../notebooks/API_Prediction.ipynb 75
 @patch
 def to_clickhouse(
     self: Prediction,
@@ -688,5 +1247,5 @@ def to_clickhouse(
 
     return ProgressStatus(relative_url=f"/prediction/push/{response['uuid']}")
 
-# %% ../../notebooks/API_Prediction.ipynb 48
+# %% ../../notebooks/API_Prediction.ipynb 76
 add_example_to_docs(Prediction.to_clickhouse, _docstring_example.__doc__)  # type: ignore
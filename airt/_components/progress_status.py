@@ -1,12 +1,16 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../notebooks/API_ProgressStatus.ipynb.
 
 # %% auto 0
-__all__ = ['ProgressStatus']
+__all__ = ['PollingStrategy', 'FixedPolling', 'ExponentialBackoffPolling', 'ETAPolling', 'ProgressStatus']
 
 # %% ../../notebooks/API_ProgressStatus.ipynb 3
 from typing import *
 
 # %% ../../notebooks/API_ProgressStatus.ipynb 4
+import random
+import re
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from time import sleep
 
@@ -20,6 +24,163 @@ from airt._logger import get_logger, set_level
 logger = get_logger(__name__)
 
 # %% ../../notebooks/API_ProgressStatus.ipynb 9
+class PollingStrategy:
+    """A base class for the strategies deciding how long to sleep between successive status checks.
+
+    The `wait` and `progress_bar` methods of the `DataBlob`, `DataSource`, `Model`, `Prediction` and `ProgressStatus`
+    classes accept an instance of this class in the **polling_strategy** parameter. A default strategy for all the
+    calls can be set using the `ProgressStatus.set_default_polling_strategy` context manager.
+
+    A custom strategy can be created by subclassing this class and overriding the `next_delay` method.
+    """
+
+    def next_delay(
+        self,
+        *,
+        attempt: int,
+        elapsed: float,
+        progressed_steps: Optional[int] = None,
+        remaining_steps: Optional[int] = None,
+    ) -> float:
+        """Return the time interval in seconds to sleep before the next status check.
+
+        Args:
+            attempt: The number of status checks already issued while waiting, starting from 0.
+            elapsed: The time in seconds elapsed since the wait started.
+            progressed_steps: The number of steps completed since the wait started, if known.
+            remaining_steps: The number of steps remaining for the remote action to complete, if known.
+
+        Returns:
+            The time interval in seconds.
+        """
+        raise NotImplementedError()
+
+
+class FixedPolling(PollingStrategy):
+    """A polling strategy sleeping for the same time interval between successive status checks."""
+
+    def __init__(self, sleep_for: Union[int, float] = 5):
+        """Constructs a new FixedPolling instance.
+
+        Args:
+            sleep_for: The time interval in seconds between successive status checks.
+        """
+        self.sleep_for = sleep_for
+
+    def next_delay(
+        self,
+        *,
+        attempt: int,
+        elapsed: float,
+        progressed_steps: Optional[int] = None,
+        remaining_steps: Optional[int] = None,
+    ) -> float:
+        """Return the time interval in seconds to sleep before the next status check.
+
+        Please check the documentation of `PollingStrategy.next_delay` for the details.
+        """
+        return self.sleep_for
+
+    def __repr__(self) -> str:
+        return f"FixedPolling(sleep_for={self.sleep_for})"
+
+
+class ExponentialBackoffPolling(PollingStrategy):
+    """A polling strategy multiplying the time interval between successive status checks after each check.
+
+    The time interval is capped at **max_delay** and randomized by up to the **jitter** fraction, so that many
+    clients started at the same time do not query the server in lockstep.
+    """
+
+    def __init__(
+        self,
+        initial_delay: Union[int, float] = 1,
+        multiplier: Union[int, float] = 2,
+        max_delay: Union[int, float] = 60,
+        jitter: float = 0.1,
+    ):
+        """Constructs a new ExponentialBackoffPolling instance.
+
+        Args:
+            initial_delay: The time interval in seconds before the second status check.
+            multiplier: The factor by which the time interval grows after each status check.
+            max_delay: The maximum time interval in seconds between successive status checks.
+            jitter: The maximum fraction by which the time interval is randomly increased or decreased.
+        """
+        self.initial_delay = initial_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def next_delay(
+        self,
+        *,
+        attempt: int,
+        elapsed: float,
+        progressed_steps: Optional[int] = None,
+        remaining_steps: Optional[int] = None,
+    ) -> float:
+        """Return the time interval in seconds to sleep before the next status check.
+
+        Please check the documentation of `PollingStrategy.next_delay` for the details.
+        """
+        delay = min(self.initial_delay * self.multiplier**attempt, self.max_delay)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)  # nosec B311
+
+    def __repr__(self) -> str:
+        return (
+            f"ExponentialBackoffPolling(initial_delay={self.initial_delay}, multiplier={self.multiplier}, "
+            f"max_delay={self.max_delay}, jitter={self.jitter})"
+        )
+
+
+class ETAPolling(PollingStrategy):
+    """A polling strategy sleeping for a fraction of the estimated time remaining for the remote action to complete.
+
+    The remaining time is estimated from the rate at which the steps were completed since the wait started. Until
+    the first step is completed, the time interval is doubled after each status check starting from **min_delay**.
+    """
+
+    def __init__(
+        self,
+        min_delay: Union[int, float] = 1,
+        max_delay: Union[int, float] = 60,
+        fraction: float = 0.5,
+    ):
+        """Constructs a new ETAPolling instance.
+
+        Args:
+            min_delay: The minimum time interval in seconds between successive status checks.
+            max_delay: The maximum time interval in seconds between successive status checks.
+            fraction: The fraction of the estimated remaining time to sleep for.
+        """
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.fraction = fraction
+
+    def next_delay(
+        self,
+        *,
+        attempt: int,
+        elapsed: float,
+        progressed_steps: Optional[int] = None,
+        remaining_steps: Optional[int] = None,
+    ) -> float:
+        """Return the time interval in seconds to sleep before the next status check.
+
+        Please check the documentation of `PollingStrategy.next_delay` for the details.
+        """
+        if progressed_steps and remaining_steps is not None and 0 < elapsed:
+            delay = self.fraction * remaining_steps * elapsed / progressed_steps
+        else:
+            delay = self.min_delay * 2**attempt
+
+        return max(self.min_delay, min(delay, self.max_delay))
+
+    def __repr__(self) -> str:
+        return f"ETAPolling(min_delay={self.min_delay}, max_delay={self.max_delay}, fraction={self.fraction})"
+
+# %% ../../notebooks/API_ProgressStatus.ipynb 10
 class ProgressStatus:
     """A base class for querying status of a remote operation.
 
@@ -55,8 +216,16 @@ class ProgressStatus:
         ```
     """
 
+    _default_polling_strategies: List[PollingStrategy] = []
+    _polling_metrics: Dict[str, Union[int, float]] = dict(polls=0, sleep_time=0.0)
+    _polling_metrics_lock = threading.Lock()
+
     def __init__(
-        self, relative_url: str, sleep_for: Union[int, float] = 5, timeout: int = 0
+        self,
+        relative_url: str,
+        sleep_for: Union[int, float] = 5,
+        timeout: int = 0,
+        polling_strategy: Optional[PollingStrategy] = None,
     ):
         """Constructs a new ProgressStatus instance.
 
@@ -69,6 +238,8 @@ class ProgressStatus:
             sleep_for: The time interval in seconds between successive API calls.
             timeout: The maximum time allowed in seconds for the asynchronous call to complete. If not the
                 progressbar will be terminated.
+            polling_strategy: The strategy deciding the time interval between successive API calls. If not
+                passed, the default polling strategy is used if set, else the **sleep_for** interval.
 
         Raises:
             TimeoutError: in case of connection timeout.
@@ -76,6 +247,17 @@ class ProgressStatus:
         self.relative_url = relative_url
         self.sleep_for = sleep_for
         self.timeout = timeout
+        self.polling_strategy = polling_strategy
+
+    def _get_status(self) -> Dict[str, Any]:
+        """Query the status of the remote operation and add the API call to the polling metrics.
+
+        Returns:
+            A dict containing the completed and the total number of steps of the remote operation.
+        """
+        response = Client._get_data(relative_url=self.relative_url)
+        _record_polling_metrics(polls=1)
+        return response
 
     def is_ready(self) -> bool:
         """Check if the method's progress is complete.
@@ -114,12 +296,16 @@ class ProgressStatus:
             print(db.is_ready())
             ```
         """
-        response = Client._get_data(relative_url=self.relative_url)
+        response = self._get_status()
         return response["completed_steps"] == response["total_steps"]
 
-    def progress_bar(self):
+    def progress_bar(self, polling_strategy: Optional[PollingStrategy] = None):
         """Blocks the execution and displays a progress bar showing the remote action progress.
 
+        Args:
+            polling_strategy: The strategy deciding the time interval between successive API calls. If not
+                passed, the strategy passed to the constructor is used.
+
         Raises:
             ConnectionError: If the server address is invalid or not reachable.
             TimeoutError: in case of connection timeout.
@@ -155,16 +341,22 @@ class ProgressStatus:
             print(db.is_ready())
             ```
         """
-        total_steps = Client._get_data(relative_url=self.relative_url)["total_steps"]
+        polling_strategy = _get_polling_strategy(
+            polling_strategy or self.polling_strategy, self.sleep_for
+        )
+        response = self._get_status()
+        total_steps = response["total_steps"]
+        started_steps = response["completed_steps"]
         with tqdm(total=total_steps) as pbar:
             started_at = datetime.now()
+            attempt = 0
             while True:
                 if (0 < self.timeout) and (datetime.now() - started_at) > timedelta(
                     seconds=self.timeout
                 ):
                     raise TimeoutError()
 
-                response = Client._get_data(relative_url=self.relative_url)
+                response = self._get_status()
                 completed_steps = response["completed_steps"]
 
                 pbar.update(completed_steps)
@@ -172,16 +364,98 @@ class ProgressStatus:
                 if completed_steps == total_steps:
                     break
 
-                sleep(self.sleep_for)
-
-    def wait(self):
+                sleep(
+                    _next_poll_delay(
+                        polling_strategy,
+                        attempt=attempt,
+                        started_at=started_at,
+                        timeout=self.timeout,
+                        progressed_steps=completed_steps - started_steps,
+                        remaining_steps=total_steps - completed_steps,
+                    )
+                )
+                attempt += 1
+
+    def wait(self, polling_strategy: Optional[PollingStrategy] = None):
         raise NotImplementedError()
 
-# %% ../../notebooks/API_ProgressStatus.ipynb 16
+# %% ../../notebooks/API_ProgressStatus.ipynb 11
+def _get_polling_strategy(
+    polling_strategy: Optional[PollingStrategy], sleep_for: Union[int, float]
+) -> PollingStrategy:
+    """Return the polling strategy to use for a wait.
+
+    Args:
+        polling_strategy: The polling strategy passed to the call, if any.
+        sleep_for: The time interval in seconds between successive status checks used if neither the polling
+            strategy is passed nor the default one is set.
+
+    Returns:
+        The polling strategy passed to the call, the default polling strategy or a fixed polling strategy.
+    """
+    if polling_strategy is not None:
+        return polling_strategy
+
+    if len(ProgressStatus._default_polling_strategies) > 0:
+        return ProgressStatus._default_polling_strategies[-1]
+
+    return FixedPolling(sleep_for=sleep_for)
+
+
+def _record_polling_metrics(polls: int = 0, sleep_time: float = 0.0):
+    """Add the number of issued status checks and the time slept to the polling metrics."""
+    with ProgressStatus._polling_metrics_lock:
+        ProgressStatus._polling_metrics["polls"] += polls
+        ProgressStatus._polling_metrics["sleep_time"] += sleep_time
+
+
+def _next_poll_delay(
+    polling_strategy: PollingStrategy,
+    *,
+    attempt: int,
+    started_at: datetime,
+    timeout: int,
+    progressed_steps: Optional[int] = None,
+    remaining_steps: Optional[int] = None,
+) -> float:
+    """Return the time interval in seconds to sleep before the next status check.
+
+    The time interval is shortened so that the sleep does not extend past the timeout, and it is added to the
+    polling metrics.
+
+    Args:
+        polling_strategy: The polling strategy to use.
+        attempt: The number of status checks already issued while waiting, starting from 0.
+        started_at: The time the wait started.
+        timeout: The maximum time allowed in seconds for the wait, 0 if there is no timeout.
+        progressed_steps: The number of steps completed since the wait started, if known.
+        remaining_steps: The number of steps remaining for the remote action to complete, if known.
+
+    Returns:
+        The time interval in seconds.
+    """
+    elapsed = (datetime.now() - started_at).total_seconds()
+    delay = polling_strategy.next_delay(
+        attempt=attempt,
+        elapsed=elapsed,
+        progressed_steps=progressed_steps,
+        remaining_steps=remaining_steps,
+    )
+    if 0 < timeout:
+        delay = min(delay, max(timeout - elapsed, 0) + 0.01)
+
+    _record_polling_metrics(sleep_time=delay)
+    return delay
+
+# %% ../../notebooks/API_ProgressStatus.ipynb 18
 @patch
-def wait(self: ProgressStatus):
+def wait(self: ProgressStatus, polling_strategy: Optional[PollingStrategy] = None):
     """Blocks execution while waiting for the remote action to complete.
 
+    Args:
+        polling_strategy: The strategy deciding the time interval between successive API calls. If not
+            passed, the strategy passed to the constructor is used.
+
     Raises:
         ConnectionError: If the server address is invalid or not reachable.
         TimeoutError: in case of timeout.
@@ -214,14 +488,425 @@ def wait(self: ProgressStatus):
         print(db.details())
         ```
     """
+    polling_strategy = _get_polling_strategy(
+        polling_strategy or self.polling_strategy, self.sleep_for
+    )
     started_at = datetime.now()
+    started_steps = None
+    attempt = 0
     while True:
         if (0 < self.timeout) and (datetime.now() - started_at) > timedelta(
             seconds=self.timeout
         ):
             raise TimeoutError()
 
-        if self.is_ready():
+        response = self._get_status()
+        completed_steps, total_steps = (
+            response["completed_steps"],
+            response["total_steps"],
+        )
+        if completed_steps == total_steps:
+            return
+
+        if started_steps is None:
+            started_steps = completed_steps
+
+        sleep(
+            _next_poll_delay(
+                polling_strategy,
+                attempt=attempt,
+                started_at=started_at,
+                timeout=self.timeout,
+                progressed_steps=completed_steps - started_steps,
+                remaining_steps=total_steps - completed_steps,
+            )
+        )
+        attempt += 1
+
+# %% ../../notebooks/API_ProgressStatus.ipynb 21
+@patch(cls_method=True)
+@contextmanager
+def set_default_polling_strategy(
+    cls: ProgressStatus, polling_strategy: PollingStrategy
+) -> Iterator[None]:
+    """Sets the default polling strategy for waiting on the remote actions.
+
+    Whenever you call the `wait` or `progress_bar` methods of the `DataBlob`, `DataSource`, `Model`, `Prediction` or
+    `ProgressStatus` classes inside this context manager, the polling strategy set in this context will be used,
+    unless you explicitely pass the **polling_strategy** parameter.
+
+    Args:
+        polling_strategy: An instance of `FixedPolling`, `ExponentialBackoffPolling`, `ETAPolling` or a custom
+            subclass of `PollingStrategy`.
+
+    Returns:
+        A context manager that specifies the polling strategy to use.
+
+    Here's an example of waiting for a model training with the time interval between the status checks growing
+    from 1 second up to a minute:
+
+    Example:
+        ```python
+        # Importing necessary libraries
+        from  airt.client import Client, DataBlob, ExponentialBackoffPolling, ProgressStatus
+
+        # Authenticate
+        Client.get_token(username="{fill in username}", password="{fill in password}")
+
+        with ProgressStatus.set_default_polling_strategy(
+            ExponentialBackoffPolling(initial_delay=1, max_delay=60)
+        ):
+            # Create a datablob
+            # In this example, the datablob will be stored in an AWS S3 bucket. The region
+            # is set to eu-west-3, feel free to change the cloud provider and the region
+            # to suit your needs.
+            db = DataBlob.from_s3(
+                uri="{fill in uri}",
+                cloud_provider="aws",
+                region="eu-west-3"
+            )
+
+            # Further calls to the API will be blocked until the datablob upload is complete.
+            db.wait()
+
+        # Print the number of the status checks issued
+        print(ProgressStatus.get_polling_metrics())
+        ```
+    """
+    cls._default_polling_strategies.append(polling_strategy)  # type: ignore
+    try:
+        yield
+    finally:
+        cls._default_polling_strategies.pop()
+
+
+@patch(cls_method=True)
+def get_polling_metrics(cls: ProgressStatus) -> Dict[str, Union[int, float]]:
+    """Return the metrics of the status checks issued while waiting for the remote actions.
+
+    The metrics are accumulated across all the instances of the `DataBlob`, `DataSource`, `Model`, `Prediction` and
+    `ProgressStatus` classes until `ProgressStatus.reset_polling_metrics` is called.
+
+    Returns:
+        A dict containing the number of status checks issued (**polls**) and the total time in seconds slept between
+        them (**sleep_time**).
+    """
+    with cls._polling_metrics_lock:
+        return dict(cls._polling_metrics)
+
+
+@patch(cls_method=True)
+def reset_polling_metrics(cls: ProgressStatus):
+    """Reset the metrics of the status checks issued while waiting for the remote actions."""
+    with cls._polling_metrics_lock:
+        cls._polling_metrics.update(polls=0, sleep_time=0.0)
+
+# %% ../../notebooks/API_ProgressStatus.ipynb 23
+_BULK_RELATIVE_URL_PATTERN = re.compile(
+    r"^/(datablob|datasource|model|prediction)/([^/?]+)$"
+)
+
+
+def _get_relative_url(o: Any) -> str:
+    """Return the relative URL for querying the status of a resource.
+
+    Args:
+        o: An instance of `ProgressStatus` or any of its subclasses, `DataBlob` or `DataSource`.
+
+    Returns:
+        The relative URL of the status route.
+    """
+    if isinstance(o, ProgressStatus):
+        return o.relative_url
+
+    return f"/{type(o).__name__.lower()}/{o.uuid}"
+
+
+def _list_completed(
+    kind: str, uuids: Set[str], limit: int, max_pages: int
+) -> Tuple[Set[str], int, bool]:
+    """Find the completed resources of a kind using the paginated listing route.
+
+    Args:
+        kind: The kind of resources to list, e.g. **datablob** or **model**.
+        uuids: The uuids of the resources to look for.
+        limit: The number of resources to fetch per page.
+        max_pages: The maximum number of pages to fetch.
+
+    Returns:
+        A tuple containing the uuids found in the listing of the completed resources, the number of pages
+        fetched, and a flag indicating whether all the pages were fetched.
+    """
+    found: Set[str] = set()
+    offset = 0
+    pages = 0
+    while True:
+        page = Client._get_data(
+            relative_url=f"/{kind}/?disabled=False&completed=True&offset={offset}&limit={limit}"
+        )
+        pages += 1
+        _record_polling_metrics(polls=1)
+        found |= uuids.intersection(item["uuid"] for item in page)
+
+        if found == uuids:
+            return found, pages, False
+
+        if len(page) < limit:
+            return found, pages, True
+
+        if pages >= max_pages:
+            return found, pages, False
+
+        offset += limit
+
+# %% ../../notebooks/API_ProgressStatus.ipynb 24
+@patch(cls_method=True)
+def as_completed(
+    cls: ProgressStatus,
+    resources: List[Any],
+    sleep_for: Union[int, float] = 5,
+    timeout: int = 0,
+    bulk_limit: int = 100,
+    polling_strategy: Optional[PollingStrategy] = None,
+) -> Iterator[Any]:
+    """Wait for multiple remote actions to complete and yield each resource as soon as it is completed.
+
+    Instead of polling each resource separately, the status of all the pending resources is queried once per
+    interval. Whenever it requires fewer requests, the pending datablobs, datasources, models, and predictions of
+    the same kind are checked together by listing the completed resources of that kind, so waiting for hundreds of
+    resources costs only a few requests per interval. The listing is stopped after as many pages as there are
+    pending resources of that kind, and the ones not found in it are polled separately from then on.
+
+    Args:
+        resources: A list of `DataBlob`, `DataSource`, `Model`, `Prediction` or `ProgressStatus` instances.
+        sleep_for: The time interval in seconds between successive checks.
+        timeout: The maximum time allowed in seconds for all the remote actions to complete. If not the
+            wait will be terminated.
+        bulk_limit: The number of resources to fetch per request when listing the completed resources.
+        polling_strategy: The strategy deciding the time interval between successive checks. If not passed, the
+            default polling strategy is used if set, else the **sleep_for** interval.
+
+    Returns:
+        An iterator yielding the resources in the order of their completion.
+
+    Raises:
+        ConnectionError: If the server address is invalid or not reachable.
+        TimeoutError: in case of timeout.
+
+    Here's an example of processing the datablobs as soon as their upload is complete:
+
+    Example:
+        ```python
+        # Importing necessary libraries
+        from  airt.client import Client, DataBlob, ProgressStatus
+
+        # Authenticate
+        Client.get_token(username="{fill in username}", password="{fill in password}")
+
+        # Create the datablobs
+        dbx = [
+            DataBlob.from_s3(uri="{fill in uri}", cloud_provider="aws", region="eu-west-3"),
+            DataBlob.from_s3(uri="{fill in uri}", cloud_provider="aws", region="eu-west-1"),
+        ]
+
+        # Print the details of each datablob as soon as its upload is complete
+        for db in ProgressStatus.as_completed(dbx, sleep_for=1):
+            print(db.details())
+        ```
+    """
+    polling_strategy = _get_polling_strategy(polling_strategy, sleep_for)
+    pending = {i: _get_relative_url(o) for i, o in enumerate(resources)}
+    bulk_pages: Dict[str, int] = {}
+    started_at = datetime.now()
+    attempt = 0
+
+    while True:
+        if (0 < timeout) and (datetime.now() - started_at) > timedelta(seconds=timeout):
+            raise TimeoutError()
+
+        # datablobs created from local files are ready immediately
+        completed_urls = {
+            url
+            for i, url in pending.items()
+            if getattr(resources[i], "type", None) == "local"
+            and url.startswith("/datablob/")
+        }
+
+        uuids_by_kind: Dict[str, Set[str]] = {}
+        polled_urls: Set[str] = set()
+        for url in set(pending.values()) - completed_urls:
+            match = _BULK_RELATIVE_URL_PATTERN.match(url)
+            if match:
+                uuids_by_kind.setdefault(match.group(1), set()).add(match.group(2))
+            else:
+                polled_urls.add(url)
+
+        for kind, uuids in uuids_by_kind.items():
+            # listing is cheaper only if it takes fewer pages than there are pending resources
+            if len(uuids) > bulk_pages.get(kind, 1):
+                found, pages, exhausted = _list_completed(
+                    kind, uuids, bulk_limit, max_pages=len(uuids)
+                )
+                completed_urls |= {f"/{kind}/{uuid}" for uuid in found}
+                if exhausted:
+                    bulk_pages[kind] = pages
+                elif found != uuids:
+                    # the listing takes more pages than there are pending resources
+                    bulk_pages[kind] = pages
+                    polled_urls |= {f"/{kind}/{uuid}" for uuid in uuids - found}
+            else:
+                polled_urls |= {f"/{kind}/{uuid}" for uuid in uuids}
+
+        for url in polled_urls:
+            response = Client._get_data(relative_url=url)
+            _record_polling_metrics(polls=1)
+            if response["completed_steps"] == response["total_steps"]:
+                completed_urls.add(url)
+
+        for i in [i for i, url in pending.items() if url in completed_urls]:
+            del pending[i]
+            yield resources[i]
+
+        if not pending:
             return
 
-        sleep(self.sleep_for)
+        sleep(
+            _next_poll_delay(
+                polling_strategy,
+                attempt=attempt,
+                started_at=started_at,
+                timeout=timeout,
+            )
+        )
+        attempt += 1
+
+# %% ../../notebooks/API_ProgressStatus.ipynb 26
+@patch(cls_method=True)
+def wait_all(
+    cls: ProgressStatus,
+    resources: List[Any],
+    sleep_for: Union[int, float] = 5,
+    timeout: int = 0,
+    bulk_limit: int = 100,
+    polling_strategy: Optional[PollingStrategy] = None,
+) -> List[Any]:
+    """Blocks execution while waiting for multiple remote actions to complete.
+
+    Please check the documentation of `as_completed` method for the details on how the status of the resources is queried.
+
+    Args:
+        resources: A list of `DataBlob`, `DataSource`, `Model`, `Prediction` or `ProgressStatus` instances.
+        sleep_for: The time interval in seconds between successive checks.
+        timeout: The maximum time allowed in seconds for all the remote actions to complete. If not the
+            wait will be terminated.
+        bulk_limit: The number of resources to fetch per request when listing the completed resources.
+        polling_strategy: The strategy deciding the time interval between successive checks. If not passed, the
+            default polling strategy is used if set, else the **sleep_for** interval.
+
+    Returns:
+        The resources in the order of their completion.
+
+    Raises:
+        ConnectionError: If the server address is invalid or not reachable.
+        TimeoutError: in case of timeout.
+
+    Here's an example of waiting for multiple datablobs to be uploaded:
+
+    Example:
+        ```python
+        # Importing necessary libraries
+        from  airt.client import Client, DataBlob, ProgressStatus
+
+        # Authenticate
+        Client.get_token(username="{fill in username}", password="{fill in password}")
+
+        # Create the datablobs
+        dbx = [
+            DataBlob.from_s3(uri="{fill in uri}", cloud_provider="aws", region="eu-west-3"),
+            DataBlob.from_s3(uri="{fill in uri}", cloud_provider="aws", region="eu-west-1"),
+        ]
+
+        # Further calls to the API will be blocked until all the datablobs are uploaded
+        ProgressStatus.wait_all(dbx, sleep_for=1)
+
+        # Print the details of the uploaded datablobs
+        for db in dbx:
+            print(db.details())
+        ```
+    """
+    return list(
+        cls.as_completed(  # type: ignore
+            resources,
+            sleep_for=sleep_for,
+            timeout=timeout,
+            bulk_limit=bulk_limit,
+            polling_strategy=polling_strategy,
+        )
+    )
+
+
+@patch(cls_method=True)
+def wait_any(
+    cls: ProgressStatus,
+    resources: List[Any],
+    sleep_for: Union[int, float] = 5,
+    timeout: int = 0,
+    bulk_limit: int = 100,
+    polling_strategy: Optional[PollingStrategy] = None,
+) -> Any:
+    """Blocks execution while waiting for any of the remote actions to complete.
+
+    Please check the documentation of `as_completed` method for the details on how the status of the resources is queried.
+
+    Args:
+        resources: A list of `DataBlob`, `DataSource`, `Model`, `Prediction` or `ProgressStatus` instances.
+        sleep_for: The time interval in seconds between successive checks.
+        timeout: The maximum time allowed in seconds for any of the remote actions to complete. If not the
+            wait will be terminated.
+        bulk_limit: The number of resources to fetch per request when listing the completed resources.
+        polling_strategy: The strategy deciding the time interval between successive checks. If not passed, the
+            default polling strategy is used if set, else the **sleep_for** interval.
+
+    Returns:
+        The first completed resource.
+
+    Raises:
+        ValueError: If the list of resources is empty.
+        ConnectionError: If the server address is invalid or not reachable.
+        TimeoutError: in case of timeout.
+
+    Here's an example of waiting for the first of the datablobs to be uploaded:
+
+    Example:
+        ```python
+        # Importing necessary libraries
+        from  airt.client import Client, DataBlob, ProgressStatus
+
+        # Authenticate
+        Client.get_token(username="{fill in username}", password="{fill in password}")
+
+        # Create the datablobs
+        dbx = [
+            DataBlob.from_s3(uri="{fill in uri}", cloud_provider="aws", region="eu-west-3"),
+            DataBlob.from_s3(uri="{fill in uri}", cloud_provider="aws", region="eu-west-1"),
+        ]
+
+        # Further calls to the API will be blocked until any of the datablobs is uploaded
+        db = ProgressStatus.wait_any(dbx, sleep_for=1)
+
+        # Print the details of the uploaded datablob
+        print(db.details())
+        ```
+    """
+    if len(resources) == 0:
+        raise ValueError("The list of resources to wait for must not be empty.")
+
+    return next(
+        cls.as_completed(  # type: ignore
+            resources,
+            sleep_for=sleep_for,
+            timeout=timeout,
+            bulk_limit=bulk_limit,
+            polling_strategy=polling_strategy,
+        )
+    )
@@ -8,6 +8,7 @@ from typing import *
 
 # %% ../../notebooks/API_User.ipynb 5
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import pandas as pd
 import qrcode
@@ -21,6 +22,7 @@ from airt._helper import (
     generate_df,
     get_attributes_from_instances,
     get_data,
+    iter_pages,
     post_data,
     standardize_phone_number,
 )
@@ -261,7 +263,8 @@ class User:
         offset: int = 0,
         limit: int = 100,
         disabled: bool = False,
-    ) -> List["User"]:
+        as_frame: bool = False,
+    ) -> Union[List["User"], pd.DataFrame]:
         """Return the list of User instances available in the server.
 
         To access this method, you must have super user privileges.
@@ -271,9 +274,13 @@ class User:
             limit: The maximum number of users to return from the server. If None, then the default value 100 will be used.
             disabled: If set to **True**, then only the deleted users will be returned. Else, the default value **False** will
                 be used to return only the list of active users.
+            as_frame: If set to **True**, the users are returned in a pandas dataframe built directly from the
+                server response, without creating an instance per user. The dataframe is the same as the
+                one returned by `User.as_df`. If not passed, then the default value **False** will be used.
 
         Returns:
-            A list of User instances available in the server.
+            A list of User instances available in the server, or a pandas dataframe with
+            their details if **as_frame** is set to **True**.
 
         Raises:
             ConnectionError: If the server address is invalid or not reachable.
@@ -301,6 +308,9 @@ class User:
             relative_url=f"/user/?disabled={disabled}&offset={offset}&limit={limit}"
         )
 
+        if as_frame:
+            return generate_df(users, User.USER_COLS)
+
         ux = [
             User(
                 uuid=user["uuid"],
@@ -322,11 +332,67 @@ class User:
         return ux
 
     @staticmethod
-    def as_df(ux: List["User"]) -> pd.DataFrame:
+    def iter_all(
+        page_size: int = 100,
+        disabled: bool = False,
+        prefetch: Union[bool, int] = False,
+    ) -> Iterator["User"]:
+        """Iterate over all User instances available in the server.
+
+        To access this method, you must have super user privileges.
+
+        Unlike `User.ls`, which returns a single page of users, the users are requested from the server page by page
+        while iterating, so all of them can be processed without building the whole list in memory.
+
+        Args:
+            page_size: The number of users requested from the server at once. If not passed, then the default value
+                **100** will be used.
+            disabled: If set to **True**, then only the deleted users will be returned. Else, the default value **False**
+                will be used to return only the active users.
+            prefetch: If set to **True**, the next page of users is requested in the background while the current
+                page is being processed. If set to a number, that many of the next pages are requested
+                concurrently, which speeds up listing all the users when the network latency dominates. If not
+                passed, then the default value **False** will be used.
+
+        Returns:
+            A generator of User instances available in the server.
+
+        Raises:
+            ConnectionError: If the server address is invalid or not reachable.
+
+        An example of iterating over all active users
+
+        Example:
+            ```python
+            # Importing necessary libraries
+            from  airt.client import Client, User
+
+            # Authenticate with super user privileges
+            Client.get_token(
+                username="{fill in super_user_username}",
+                password="{fill in super_user_password}"
+            )
+
+            # Print the usernames of all active users, requesting them from the server page by page
+            # Set the disabled parameter to True to iterate over the inactive users
+            for user in User.iter_all(prefetch=True):
+                print(user.username)
+            ```
+        """
+        return iter_pages(
+            lambda offset, limit: User.ls(
+                offset=offset, limit=limit, disabled=disabled
+            ),
+            page_size=page_size,
+            prefetch=int(prefetch),
+        )
+
+    @staticmethod
+    def as_df(ux: Iterable["User"]) -> pd.DataFrame:
         """Return the details of User instances as a pandas dataframe.
 
         Args:
-            ux: List of user instances.
+            ux: List of user instances, or an iterator of them such as the one returned by `User.iter_all`.
 
         Returns:
             Details of all the User in a dataframe.
@@ -358,18 +424,32 @@ class User:
         return generate_df(lists, User.USER_COLS)
 
     @staticmethod
-    def disable(user: Union[str, List[str]], otp: Optional[str] = None) -> pd.DataFrame:
+    def disable(
+        user: Union[str, List[str]],
+        otp: Optional[str] = None,
+        max_workers: int = 4,
+        raise_on_error: bool = True,
+    ) -> pd.DataFrame:
         """Disable one or more users.
 
         To access this method, you must have super user privileges.
 
+        When multiple users are passed, their usernames are resolved to uuids with a single sweep over the
+        active users and the users are disabled concurrently.
+
         Args:
             user: user_uuid/username to disabled. To disable multiple users, please pass the uuids/names as a list.
             otp: Dynamically generated six-digit verification code from the authenticator app. Please pass this
                 parameter only if you have activated the MFA for your account.
+            max_workers: The maximum number of users to disable in parallel. If not passed, then the default value **4** will be used.
+            raise_on_error: If set to **True**, the first error is raised and the users whose requests are not yet sent
+                are not disabled. The requests already sent, up to **max_workers**, may still complete. If set to **False**,
+                all the users are processed and the errors are reported per user in the **error** column of the returned
+                DataFrame. If not passed, then the default value **True** will be used.
 
         Returns:
-            A pandas DataFrame encapsulating the details of the disabled user.
+            A pandas DataFrame encapsulating the details of the disabled user. If **raise_on_error** is set to **False**,
+            the DataFrame is indexed by the passed user_uuids/usernames and has an additional **error** column.
 
         Raises:
             ValueError: If the OTP is invalid.
@@ -411,31 +491,43 @@ class User:
             print(User.details(username))
             ```
         """
-        _users = user if isinstance(user, list) else [user]
-        response_list = []
-        for user in _users:
-            user_uuid = User.details(user=user)["uuid"]
-            url = f"/user/{user_uuid}"
-            response = Client._delete_data(
-                relative_url=check_and_append_otp_query_param(url, otp)
-            )
-            response_list.append(response)
-
-        return pd.DataFrame(response_list)[User.USER_COLS]
+        return User._change_users_state(
+            users=user if isinstance(user, list) else [user],
+            change_state=lambda user_uuid: Client._delete_data(
+                relative_url=check_and_append_otp_query_param(f"/user/{user_uuid}", otp)
+            ),
+            disabled=False,
+            max_workers=max_workers,
+            raise_on_error=raise_on_error,
+        )
 
     @staticmethod
-    def enable(user: Union[str, List[str]], otp: Optional[str] = None) -> pd.DataFrame:
+    def enable(
+        user: Union[str, List[str]],
+        otp: Optional[str] = None,
+        max_workers: int = 4,
+        raise_on_error: bool = True,
+    ) -> pd.DataFrame:
         """Enable one or more disabled users.
 
         To access this method, you must have super user privileges.
 
+        When multiple users are passed, their usernames are resolved to uuids with a single sweep over the
+        disabled users and the users are enabled concurrently.
+
         Args:
             user: user_uuid/username to enable. To enable multiple users, please pass the uuids/names as a list.
             otp: Dynamically generated six-digit verification code from the authenticator app. Please pass this
                 parameter only if you have activated the MFA for your account.
+            max_workers: The maximum number of users to enable in parallel. If not passed, then the default value **4** will be used.
+            raise_on_error: If set to **True**, the first error is raised and the users whose requests are not yet sent
+                are not enabled. The requests already sent, up to **max_workers**, may still complete. If set to **False**,
+                all the users are processed and the errors are reported per user in the **error** column of the returned
+                DataFrame. If not passed, then the default value **True** will be used.
 
         Returns:
-            A pandas DataFrame encapsulating the details of the enabled user.
+            A pandas DataFrame encapsulating the details of the enabled user. If **raise_on_error** is set to **False**,
+            the DataFrame is indexed by the passed user_uuids/usernames and has an additional **error** column.
 
         Raises:
             ValueError: If the OTP is invalid.
@@ -480,17 +572,108 @@ class User:
             ```
         """
 
-        _users = user if isinstance(user, list) else [user]
-        response_list = []
-        for user in _users:
-            user_uuid = User.details(user=user)["uuid"]
-            url = f"/user/{user_uuid}/enable"
-            response = Client._get_data(
-                relative_url=check_and_append_otp_query_param(url, otp)
-            )
-            response_list.append(response)
+        return User._change_users_state(
+            users=user if isinstance(user, list) else [user],
+            change_state=lambda user_uuid: Client._get_data(
+                relative_url=check_and_append_otp_query_param(
+                    f"/user/{user_uuid}/enable", otp
+                )
+            ),
+            disabled=True,
+            max_workers=max_workers,
+            raise_on_error=raise_on_error,
+        )
+
+    @staticmethod
+    def _resolve_user_uuids(users: List[str], disabled: bool) -> Dict[str, str]:
+        """Resolve the passed usernames to user_uuids.
+
+        The usernames are looked up with a single sweep over the users listed by `User.iter_all`, which stops as
+        soon as all of them are found.
+
+        Args:
+            users: user_uuids/usernames to resolve.
+            disabled: Whether to look up the usernames among the disabled or the active users.
+
+        Returns:
+            A dict mapping the passed usernames found in the sweep to user_uuids. The user_uuids and the usernames
+            not found are left out, to be looked up one by one by the server.
+        """
+        resolved: Dict[str, str] = {}
+        usernames = set(users)
+
+        # a single lookup is cheaper than listing the users
+        if len(usernames) > 1:
+            for u in User.iter_all(disabled=disabled):
+                if u.username in usernames:
+                    resolved[u.username] = u.uuid
+                    usernames.remove(u.username)
+                    if not usernames:
+                        break
+
+        return resolved
+
+    @staticmethod
+    def _change_users_state(
+        users: List[str],
+        change_state: Callable[[str], Dict[str, Any]],
+        disabled: bool,
+        max_workers: int,
+        raise_on_error: bool,
+    ) -> pd.DataFrame:
+        """Enable or disable the users concurrently.
+
+        Args:
+            users: user_uuids/usernames of the users to enable or disable.
+            change_state: Function sending the request to change the state of a user, called with the user_uuid.
+            disabled: The current state of the users, used to resolve their usernames.
+            max_workers: The maximum number of requests sent in parallel.
+            raise_on_error: Whether to raise the first error or report the errors per user.
+
+        Returns:
+            A pandas DataFrame encapsulating the details of the users, in the same order as passed.
+        """
+        user_uuids = User._resolve_user_uuids(users, disabled=disabled)
+
+        def _change_user_state(user: str) -> Dict[str, Any]:
+            # the users not found while resolving are looked up one by one
+            user_uuid = user_uuids.get(user) or str(User.details(user=user)["uuid"])
+            return change_state(user_uuid)
+
+        responses: Dict[int, Dict[str, Any]] = {}
+        errors: Dict[int, str] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="airt-users"
+        ) as executor:
+            futures = {
+                executor.submit(_change_user_state, user): i
+                for i, user in enumerate(users)
+            }
+            try:
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        responses[i] = future.result()
+                    except Exception as e:
+                        if raise_on_error:
+                            raise
+                        errors[i] = str(e)
+            except BaseException:
+                # don't change the state of the users not yet processed if one of them failed, the requests
+                # already sent are completed before the executor shuts down
+                for future in futures:
+                    future.cancel()
+                raise
+
+        df = pd.DataFrame(
+            [responses.get(i, {}) for i in range(len(users))], columns=User.USER_COLS
+        )
+        if raise_on_error:
+            return df
 
-        return pd.DataFrame(response_list)[User.USER_COLS]
+        df["error"] = [errors.get(i) for i in range(len(users))]
+        df.index = pd.Index(users, name="user")
+        return df
 
     @staticmethod
     def details(user: Optional[str] = None) -> Dict[str, Union[str, bool]]:
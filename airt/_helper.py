@@ -1,22 +1,28 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/API_Helper.ipynb.
 
 # %% auto 0
-__all__ = ['ensure_is_instance', 'get_base_url', 'post_data', 'get_data', 'delete_data', 'add_ready_column', 'generate_df',
-           'get_values_from_item', 'get_attributes_from_instances', 'dict_to_df', 'standardize_phone_number']
+__all__ = ['ensure_is_instance', 'get_base_url', 'create_session', 'post_data', 'get_data', 'get_data_if_modified', 'delete_data',
+           'add_ready_column', 'generate_df', 'get_values_from_item', 'get_attributes_from_instances', 'iter_pages',
+           'dict_to_df', 'standardize_phone_number']
 
 # %% ../notebooks/API_Helper.ipynb 2
 from typing import *
 
 # %% ../notebooks/API_Helper.ipynb 3
+import json
 import os
 import textwrap
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from types import MethodType
 
-import pandas as pd
 import requests
 
 from airt._constant import PROD_URL, SERVER_URL
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 # %% ../notebooks/API_Helper.ipynb 5
 def ensure_is_instance(o: Any, cls: Type):
     """A function to check if the object argument is an instance of the class argument.
@@ -68,11 +74,48 @@ def get_base_url(server: Optional[str]) -> str:
     return server if server is not None else os.environ.get(SERVER_URL, PROD_URL)
 
 # %% ../notebooks/API_Helper.ipynb 15
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """Create a session with a pooled HTTP adapter mounted for both http and https.
+
+    Reusing the returned session across requests keeps the TCP/TLS connections open, so only the first
+    request to a host pays for the handshake.
+
+    Args:
+        pool_connections: The number of hosts for which a connection pool is cached.
+        pool_maxsize: The maximum number of connections kept open per host.
+        pool_block: If set to **True**, requests will block until a pooled connection to the host is free instead
+            of opening an additional connection, making **pool_maxsize** a hard per-host limit.
+        keep_alive: If set to **False**, the connections will be closed after every request.
+
+    Returns:
+        An instance of `requests.Session`.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
+
+# %% ../notebooks/API_Helper.ipynb 17
 def post_data(
     url: str,
     token: Optional[str],
     data: Optional[Dict[str, Any]] = None,
     json: Optional[Dict[str, Any]] = None,
+    session: Optional[requests.Session] = None,
 ) -> Dict[str, Any]:
     """A function to send a POST request.
 
@@ -82,6 +125,7 @@ def post_data(
         json: A Dictionary object to send in the body of the POST request. The data sent in this param will automatically be JSON-encoded by the request library.
         token: The unique auth token for the client, obtained via calling the `Client.get_token()` method.
             Set it to `None` in `Client.get_token()` to obtain the token.
+        session: The session to send the request with. If **None** (default value), a new connection will be opened for the request.
 
     Returns:
         A dictionary that encapsulates the response body.
@@ -90,39 +134,112 @@ def post_data(
         ConnectionError: If the server is not reachable.
         ValueError: If the response code is not in range of 200 - 399.
     """
+    requester = session if session is not None else requests
     if token is not None:
         headers = {"Authorization": f"Bearer {token}"}
-        response = requests.post(url, json=json, data=data, headers=headers)
+        response = requester.post(url, json=json, data=data, headers=headers)
     else:
-        response = requests.post(url, data=data, json=json)
+        response = requester.post(url, data=data, json=json)
     return _get_json(response)
 
-# %% ../notebooks/API_Helper.ipynb 18
-def get_data(url: str, token: Optional[str]) -> Any:
+# %% ../notebooks/API_Helper.ipynb 20
+def get_data(
+    url: str,
+    token: Optional[str],
+    session: Optional[requests.Session] = None,
+    accept: Optional[str] = None,
+) -> Any:
     """Send a GET request.
 
     Args:
         url: The URL of the server to which the request needs to be sent.
         token: The unique auth token for the client, obtained via calling the `Client.get_token()` method.
+        session: The session to send the request with. If **None** (default value), a new connection will be opened for the request.
+        accept: The media types accepted in the response, in the format of the Accept header. If **None** (default value),
+            the response is expected to be JSON.
 
     Returns:
-        A dictionary that encapsulates the response body.
+        A dictionary that encapsulates the response body. If **accept** is passed and the server responds with a
+        media type other than JSON, the raw response body is returned as bytes.
 
     Raises:
         ConnectionError: If the server is not reachable.
         ValueError: If the response code is not in range of 200 - 399.
     """
     headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(url, headers=headers)
+    if accept is not None:
+        headers["Accept"] = accept
+    requester = session if session is not None else requests
+    response = requester.get(url, headers=headers)
+    if (
+        accept is not None
+        and response
+        and not response.headers.get("content-type", "").startswith("application/json")
+    ):
+        return response.content
     return _get_json(response)
 
-# %% ../notebooks/API_Helper.ipynb 20
-def delete_data(url: str, token: Optional[str]) -> Dict[str, Any]:
+# %% ../notebooks/API_Helper.ipynb 22
+def get_data_if_modified(
+    url: str,
+    token: Optional[str],
+    validated: Optional[Tuple[Optional[str], Optional[str], bytes]] = None,
+    session: Optional[requests.Session] = None,
+) -> Tuple[Any, Optional[Tuple[Optional[str], Optional[str], bytes]]]:
+    """Send a conditional GET request for a JSON response.
+
+    If the response to the previous request for the same URL is passed in **validated**, the request is sent with the
+    If-None-Match and If-Modified-Since headers set to its ETag and Last-Modified date. If the server responds with
+    304 Not Modified, the body of the previous response is returned without being sent again by the server.
+
+    Args:
+        url: The URL of the server to which the request needs to be sent.
+        token: The unique auth token for the client, obtained via calling the `Client.get_token()` method.
+        validated: A tuple of the ETag, the Last-Modified date and the raw body of the previous response, as returned
+            by the previous call. If **None** (default value), an unconditional request is sent.
+        session: The session to send the request with. If **None** (default value), a new connection will be opened for the request.
+
+    Returns:
+        A tuple of the dictionary that encapsulates the response body and, if the response has an ETag or a
+        Last-Modified date, a tuple of them and the raw response body to be passed to the next call, else **None**.
+
+    Raises:
+        ConnectionError: If the server is not reachable.
+        ValueError: If the response code is not in range of 200 - 399.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    if validated is not None:
+        etag, last_modified, _ = validated
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+
+    requester = session if session is not None else requests
+    response = requester.get(url, headers=headers)
+    if response.status_code == 304 and validated is not None:
+        return json.loads(validated[2]), validated
+
+    body = _get_json(response)
+    etag, last_modified = (
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+    )
+    if etag is None and last_modified is None:
+        return body, None
+
+    return body, (etag, last_modified, response.content)
+
+# %% ../notebooks/API_Helper.ipynb 25
+def delete_data(
+    url: str, token: Optional[str], session: Optional[requests.Session] = None
+) -> Dict[str, Any]:
     """Send a DELETE request.
 
     Args:
         url: The URL of the server to which the request needs to be sent.
         token: The unique auth token for the client, obtained via calling the `Client.get_token()` method.
+        session: The session to send the request with. If **None** (default value), a new connection will be opened for the request.
 
     Returns:
         A dictionary that encapsulates the response body.
@@ -132,11 +249,12 @@ def delete_data(url: str, token: Optional[str]) -> Dict[str, Any]:
         ValueError: If the response code is not in range of 200 - 399.
     """
     headers = {"Authorization": f"Bearer {token}"}
-    response = requests.delete(url, headers=headers)
+    requester = session if session is not None else requests
+    response = requester.delete(url, headers=headers)
     return _get_json(response)
 
-# %% ../notebooks/API_Helper.ipynb 23
-def add_ready_column(df: pd.DataFrame) -> pd.DataFrame:
+# %% ../notebooks/API_Helper.ipynb 28
+def add_ready_column(df: "pd.DataFrame") -> "pd.DataFrame":
     """Add ready column to the DataFrame
 
     Args:
@@ -149,10 +267,10 @@ def add_ready_column(df: pd.DataFrame) -> pd.DataFrame:
     df["ready"] = df["completed_steps"] == df["total_steps"]
     return df.drop(columns=["completed_steps", "total_steps"])
 
-# %% ../notebooks/API_Helper.ipynb 25
+# %% ../notebooks/API_Helper.ipynb 30
 def generate_df(
     items: Union[Dict[str, Any], List[Dict[str, Any]]], columns: list
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """Generate a DataFrame based on the items length
 
     Args:
@@ -162,6 +280,7 @@ def generate_df(
     Returns:
         A DataFrame with a shape of (items, columns), if the length of the items is > 0, otherwise an empty DataFrame with only columns names.
     """
+    import pandas as pd
 
     if len(items) > 0:
         df = pd.DataFrame(items)[columns]
@@ -170,7 +289,7 @@ def generate_df(
 
     return df
 
-# %% ../notebooks/API_Helper.ipynb 27
+# %% ../notebooks/API_Helper.ipynb 32
 def get_values_from_item(items: list, value: Optional[str] = None) -> str:
     """Get **values** from items seperated by comma.
 
@@ -190,14 +309,14 @@ def get_values_from_item(items: list, value: Optional[str] = None) -> str:
 
     return ", ".join([str(i[value]) for i in items])
 
-# %% ../notebooks/API_Helper.ipynb 31
+# %% ../notebooks/API_Helper.ipynb 36
 def get_attributes_from_instances(
-    ox: List[object], attributes: List[str]
+    ox: Iterable[object], attributes: List[str]
 ) -> List[Dict[str, Any]]:
     """Extract the **attributes** from the instances.
 
     Args:
-        ox: List of instances.
+        ox: List or iterator of instances.
         attributes: Attributes to extract from the instances as a list
 
     Returns:
@@ -207,29 +326,105 @@ def get_attributes_from_instances(
     lists = [{i: getattr(o, i) for i in attributes} for o in ox]
     return lists
 
-# %% ../notebooks/API_Helper.ipynb 33
-def dict_to_df(d: Dict[str, Any]) -> pd.DataFrame:
+# %% ../notebooks/API_Helper.ipynb 38
+def iter_pages(
+    fetch_page: Callable[[int, int], List[Any]],
+    page_size: int = 100,
+    prefetch: int = 0,
+) -> Iterator[Any]:
+    """Iterate over the items of all pages of a paginated route.
+
+    The pages are requested lazily as the items are consumed, until a page with less than **page_size** items is
+    returned. If **prefetch** is set, the next pages are requested in background threads while the items of the
+    current page are consumed, so the network latency is overlapped with the processing of the items.
+
+    Args:
+        fetch_page: A function returning the items of a page for the **offset** and **limit** passed to it.
+        page_size: The number of items requested per page.
+        prefetch: The number of pages requested ahead of the page being consumed. If **0** (default value),
+            the next page is requested only after all the items of the current page are consumed.
+
+    Returns:
+        A generator of the items of all pages, in order.
+    """
+    if prefetch <= 0:
+        offset = 0
+        while True:
+            page = fetch_page(offset, page_size)
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    executor = ThreadPoolExecutor(
+        max_workers=prefetch, thread_name_prefix="airt-prefetch"
+    )
+    pages = deque(
+        executor.submit(fetch_page, i * page_size, page_size)
+        for i in range(prefetch + 1)
+    )
+    next_page = prefetch + 1
+    try:
+        while True:
+            page = pages.popleft().result()
+            if len(page) < page_size:
+                yield from page
+                return
+
+            pages.append(executor.submit(fetch_page, next_page * page_size, page_size))
+            next_page += 1
+            yield from page
+    finally:
+        # the pages requested after the last one or after the generator is closed are discarded
+        for future in pages:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+# %% ../notebooks/API_Helper.ipynb 41
+def dict_to_df(d: Dict[str, Any]) -> "pd.DataFrame":
     """Convert the dict into a pandas dataframe
 
+    The columns sharing the same dtype are converted together in a single block, instead of converting and
+    assigning every column separately, which is slow for dataframes with a lot of columns.
+
     Args:
         d: Dict containing the data and dtypes
 
     Returns:
         The pandas dataframe constructed from the dict
     """
+    import numpy as np
+    import pandas as pd
+
     data = d["data"]
     dtypes = d["dtypes"]
 
-    df = pd.DataFrame(
-        data=data["data"], index=data["index"], columns=data["columns"]
-    ).rename_axis(data["index_names"])
-
-    for k, v in dtypes.items():
-        df[k] = df[k].astype(v)
+    values = np.empty((len(data["data"]), len(data["columns"])), dtype=object)
+    if data["data"]:
+        values[:] = data["data"]
+
+    positions = defaultdict(list)
+    for i, column in enumerate(data["columns"]):
+        positions[dtypes.get(column)].append(i)
+
+    blocks = [
+        pd.DataFrame(values[:, idx], columns=idx).astype(dtype)
+        if dtype is not None
+        else pd.DataFrame(values[:, idx], columns=idx).infer_objects()
+        for dtype, idx in positions.items()
+    ]
+    if not blocks:
+        # a dataframe without any columns
+        df = pd.DataFrame(index=range(len(values)))
+    else:
+        df = blocks[0] if len(blocks) == 1 else pd.concat(blocks, axis=1)
+    df = df[list(range(len(data["columns"])))]
+    df.columns = data["columns"]
+    df.index = data["index"]
 
-    return df
+    return df.rename_axis(data["index_names"])
 
-# %% ../notebooks/API_Helper.ipynb 35
+# %% ../notebooks/API_Helper.ipynb 44
 def check_and_append_otp_query_param(relative_url: str, otp: Union[str, None]) -> str:
     """Append the otp query parameter to the relative url if its not None
 
@@ -248,7 +443,7 @@ def check_and_append_otp_query_param(relative_url: str, otp: Union[str, None]) -
         )
     return relative_url
 
-# %% ../notebooks/API_Helper.ipynb 39
+# %% ../notebooks/API_Helper.ipynb 48
 def standardize_phone_number(phone_number: str) -> str:
     """Standardize the user's phone number
 
@@ -268,7 +463,7 @@ def standardize_phone_number(phone_number: str) -> str:
         phone_number = phone_number[2:]
     return phone_number
 
-# %% ../notebooks/API_Helper.ipynb 41
+# %% ../notebooks/API_Helper.ipynb 50
 def add_example_to_docs(o: Any, example: str):
     """Add the given example to the object
 
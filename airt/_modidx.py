@@ -9,7 +9,10 @@ d = { 'settings': { 'branch': 'main',
                                    'airt._cli.api_key.details': ('cli_key.html#details', 'airt/_cli/api_key.py'),
                                    'airt._cli.api_key.ls': ('cli_key.html#ls', 'airt/_cli/api_key.py'),
                                    'airt._cli.api_key.revoke': ('cli_key.html#revoke', 'airt/_cli/api_key.py')},
-            'airt._cli.cli': {},
+            'airt._cli.cli': { 'airt._cli.cli._LazyGroup': ('cli.html#_lazygroup', 'airt/_cli/cli.py'),
+                               'airt._cli.cli._LazyGroup.get_command': ('cli.html#_lazygroup.get_command', 'airt/_cli/cli.py'),
+                               'airt._cli.cli._LazyGroup.list_commands': ('cli.html#_lazygroup.list_commands', 'airt/_cli/cli.py'),
+                               'airt._cli.cli._main': ('cli.html#_main', 'airt/_cli/cli.py')},
             'airt._cli.db': { 'airt._cli.db.details': ('cli_datablob.html#details', 'airt/_cli/db.py'),
                               'airt._cli.db.from_azure_blob_storage': ('cli_datablob.html#from_azure_blob_storage', 'airt/_cli/db.py'),
                               'airt._cli.db.from_clickhouse': ('cli_datablob.html#from_clickhouse', 'airt/_cli/db.py'),
@@ -71,6 +74,122 @@ d = { 'settings': { 'branch': 'main',
                                 'airt._cli.user.reset_password': ('cli_user.html#reset_password', 'airt/_cli/user.py'),
                                 'airt._cli.user.update': ('cli_user.html#update', 'airt/_cli/user.py')},
             'airt._cli.version': {'airt._cli.version.version': ('cli_version.html#version', 'airt/_cli/version.py')},
+            'airt._components.aio': { 'airt._components.aio.AsyncClient': ('api_aio.html#asyncclient', 'airt/_components/aio.py'),
+                                      'airt._components.aio.AsyncClient._delete_data': ( 'api_aio.html#asyncclient._delete_data',
+                                                                                         'airt/_components/aio.py'),
+                                      'airt._components.aio.AsyncClient._get_data': ( 'api_aio.html#asyncclient._get_data',
+                                                                                      'airt/_components/aio.py'),
+                                      'airt._components.aio.AsyncClient._get_executor': ( 'api_aio.html#asyncclient._get_executor',
+                                                                                          'airt/_components/aio.py'),
+                                      'airt._components.aio.AsyncClient._post_data': ( 'api_aio.html#asyncclient._post_data',
+                                                                                       'airt/_components/aio.py'),
+                                      'airt._components.aio.AsyncClient._run': ('api_aio.html#asyncclient._run', 'airt/_components/aio.py'),
+                                      'airt._components.aio.AsyncClient._run_transfer': ( 'api_aio.html#asyncclient._run_transfer',
+                                                                                          'airt/_components/aio.py'),
+                                      'airt._components.aio.AsyncClient.close': ( 'api_aio.html#asyncclient.close',
+                                                                                  'airt/_components/aio.py'),
+                                      'airt._components.aio.AsyncClient.get_token': ( 'api_aio.html#asyncclient.get_token',
+                                                                                      'airt/_components/aio.py'),
+                                      'airt._components.aio.AsyncClient.set_token': ( 'api_aio.html#asyncclient.set_token',
+                                                                                      'airt/_components/aio.py'),
+                                      'airt._components.aio.AsyncClient.version': ( 'api_aio.html#asyncclient.version',
+                                                                                    'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob': ('api_aio.html#datablob', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.as_df': ('api_aio.html#datablob.as_df', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.delete': ('api_aio.html#datablob.delete', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.details': ('api_aio.html#datablob.details', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.from_azure_blob_storage': ( 'api_aio.html#datablob.from_azure_blob_storage',
+                                                                                                 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.from_clickhouse': ( 'api_aio.html#datablob.from_clickhouse',
+                                                                                         'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.from_local': ( 'api_aio.html#datablob.from_local',
+                                                                                    'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.from_mysql': ( 'api_aio.html#datablob.from_mysql',
+                                                                                    'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.from_s3': ('api_aio.html#datablob.from_s3', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.is_ready': ( 'api_aio.html#datablob.is_ready',
+                                                                                  'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.iter_all': ( 'api_aio.html#datablob.iter_all',
+                                                                                  'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.ls': ('api_aio.html#datablob.ls', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.tag': ('api_aio.html#datablob.tag', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.to_datasource': ( 'api_aio.html#datablob.to_datasource',
+                                                                                       'airt/_components/aio.py'),
+                                      'airt._components.aio.DataBlob.wait': ('api_aio.html#datablob.wait', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataSource': ('api_aio.html#datasource', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataSource.as_df': ('api_aio.html#datasource.as_df', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataSource.delete': ( 'api_aio.html#datasource.delete',
+                                                                                  'airt/_components/aio.py'),
+                                      'airt._components.aio.DataSource.details': ( 'api_aio.html#datasource.details',
+                                                                                   'airt/_components/aio.py'),
+                                      'airt._components.aio.DataSource.dtypes': ( 'api_aio.html#datasource.dtypes',
+                                                                                  'airt/_components/aio.py'),
+                                      'airt._components.aio.DataSource.head': ('api_aio.html#datasource.head', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataSource.is_ready': ( 'api_aio.html#datasource.is_ready',
+                                                                                    'airt/_components/aio.py'),
+                                      'airt._components.aio.DataSource.iter_all': ( 'api_aio.html#datasource.iter_all',
+                                                                                    'airt/_components/aio.py'),
+                                      'airt._components.aio.DataSource.ls': ('api_aio.html#datasource.ls', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataSource.tag': ('api_aio.html#datasource.tag', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataSource.train': ('api_aio.html#datasource.train', 'airt/_components/aio.py'),
+                                      'airt._components.aio.DataSource.wait': ('api_aio.html#datasource.wait', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Model': ('api_aio.html#model', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Model.as_df': ('api_aio.html#model.as_df', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Model.delete': ('api_aio.html#model.delete', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Model.details': ('api_aio.html#model.details', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Model.evaluate': ('api_aio.html#model.evaluate', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Model.is_ready': ('api_aio.html#model.is_ready', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Model.iter_all': ('api_aio.html#model.iter_all', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Model.ls': ('api_aio.html#model.ls', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Model.predict': ('api_aio.html#model.predict', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Model.wait': ('api_aio.html#model.wait', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction': ('api_aio.html#prediction', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.above': ('api_aio.html#prediction.above', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.as_df': ('api_aio.html#prediction.as_df', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.delete': ( 'api_aio.html#prediction.delete',
+                                                                                  'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.details': ( 'api_aio.html#prediction.details',
+                                                                                   'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.is_ready': ( 'api_aio.html#prediction.is_ready',
+                                                                                    'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.iter_all': ( 'api_aio.html#prediction.iter_all',
+                                                                                    'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.iter_batches': ( 'api_aio.html#prediction.iter_batches',
+                                                                                        'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.ls': ('api_aio.html#prediction.ls', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.to_azure_blob_storage': ( 'api_aio.html#prediction.to_azure_blob_storage',
+                                                                                                 'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.to_clickhouse': ( 'api_aio.html#prediction.to_clickhouse',
+                                                                                         'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.to_local': ( 'api_aio.html#prediction.to_local',
+                                                                                    'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.to_mysql': ( 'api_aio.html#prediction.to_mysql',
+                                                                                    'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.to_pandas': ( 'api_aio.html#prediction.to_pandas',
+                                                                                     'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.to_s3': ('api_aio.html#prediction.to_s3', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.top_k': ('api_aio.html#prediction.top_k', 'airt/_components/aio.py'),
+                                      'airt._components.aio.Prediction.wait': ('api_aio.html#prediction.wait', 'airt/_components/aio.py'),
+                                      'airt._components.aio.ProgressStatus': ('api_aio.html#progressstatus', 'airt/_components/aio.py'),
+                                      'airt._components.aio.ProgressStatus.__init__': ( 'api_aio.html#progressstatus.__init__',
+                                                                                        'airt/_components/aio.py'),
+                                      'airt._components.aio.ProgressStatus._get_status': ( 'api_aio.html#progressstatus._get_status',
+                                                                                           'airt/_components/aio.py'),
+                                      'airt._components.aio.ProgressStatus.is_ready': ( 'api_aio.html#progressstatus.is_ready',
+                                                                                        'airt/_components/aio.py'),
+                                      'airt._components.aio.ProgressStatus.wait': ( 'api_aio.html#progressstatus.wait',
+                                                                                    'airt/_components/aio.py'),
+                                      'airt._components.aio._AsyncResource': ('api_aio.html#_asyncresource', 'airt/_components/aio.py'),
+                                      'airt._components.aio._AsyncResource.__getattr__': ( 'api_aio.html#_asyncresource.__getattr__',
+                                                                                           'airt/_components/aio.py'),
+                                      'airt._components.aio._AsyncResource.__init__': ( 'api_aio.html#_asyncresource.__init__',
+                                                                                        'airt/_components/aio.py'),
+                                      'airt._components.aio._AsyncResource.__repr__': ( 'api_aio.html#_asyncresource.__repr__',
+                                                                                        'airt/_components/aio.py'),
+                                      'airt._components.aio._AsyncResource._iter_pages': ( 'api_aio.html#_asyncresource._iter_pages',
+                                                                                           'airt/_components/aio.py'),
+                                      'airt._components.aio._AsyncResource._wait': ( 'api_aio.html#_asyncresource._wait',
+                                                                                     'airt/_components/aio.py')},
             'airt._components.api_key': { 'airt._components.api_key.APIKey': ('api_keys.html#apikey', 'airt/_components/api_key.py'),
                                           'airt._components.api_key.APIKey.__init__': ( 'api_keys.html#apikey.__init__',
                                                                                         'airt/_components/api_key.py'),
@@ -82,6 +201,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                       'airt/_components/api_key.py'),
                                           'airt._components.api_key.APIKey.details': ( 'api_keys.html#apikey.details',
                                                                                        'airt/_components/api_key.py'),
+                                          'airt._components.api_key.APIKey.iter_all': ( 'api_keys.html#apikey.iter_all',
+                                                                                        'airt/_components/api_key.py'),
                                           'airt._components.api_key.APIKey.ls': ('api_keys.html#apikey.ls', 'airt/_components/api_key.py'),
                                           'airt._components.api_key.APIKey.revoke': ( 'api_keys.html#apikey.revoke',
                                                                                       'airt/_components/api_key.py')},
@@ -90,12 +211,30 @@ d = { 'settings': { 'branch': 'main',
                                                                                       'airt/_components/client.py'),
                                          'airt._components.client.Client._delete_data': ( 'api_client.html#client._delete_data',
                                                                                           'airt/_components/client.py'),
+                                         'airt._components.client.Client._get_artifact': ( 'api_client.html#client._get_artifact',
+                                                                                           'airt/_components/client.py'),
                                          'airt._components.client.Client._get_data': ( 'api_client.html#client._get_data',
                                                                                        'airt/_components/client.py'),
                                          'airt._components.client.Client._get_server_url_and_token': ( 'api_client.html#client._get_server_url_and_token',
                                                                                                        'airt/_components/client.py'),
+                                         'airt._components.client.Client._get_session': ( 'api_client.html#client._get_session',
+                                                                                          'airt/_components/client.py'),
+                                         'airt._components.client.Client._invalidate_cache': ( 'api_client.html#client._invalidate_cache',
+                                                                                               'airt/_components/client.py'),
                                          'airt._components.client.Client._post_data': ( 'api_client.html#client._post_data',
                                                                                         'airt/_components/client.py'),
+                                         'airt._components.client.Client.close_session': ( 'api_client.html#client.close_session',
+                                                                                           'airt/_components/client.py'),
+                                         'airt._components.client.Client.configure_session': ( 'api_client.html#client.configure_session',
+                                                                                               'airt/_components/client.py'),
+                                         'airt._components.client.Client.disable_cache': ( 'api_client.html#client.disable_cache',
+                                                                                           'airt/_components/client.py'),
+                                         'airt._components.client.Client.disable_disk_cache': ( 'api_client.html#client.disable_disk_cache',
+                                                                                                'airt/_components/client.py'),
+                                         'airt._components.client.Client.enable_cache': ( 'api_client.html#client.enable_cache',
+                                                                                          'airt/_components/client.py'),
+                                         'airt._components.client.Client.enable_disk_cache': ( 'api_client.html#client.enable_disk_cache',
+                                                                                               'airt/_components/client.py'),
                                          'airt._components.client.Client.get_token': ( 'api_client.html#client.get_token',
                                                                                        'airt/_components/client.py'),
                                          'airt._components.client.Client.set_sso_token': ( 'api_client.html#client.set_sso_token',
@@ -104,12 +243,47 @@ d = { 'settings': { 'branch': 'main',
                                                                                        'airt/_components/client.py'),
                                          'airt._components.client.Client.version': ( 'api_client.html#client.version',
                                                                                      'airt/_components/client.py'),
+                                         'airt._components.client._DiskCache': ('api_client.html#_diskcache', 'airt/_components/client.py'),
+                                         'airt._components.client._DiskCache.__init__': ( 'api_client.html#_diskcache.__init__',
+                                                                                          'airt/_components/client.py'),
+                                         'airt._components.client._DiskCache._evict': ( 'api_client.html#_diskcache._evict',
+                                                                                        'airt/_components/client.py'),
+                                         'airt._components.client._DiskCache._get_path': ( 'api_client.html#_diskcache._get_path',
+                                                                                           'airt/_components/client.py'),
+                                         'airt._components.client._DiskCache._hash': ( 'api_client.html#_diskcache._hash',
+                                                                                       'airt/_components/client.py'),
+                                         'airt._components.client._DiskCache.copy_to': ( 'api_client.html#_diskcache.copy_to',
+                                                                                         'airt/_components/client.py'),
+                                         'airt._components.client._DiskCache.invalidate': ( 'api_client.html#_diskcache.invalidate',
+                                                                                            'airt/_components/client.py'),
+                                         'airt._components.client._DiskCache.read': ( 'api_client.html#_diskcache.read',
+                                                                                      'airt/_components/client.py'),
+                                         'airt._components.client._DiskCache.write': ( 'api_client.html#_diskcache.write',
+                                                                                       'airt/_components/client.py'),
+                                         'airt._components.client._DiskCache.write_file': ( 'api_client.html#_diskcache.write_file',
+                                                                                            'airt/_components/client.py'),
+                                         'airt._components.client._ResponseCache': ( 'api_client.html#_responsecache',
+                                                                                     'airt/_components/client.py'),
+                                         'airt._components.client._ResponseCache.__init__': ( 'api_client.html#_responsecache.__init__',
+                                                                                              'airt/_components/client.py'),
+                                         'airt._components.client._ResponseCache.__len__': ( 'api_client.html#_responsecache.__len__',
+                                                                                             'airt/_components/client.py'),
+                                         'airt._components.client._ResponseCache.get': ( 'api_client.html#_responsecache.get',
+                                                                                         'airt/_components/client.py'),
+                                         'airt._components.client._ResponseCache.invalidate': ( 'api_client.html#_responsecache.invalidate',
+                                                                                                'airt/_components/client.py'),
+                                         'airt._components.client._ResponseCache.set': ( 'api_client.html#_responsecache.set',
+                                                                                         'airt/_components/client.py'),
                                          'airt._components.client._get_credentials': ( 'api_client.html#_get_credentials',
-                                                                                       'airt/_components/client.py')},
+                                                                                       'airt/_components/client.py'),
+                                         'airt._components.client._is_cacheable': ( 'api_client.html#_is_cacheable',
+                                                                                    'airt/_components/client.py')},
             'airt._components.datablob': { 'airt._components.datablob.DataBlob': ( 'api_datablob.html#datablob',
                                                                                    'airt/_components/datablob.py'),
                                            'airt._components.datablob.DataBlob.__init__': ( 'api_datablob.html#datablob.__init__',
                                                                                             'airt/_components/datablob.py'),
+                                           'airt._components.datablob.DataBlob._generate_df': ( 'api_datablob.html#datablob._generate_df',
+                                                                                                'airt/_components/datablob.py'),
                                            'airt._components.datablob.DataBlob._get_cloud_provider_and_region': ( 'api_datablob.html#datablob._get_cloud_provider_and_region',
                                                                                                                   'airt/_components/datablob.py'),
                                            'airt._components.datablob.DataBlob._get_default_provider_and_regions': ( 'api_datablob.html#datablob._get_default_provider_and_regions',
@@ -136,6 +310,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                            'airt/_components/datablob.py'),
                                            'airt._components.datablob.DataBlob.is_ready': ( 'api_datablob.html#datablob.is_ready',
                                                                                             'airt/_components/datablob.py'),
+                                           'airt._components.datablob.DataBlob.iter_all': ( 'api_datablob.html#datablob.iter_all',
+                                                                                            'airt/_components/datablob.py'),
                                            'airt._components.datablob.DataBlob.ls': ( 'api_datablob.html#datablob.ls',
                                                                                       'airt/_components/datablob.py'),
                                            'airt._components.datablob.DataBlob.progress_bar': ( 'api_datablob.html#datablob.progress_bar',
@@ -148,12 +324,46 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'airt/_components/datablob.py'),
                                            'airt._components.datablob.DataBlob.wait': ( 'api_datablob.html#datablob.wait',
                                                                                         'airt/_components/datablob.py'),
+                                           'airt._components.datablob._MultipartFileStream': ( 'api_datablob.html#_multipartfilestream',
+                                                                                               'airt/_components/datablob.py'),
+                                           'airt._components.datablob._MultipartFileStream.__enter__': ( 'api_datablob.html#_multipartfilestream.__enter__',
+                                                                                                         'airt/_components/datablob.py'),
+                                           'airt._components.datablob._MultipartFileStream.__exit__': ( 'api_datablob.html#_multipartfilestream.__exit__',
+                                                                                                        'airt/_components/datablob.py'),
+                                           'airt._components.datablob._MultipartFileStream.__init__': ( 'api_datablob.html#_multipartfilestream.__init__',
+                                                                                                        'airt/_components/datablob.py'),
+                                           'airt._components.datablob._MultipartFileStream.__len__': ( 'api_datablob.html#_multipartfilestream.__len__',
+                                                                                                       'airt/_components/datablob.py'),
+                                           'airt._components.datablob._MultipartFileStream.close': ( 'api_datablob.html#_multipartfilestream.close',
+                                                                                                     'airt/_components/datablob.py'),
+                                           'airt._components.datablob._MultipartFileStream.read': ( 'api_datablob.html#_multipartfilestream.read',
+                                                                                                    'airt/_components/datablob.py'),
                                            'airt._components.datablob._docstring_example': ( 'api_datablob.html#_docstring_example',
-                                                                                             'airt/_components/datablob.py')},
+                                                                                             'airt/_components/datablob.py'),
+                                           'airt._components.datablob._get_tmp_path': ( 'api_datablob.html#_get_tmp_path',
+                                                                                        'airt/_components/datablob.py'),
+                                           'airt._components.datablob._get_upload_key': ( 'api_datablob.html#_get_upload_key',
+                                                                                          'airt/_components/datablob.py'),
+                                           'airt._components.datablob._get_upload_state': ( 'api_datablob.html#_get_upload_state',
+                                                                                            'airt/_components/datablob.py'),
+                                           'airt._components.datablob._is_presigned_post_expired': ( 'api_datablob.html#_is_presigned_post_expired',
+                                                                                                     'airt/_components/datablob.py'),
+                                           'airt._components.datablob._load_upload_manifest': ( 'api_datablob.html#_load_upload_manifest',
+                                                                                                'airt/_components/datablob.py'),
+                                           'airt._components.datablob._quote_multipart_param': ( 'api_datablob.html#_quote_multipart_param',
+                                                                                                 'airt/_components/datablob.py'),
+                                           'airt._components.datablob._record_upload': ( 'api_datablob.html#_record_upload',
+                                                                                         'airt/_components/datablob.py'),
+                                           'airt._components.datablob._save_upload_manifest': ( 'api_datablob.html#_save_upload_manifest',
+                                                                                                'airt/_components/datablob.py'),
+                                           'airt._components.datablob._split_csv_file': ( 'api_datablob.html#_split_csv_file',
+                                                                                          'airt/_components/datablob.py')},
             'airt._components.datasource': { 'airt._components.datasource.DataSource': ( 'api_datasource.html#datasource',
                                                                                          'airt/_components/datasource.py'),
                                              'airt._components.datasource.DataSource.__init__': ( 'api_datasource.html#datasource.__init__',
                                                                                                   'airt/_components/datasource.py'),
+                                             'airt._components.datasource.DataSource._generate_df': ( 'api_datasource.html#datasource._generate_df',
+                                                                                                      'airt/_components/datasource.py'),
                                              'airt._components.datasource.DataSource.as_df': ( 'api_datasource.html#datasource.as_df',
                                                                                                'airt/_components/datasource.py'),
                                              'airt._components.datasource.DataSource.delete': ( 'api_datasource.html#datasource.delete',
@@ -166,6 +376,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                               'airt/_components/datasource.py'),
                                              'airt._components.datasource.DataSource.is_ready': ( 'api_datasource.html#datasource.is_ready',
                                                                                                   'airt/_components/datasource.py'),
+                                             'airt._components.datasource.DataSource.iter_all': ( 'api_datasource.html#datasource.iter_all',
+                                                                                                  'airt/_components/datasource.py'),
                                              'airt._components.datasource.DataSource.ls': ( 'api_datasource.html#datasource.ls',
                                                                                             'airt/_components/datasource.py'),
                                              'airt._components.datasource.DataSource.progress_bar': ( 'api_datasource.html#datasource.progress_bar',
@@ -181,12 +393,16 @@ d = { 'settings': { 'branch': 'main',
             'airt._components.model': { 'airt._components.model.Model': ('api_model.html#model', 'airt/_components/model.py'),
                                         'airt._components.model.Model.__init__': ( 'api_model.html#model.__init__',
                                                                                    'airt/_components/model.py'),
+                                        'airt._components.model.Model._generate_df': ( 'api_model.html#model._generate_df',
+                                                                                       'airt/_components/model.py'),
                                         'airt._components.model.Model.as_df': ('api_model.html#model.as_df', 'airt/_components/model.py'),
                                         'airt._components.model.Model.delete': ('api_model.html#model.delete', 'airt/_components/model.py'),
                                         'airt._components.model.Model.details': ( 'api_model.html#model.details',
                                                                                   'airt/_components/model.py'),
                                         'airt._components.model.Model.evaluate': ( 'api_model.html#model.evaluate',
                                                                                    'airt/_components/model.py'),
+                                        'airt._components.model.Model.iter_all': ( 'api_model.html#model.iter_all',
+                                                                                   'airt/_components/model.py'),
                                         'airt._components.model.Model.ls': ('api_model.html#model.ls', 'airt/_components/model.py'),
                                         'airt._components.model.Model.predict': ( 'api_model.html#model.predict',
                                                                                   'airt/_components/model.py'),
@@ -198,12 +414,20 @@ d = { 'settings': { 'branch': 'main',
                                                                                                   'airt/_components/prediction.py'),
                                              'airt._components.prediction.Prediction._download_prediction_file_to_local': ( 'api_prediction.html#prediction._download_prediction_file_to_local',
                                                                                                                             'airt/_components/prediction.py'),
+                                             'airt._components.prediction.Prediction._generate_df': ( 'api_prediction.html#prediction._generate_df',
+                                                                                                      'airt/_components/prediction.py'),
+                                             'airt._components.prediction.Prediction.above': ( 'api_prediction.html#prediction.above',
+                                                                                               'airt/_components/prediction.py'),
                                              'airt._components.prediction.Prediction.as_df': ( 'api_prediction.html#prediction.as_df',
                                                                                                'airt/_components/prediction.py'),
                                              'airt._components.prediction.Prediction.delete': ( 'api_prediction.html#prediction.delete',
                                                                                                 'airt/_components/prediction.py'),
                                              'airt._components.prediction.Prediction.details': ( 'api_prediction.html#prediction.details',
                                                                                                  'airt/_components/prediction.py'),
+                                             'airt._components.prediction.Prediction.iter_all': ( 'api_prediction.html#prediction.iter_all',
+                                                                                                  'airt/_components/prediction.py'),
+                                             'airt._components.prediction.Prediction.iter_batches': ( 'api_prediction.html#prediction.iter_batches',
+                                                                                                      'airt/_components/prediction.py'),
                                              'airt._components.prediction.Prediction.ls': ( 'api_prediction.html#prediction.ls',
                                                                                             'airt/_components/prediction.py'),
                                              'airt._components.prediction.Prediction.to_azure_blob_storage': ( 'api_prediction.html#prediction.to_azure_blob_storage',
@@ -218,22 +442,106 @@ d = { 'settings': { 'branch': 'main',
                                                                                                    'airt/_components/prediction.py'),
                                              'airt._components.prediction.Prediction.to_s3': ( 'api_prediction.html#prediction.to_s3',
                                                                                                'airt/_components/prediction.py'),
+                                             'airt._components.prediction.Prediction.top_k': ( 'api_prediction.html#prediction.top_k',
+                                                                                               'airt/_components/prediction.py'),
+                                             'airt._components.prediction._columnar_to_pandas': ( 'api_prediction.html#_columnar_to_pandas',
+                                                                                                  'airt/_components/prediction.py'),
                                              'airt._components.prediction._docstring_example': ( 'api_prediction.html#_docstring_example',
-                                                                                                 'airt/_components/prediction.py')},
-            'airt._components.progress_status': { 'airt._components.progress_status.ProgressStatus': ( 'api_progressstatus.html#progressstatus',
+                                                                                                 'airt/_components/prediction.py'),
+                                             'airt._components.prediction._get_download_etag_path': ( 'api_prediction.html#_get_download_etag_path',
+                                                                                                      'airt/_components/prediction.py'),
+                                             'airt._components.prediction._get_download_tmp_path': ( 'api_prediction.html#_get_download_tmp_path',
+                                                                                                     'airt/_components/prediction.py'),
+                                             'airt._components.prediction._get_empty_predictions': ( 'api_prediction.html#_get_empty_predictions',
+                                                                                                     'airt/_components/prediction.py'),
+                                             'airt._components.prediction._get_file_md5': ( 'api_prediction.html#_get_file_md5',
+                                                                                            'airt/_components/prediction.py'),
+                                             'airt._components.prediction._get_md5_from_etag': ( 'api_prediction.html#_get_md5_from_etag',
+                                                                                                 'airt/_components/prediction.py'),
+                                             'airt._components.prediction._get_md5_from_response': ( 'api_prediction.html#_get_md5_from_response',
+                                                                                                     'airt/_components/prediction.py'),
+                                             'airt._components.prediction._get_pyarrow': ( 'api_prediction.html#_get_pyarrow',
+                                                                                           'airt/_components/prediction.py'),
+                                             'airt._components.prediction._get_remote_file_size': ( 'api_prediction.html#_get_remote_file_size',
+                                                                                                    'airt/_components/prediction.py'),
+                                             'airt._components.prediction._is_file_downloaded': ( 'api_prediction.html#_is_file_downloaded',
+                                                                                                  'airt/_components/prediction.py'),
+                                             'airt._components.prediction._is_remote_file_changed': ( 'api_prediction.html#_is_remote_file_changed',
+                                                                                                      'airt/_components/prediction.py'),
+                                             'airt._components.prediction._sort_predictions': ( 'api_prediction.html#_sort_predictions',
+                                                                                                'airt/_components/prediction.py'),
+                                             'airt._components.prediction._write_response_to_file': ( 'api_prediction.html#_write_response_to_file',
+                                                                                                      'airt/_components/prediction.py')},
+            'airt._components.progress_status': { 'airt._components.progress_status.ETAPolling': ( 'api_progressstatus.html#etapolling',
+                                                                                                   'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ETAPolling.__init__': ( 'api_progressstatus.html#etapolling.__init__',
+                                                                                                            'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ETAPolling.__repr__': ( 'api_progressstatus.html#etapolling.__repr__',
+                                                                                                            'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ETAPolling.next_delay': ( 'api_progressstatus.html#etapolling.next_delay',
+                                                                                                              'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ExponentialBackoffPolling': ( 'api_progressstatus.html#exponentialbackoffpolling',
+                                                                                                                  'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ExponentialBackoffPolling.__init__': ( 'api_progressstatus.html#exponentialbackoffpolling.__init__',
+                                                                                                                           'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ExponentialBackoffPolling.__repr__': ( 'api_progressstatus.html#exponentialbackoffpolling.__repr__',
+                                                                                                                           'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ExponentialBackoffPolling.next_delay': ( 'api_progressstatus.html#exponentialbackoffpolling.next_delay',
+                                                                                                                             'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.FixedPolling': ( 'api_progressstatus.html#fixedpolling',
+                                                                                                     'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.FixedPolling.__init__': ( 'api_progressstatus.html#fixedpolling.__init__',
+                                                                                                              'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.FixedPolling.__repr__': ( 'api_progressstatus.html#fixedpolling.__repr__',
+                                                                                                              'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.FixedPolling.next_delay': ( 'api_progressstatus.html#fixedpolling.next_delay',
+                                                                                                                'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.PollingStrategy': ( 'api_progressstatus.html#pollingstrategy',
+                                                                                                        'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.PollingStrategy.next_delay': ( 'api_progressstatus.html#pollingstrategy.next_delay',
+                                                                                                                   'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ProgressStatus': ( 'api_progressstatus.html#progressstatus',
                                                                                                        'airt/_components/progress_status.py'),
                                                   'airt._components.progress_status.ProgressStatus.__init__': ( 'api_progressstatus.html#progressstatus.__init__',
                                                                                                                 'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ProgressStatus._get_status': ( 'api_progressstatus.html#progressstatus._get_status',
+                                                                                                                   'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ProgressStatus.as_completed': ( 'api_progressstatus.html#progressstatus.as_completed',
+                                                                                                                    'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ProgressStatus.get_polling_metrics': ( 'api_progressstatus.html#progressstatus.get_polling_metrics',
+                                                                                                                           'airt/_components/progress_status.py'),
                                                   'airt._components.progress_status.ProgressStatus.is_ready': ( 'api_progressstatus.html#progressstatus.is_ready',
                                                                                                                 'airt/_components/progress_status.py'),
                                                   'airt._components.progress_status.ProgressStatus.progress_bar': ( 'api_progressstatus.html#progressstatus.progress_bar',
                                                                                                                     'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ProgressStatus.reset_polling_metrics': ( 'api_progressstatus.html#progressstatus.reset_polling_metrics',
+                                                                                                                             'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ProgressStatus.set_default_polling_strategy': ( 'api_progressstatus.html#progressstatus.set_default_polling_strategy',
+                                                                                                                                    'airt/_components/progress_status.py'),
                                                   'airt._components.progress_status.ProgressStatus.wait': ( 'api_progressstatus.html#progressstatus.wait',
-                                                                                                            'airt/_components/progress_status.py')},
+                                                                                                            'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ProgressStatus.wait_all': ( 'api_progressstatus.html#progressstatus.wait_all',
+                                                                                                                'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status.ProgressStatus.wait_any': ( 'api_progressstatus.html#progressstatus.wait_any',
+                                                                                                                'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status._get_polling_strategy': ( 'api_progressstatus.html#_get_polling_strategy',
+                                                                                                              'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status._get_relative_url': ( 'api_progressstatus.html#_get_relative_url',
+                                                                                                          'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status._list_completed': ( 'api_progressstatus.html#_list_completed',
+                                                                                                        'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status._next_poll_delay': ( 'api_progressstatus.html#_next_poll_delay',
+                                                                                                         'airt/_components/progress_status.py'),
+                                                  'airt._components.progress_status._record_polling_metrics': ( 'api_progressstatus.html#_record_polling_metrics',
+                                                                                                                'airt/_components/progress_status.py')},
             'airt._components.user': { 'airt._components.user.User': ('api_user.html#user', 'airt/_components/user.py'),
                                        'airt._components.user.User.__init__': ('api_user.html#user.__init__', 'airt/_components/user.py'),
+                                       'airt._components.user.User._change_users_state': ( 'api_user.html#user._change_users_state',
+                                                                                           'airt/_components/user.py'),
                                        'airt._components.user.User._get_mfa_provision_url': ( 'api_user.html#user._get_mfa_provision_url',
                                                                                               'airt/_components/user.py'),
+                                       'airt._components.user.User._resolve_user_uuids': ( 'api_user.html#user._resolve_user_uuids',
+                                                                                           'airt/_components/user.py'),
                                        'airt._components.user.User.activate_mfa': ( 'api_user.html#user.activate_mfa',
                                                                                     'airt/_components/user.py'),
                                        'airt._components.user.User.as_df': ('api_user.html#user.as_df', 'airt/_components/user.py'),
@@ -249,6 +557,7 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'airt/_components/user.py'),
                                        'airt._components.user.User.enable_sso': ( 'api_user.html#user.enable_sso',
                                                                                   'airt/_components/user.py'),
+                                       'airt._components.user.User.iter_all': ('api_user.html#user.iter_all', 'airt/_components/user.py'),
                                        'airt._components.user.User.ls': ('api_user.html#user.ls', 'airt/_components/user.py'),
                                        'airt._components.user.User.register_phone_number': ( 'api_user.html#user.register_phone_number',
                                                                                              'airt/_components/user.py'),
@@ -271,4 +580,17 @@ d = { 'settings': { 'branch': 'main',
                                                                                                   'airt/_docstring/helpers.py')},
             'airt._testing.activate_by_import': { 'airt._testing.activate_by_import.activated': ( 'activatetestingenvironment.html#activated',
                                                                                                   'airt/_testing/activate_by_import.py')},
+            'airt._testing.stub_server': { 'airt._testing.stub_server.StubHandler': ( 'stubserver.html#stubhandler',
+                                                                                      'airt/_testing/stub_server.py'),
+                                           'airt._testing.stub_server.StubHandler.handle_one_request': ( 'stubserver.html#stubhandler.handle_one_request',
+                                                                                                         'airt/_testing/stub_server.py'),
+                                           'airt._testing.stub_server.StubHandler.log_message': ( 'stubserver.html#stubhandler.log_message',
+                                                                                                  'airt/_testing/stub_server.py'),
+                                           'airt._testing.stub_server.StubHandler.parse_request': ( 'stubserver.html#stubhandler.parse_request',
+                                                                                                    'airt/_testing/stub_server.py'),
+                                           'airt._testing.stub_server.StubHandler.send_json': ( 'stubserver.html#stubhandler.send_json',
+                                                                                                'airt/_testing/stub_server.py'),
+                                           'airt._testing.stub_server.stub_server': ( 'stubserver.html#stub_server',
+                                                                                      'airt/_testing/stub_server.py')},
+            'airt.aio': {},
             'airt.client': {}}}
@@ -5,9 +5,12 @@ __all__ = ['old_log', 'old_publish_display_data', 'sanitize_secrets', 'new_publi
 
 # %% ../notebooks/Sanitize_Secrets.ipynb 2
 import builtins
+import hashlib
 import logging
 import re
 import sys
+import threading
+from collections import OrderedDict
 from logging import Logger
 from typing import *
 
@@ -17,9 +20,15 @@ from fastcore.utils import patch
 from ._logger import get_logger
 
 # %% ../notebooks/Sanitize_Secrets.ipynb 9
-def sanitize_secrets(s: str) -> str:
+def _get_secret_patterns() -> List[Tuple[str, str]]:
+    """Return the patterns of the secrets and their replacements in the order in which they are applied
+
+    Returns:
+        A list of tuples of the patterns and their replacements, including the variants of the patterns with double
+        quotes, lower case keys and keys assigned with "=".
+    """
     d = {
-        "(A3T[A-Z0-9]|AKIA|AGPA|AIDA|AROA|AIPA|ANPA|ANVA|ASIA)\w+": "*" * 20,
+        "(?:A3T[A-Z0-9]|AKIA|AGPA|AIDA|AROA|AIPA|ANPA|ANVA|ASIA)\w+": "*" * 20,
         "AWS_ACCESS_KEY_ID':\s*'.*?'": "AWS_ACCESS_KEY_ID': " + f"'{'*' * 20}'",
         "AWSAccessKeyId':\s*'.*?'": "AWSAccessKeyId': " + f"'{'*' * 20}'",
         "KEY':\s*'.*?'": "KEY': " + f"'{'*' * 40}'",
@@ -52,26 +61,216 @@ def sanitize_secrets(s: str) -> str:
 
     d = {k.replace("'", "\\\\?'"): v for k, v in d.items()}
 
+    return list(d.items())
+
+
+def _compile_patterns(
+    patterns: List[Tuple[str, str]], required: Optional[str] = None
+) -> Callable[[str], str]:
+    """Compile the patterns into a function substituting all of them in a single pass over a string
+
+    Args:
+        patterns: A list of tuples of the patterns and their replacements. If more than one pattern is passed, all of
+            them must start with a literal character.
+        required: A substring which all the matches of the patterns contain. If passed, the strings without it are
+            returned without being scanned.
+
+    Returns:
+        A function substituting the matches of the patterns in a string with their replacements.
+    """
+    replacements: Dict[Optional[str], str]
+    if len(patterns) == 1:
+        alternation = re.compile(patterns[0][0])
+        replacements = {None: patterns[0][1]}
+    else:
+        # the groups naming the alternatives start after their first characters, so the regex engine can still
+        # search for the first characters of the alternation quickly instead of trying all of them at every position
+        alternation = re.compile(
+            "|".join(f"{p[0]}(?P<_{i}>{p[1:]})" for i, (p, _) in enumerate(patterns))
+        )
+        replacements = {f"_{i}": r for i, (_, r) in enumerate(patterns)}
+
+    def substitute(s: str) -> str:
+        if required is not None and required not in s:
+            return s
+        return alternation.sub(lambda match: replacements[match.lastgroup], s)
+
+    return substitute
+
+
+def _compile_passes(patterns: List[Tuple[str, str]]) -> List[Callable[[str], str]]:
+    """Compile the patterns into the passes substituting them in a few scans of a string
+
+    The consecutive patterns are substituted together in a single pass. The patterns of the AWS access key IDs, of
+    the credentials in the URLs and of the tokens with "~" may overlap with the other secrets, so each of them is
+    substituted in a separate pass, keeping its place in the order. The patterns of the tokens with "~" start with a
+    character class, which makes them slow to search for, so their passes scan only the strings containing "~".
+
+    Args:
+        patterns: A list of tuples of the patterns and their replacements in the order in which they are applied.
+
+    Returns:
+        A list of functions substituting the patterns in a string, in the order in which they should be called.
+    """
+    passes = []
+    consecutive: List[Tuple[str, str]] = []
+    for pattern, replacement in patterns:
+        if pattern.startswith(("(?:", "://")) or "~" in pattern:
+            if consecutive:
+                passes.append(_compile_patterns(consecutive))
+            passes.append(
+                _compile_patterns(
+                    [(pattern, replacement)], required="~" if "~" in pattern else None
+                )
+            )
+            consecutive = []
+        else:
+            consecutive.append((pattern, replacement))
+
+    if consecutive:
+        passes.append(_compile_patterns(consecutive))
+
+    return passes
+
+
+_sanitize_passes = _compile_passes(_get_secret_patterns())
+
+# %% ../notebooks/Sanitize_Secrets.ipynb 10
+def sanitize_secrets(s: str) -> str:
     if not isinstance(s, str):
         s = s.__repr__()
 
-    for pattern, replacement in d.items():
-        s = re.sub(pattern, replacement, s)
+    for substitute in _sanitize_passes:
+        s = substitute(s)
 
     return s
 
-# %% ../notebooks/Sanitize_Secrets.ipynb 17
+# %% ../notebooks/Sanitize_Secrets.ipynb 19
 old_log = Logger._log
 
-# %% ../notebooks/Sanitize_Secrets.ipynb 18
+# %% ../notebooks/Sanitize_Secrets.ipynb 20
 @patch
 def _log(self: Logger, level, msg, *args, **kwargs):
     return old_log(self, level, sanitize_secrets(msg), *args, **kwargs)
 
-# %% ../notebooks/Sanitize_Secrets.ipynb 23
+# %% ../notebooks/Sanitize_Secrets.ipynb 25
 old_publish_display_data = IPython.core.display_functions.publish_display_data
 
-# %% ../notebooks/Sanitize_Secrets.ipynb 24
+# %% ../notebooks/Sanitize_Secrets.ipynb 26
+_display_chunk_size = 256 * 1024
+_display_split_window = 4 * 1024
+_display_cache_max_size = 32 * 1024 * 1024
+_display_cache_size = 0
+_display_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_display_cache_lock = threading.Lock()
+
+
+def _find_split(s: str, start: int, end: int) -> int:
+    """Find the last position in the range where the string can be split without splitting a secret
+
+    None of the patterns matches across a line break, except for the whitespace after the keys and after the ":" or
+    "=" following them. So the string can be split after a line break which is surrounded by non-whitespace
+    characters, unless it follows a key, a ":" or a "=".
+
+    Args:
+        s: The string to split.
+        start: The start of the range.
+        end: The end of the range.
+
+    Returns:
+        The position after the line break, or -1 if the string can't be split in the range.
+    """
+    position = s.rfind("\n", start, end)
+    while position > 0:
+        before, after = s[position - 1], s[position + 1 : position + 2]
+        if (
+            not before.isspace()
+            and before not in ":="
+            and not s.endswith(("KEY", "key"), 0, position)
+            and after
+            and not after.isspace()
+        ):
+            return position + 1
+        position = s.rfind("\n", start, position)
+    return -1
+
+
+def _sanitize_in_chunks(s: str, chunk_size: int, split_window: int) -> str:
+    """Sanitize a large string chunk by chunk
+
+    The chunks are split at the line breaks where no secret can be split, searched for within **split_window**
+    characters around every **chunk_size** characters. Every chunk is scanned only for the patterns which can match in
+    it, and the intermediate copies made while substituting the patterns are bounded by the size of a chunk.
+
+    Args:
+        s: The string to sanitize.
+        chunk_size: The approximate size of the chunks.
+        split_window: The size of the range around the end of every chunk in which the line break to split at is searched for.
+
+    Returns:
+        The sanitized string.
+    """
+    chunks = []
+    start = 0
+    while len(s) - start > chunk_size:
+        end = start + chunk_size
+        split = _find_split(s, end - split_window, end + split_window)
+        while split <= start and end + split_window < len(s):
+            end += split_window
+            split = _find_split(s, end, end + split_window)
+        if split <= start:
+            break
+        chunks.append(sanitize_secrets(s[start:split]))
+        start = split
+    chunks.append(sanitize_secrets(s[start:]))
+    return "".join(chunks)
+
+
+def _sanitize_display_data(mimetype: str, value: Any) -> Any:
+    """Sanitize the value of a mimetype of the displayed data
+
+    The images can't contain any secrets in their text, so they are returned as they are. The values larger than a
+    chunk are sanitized in chunks and the results are cached, so displaying the same large value again doesn't
+    sanitize it again.
+
+    Args:
+        mimetype: The mimetype of the value.
+        value: The value to sanitize.
+
+    Returns:
+        The sanitized value.
+    """
+    if mimetype.startswith("image/") and mimetype != "image/svg+xml":
+        return value
+
+    s = value.__repr__() if not isinstance(value, str) else value
+    if len(s) <= _display_chunk_size:
+        return sanitize_secrets(s)
+
+    global _display_cache_size
+
+    # the values are cached by their digest so the cache doesn't keep the unsanitized values alive, and the cache
+    # is bounded by the total size of the sanitized values kept in it
+    key = hashlib.blake2b(s.encode("utf-8", errors="surrogatepass")).digest()
+    with _display_cache_lock:
+        sanitized = _display_cache.get(key)
+        if sanitized is not None:
+            _display_cache.move_to_end(key)
+            return sanitized
+
+    sanitized = _sanitize_in_chunks(s, _display_chunk_size, _display_split_window)
+
+    if len(sanitized) <= _display_cache_max_size:
+        with _display_cache_lock:
+            if key not in _display_cache:
+                _display_cache[key] = sanitized
+                _display_cache_size += len(sanitized)
+            while _display_cache_size > _display_cache_max_size:
+                _display_cache_size -= len(_display_cache.popitem(last=False)[1])
+
+    return sanitized
+
+# %% ../notebooks/Sanitize_Secrets.ipynb 27
 def new_publish_display_data(
     data,
     metadata=None,
@@ -80,10 +279,7 @@ def new_publish_display_data(
     transient=None,
     **kwargs,
 ):
-    sanitized_data = {
-        k: sanitize_secrets(v.__repr__() if not isinstance(v, str) else v)
-        for k, v in data.items()
-    }
+    sanitized_data = {k: _sanitize_display_data(k, v) for k, v in data.items()}
     return old_publish_display_data(
         sanitized_data, metadata=metadata, source=source, transient=transient, **kwargs
     )
@@ -91,10 +287,10 @@ def new_publish_display_data(
 
 IPython.core.display_functions.publish_display_data = new_publish_display_data
 
-# %% ../notebooks/Sanitize_Secrets.ipynb 27
+# %% ../notebooks/Sanitize_Secrets.ipynb 31
 old_print = builtins.print
 
-# %% ../notebooks/Sanitize_Secrets.ipynb 28
+# %% ../notebooks/Sanitize_Secrets.ipynb 32
 def sanitized_print(*objects, sep=" ", end="\n", file=sys.stdout, flush=False):
     new_objs = [
         sanitize_secrets(obj.__repr__() if not isinstance(obj, str) else obj)
@@ -0,0 +1,94 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../notebooks/StubServer.ipynb.
+
+# %% auto 0
+__all__ = ['StubHandler', 'stub_server']
+
+# %% ../../notebooks/StubServer.ipynb 2
+import json
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import *
+
+from airt._components.client import Client
+
+# %% ../../notebooks/StubServer.ipynb 4
+class StubHandler(BaseHTTPRequestHandler):
+    """A base class for the request handlers of the local servers standing in for the airt service in the tests.
+
+    The connections are kept alive and the requests handled at the same time are counted in `in_flight`, with the
+    largest number of them since the server was started kept in `max_in_flight`. The subclasses implement the `do_*`
+    methods for the routes they mimic and keep their own state in class attributes.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def parse_request(self) -> bool:
+        # the request is counted once its request line is read, so the idle keep-alive connections are not counted
+        self._counted = super().parse_request()
+        if self._counted:
+            with StubHandler.lock:
+                handler = type(self)
+                handler.in_flight += 1
+                handler.max_in_flight = max(handler.max_in_flight, handler.in_flight)
+        return self._counted
+
+    def handle_one_request(self):
+        self._counted = False
+        try:
+            super().handle_one_request()
+        finally:
+            if self._counted:
+                with StubHandler.lock:
+                    type(self).in_flight -= 1
+
+    def send_json(self, status: int, body: Any):
+        """Send the body encoded as JSON along with the status code.
+
+        Args:
+            status: The status code of the response.
+            body: The body of the response.
+        """
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+# %% ../../notebooks/StubServer.ipynb 5
+@contextmanager
+def stub_server(handler: Type[StubHandler], set_token: bool = True) -> Iterator[str]:
+    """A context manager running a local server with the request handler in a background thread.
+
+    Args:
+        handler: The request handler class. Its counters of the requests in flight are reset.
+        set_token: If set to **True**, the `Client` sends the requests to the local server with a fake token inside
+            the context. The server and the token of the `Client` are restored on exit in any case.
+
+    Returns:
+        A context manager yielding the URL of the local server.
+    """
+    handler.in_flight = 0
+    handler.max_in_flight = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}"
+
+    _server, _auth_token = Client.server, Client.auth_token
+    if set_token:
+        Client.set_token(token="fake-token", server=url)
+    try:
+        yield url
+    finally:
+        Client.server, Client.auth_token = _server, _auth_token
+        Client.close_session()
+        httpd.shutdown()
+        httpd.server_close()
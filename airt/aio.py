@@ -0,0 +1,29 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/Aio.ipynb.
+
+# %% auto 0
+__all__ = ['AsyncClient', 'DataSource', 'DataBlob', 'ProgressStatus', 'Model', 'Prediction']
+
+# %% ../notebooks/Aio.ipynb 2
+from ._components.aio import AsyncClient as _AsyncClient
+from ._components.aio import DataBlob as _DataBlob
+from ._components.aio import DataSource as _DataSource
+from ._components.aio import Model as _Model
+from ._components.aio import Prediction as _Prediction
+from ._components.aio import ProgressStatus as _ProgressStatus
+
+AsyncClient = _AsyncClient
+DataSource = _DataSource
+DataBlob = _DataBlob
+ProgressStatus = _ProgressStatus
+Model = _Model
+Prediction = _Prediction
+
+for cls in [
+    AsyncClient,
+    DataSource,
+    DataBlob,
+    ProgressStatus,
+    Model,
+    Prediction,
+]:
+    cls.__module__ = "airt.aio"
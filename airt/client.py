@@ -1,7 +1,8 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/Client.ipynb.
 
 # %% auto 0
-__all__ = ['Client', 'DataSource', 'DataBlob', 'ProgressStatus', 'Model', 'Prediction', 'User', 'APIKey']
+__all__ = ['Client', 'DataSource', 'DataBlob', 'ProgressStatus', 'Model', 'Prediction', 'User', 'APIKey', 'PollingStrategy',
+           'FixedPolling', 'ExponentialBackoffPolling', 'ETAPolling']
 
 # %% ../notebooks/Client.ipynb 2
 from ._components.api_key import APIKey as _APIKey
@@ -10,7 +11,13 @@ from ._components.datablob import DataBlob as _DataBlob
 from ._components.datasource import DataSource as _DataSource
 from ._components.model import Model as _Model
 from ._components.prediction import Prediction as _Prediction
-from ._components.progress_status import ProgressStatus as _ProgressStatus
+from ._components.progress_status import (
+    ETAPolling as _ETAPolling,
+    ExponentialBackoffPolling as _ExponentialBackoffPolling,
+    FixedPolling as _FixedPolling,
+    PollingStrategy as _PollingStrategy,
+    ProgressStatus as _ProgressStatus,
+)
 from ._components.user import User as _User
 
 Client = _Client
@@ -21,6 +28,10 @@ Model = _Model
 Prediction = _Prediction
 User = _User
 APIKey = _APIKey
+PollingStrategy = _PollingStrategy
+FixedPolling = _FixedPolling
+ExponentialBackoffPolling = _ExponentialBackoffPolling
+ETAPolling = _ETAPolling
 
 for cls in [
     Client,
@@ -31,5 +42,9 @@ for cls in [
     Prediction,
     User,
     APIKey,
+    PollingStrategy,
+    FixedPolling,
+    ExponentialBackoffPolling,
+    ETAPolling,
 ]:
     cls.__module__ = "airt.client"